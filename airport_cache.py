@@ -0,0 +1,148 @@
+"""
+Airport Resolution Cache
+Maps (city, airport code, locale) to the exact option text and the form
+values the airport widget ends up with after a selection, so repeat
+searches can set the field directly instead of typing and scanning the
+autocomplete dropdown.
+
+- Pre-warmed from the bundled IATA list (fixtures/iata_airports.csv); those
+  entries are unverified reference data (a city's codes and names) and are
+  never applied to the form, nor used to pick an airport for a city
+- An entry becomes verified once HomePage captures the form values after a
+  real autocomplete selection
+- Verified entries expire after ttl_days, and are dropped as soon as
+  setting them directly fails to stick
+
+In memory unless a filepath is given; save() writes pending changes once
+(through a temp file and os.replace). Parallel workers should each use
+their own file.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import csv
+import json
+import logging
+import os
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+IATA_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "iata_airports.csv")
+
+
+def load_iata_list(filepath: str = IATA_CSV) -> List[Dict]:
+    """Rows of the bundled IATA list: code, city, name, country."""
+    with open(filepath, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+class AirportCache:
+    """
+    File-backed airport resolution cache.
+
+    Example:
+        cache = AirportCache("airport_cache.json")
+        entry = cache.lookup("Berlin", "BER", "us/en")
+        ...
+        cache.save()
+    """
+
+    def __init__(self, filepath: Optional[str] = None, ttl_days: float = 30,
+                 iata_csv: Optional[str] = IATA_CSV):
+        self.filepath = filepath
+        self.ttl = timedelta(days=ttl_days)
+        self.entries: Dict[str, Dict] = self._load()
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        if iata_csv and not self.entries:
+            self.prewarm(iata_csv)
+
+    @staticmethod
+    def _key(city: str, code: Optional[str], locale: str) -> str:
+        return f"{locale}|{city.strip().lower()}|{(code or '').upper()}"
+
+    def _load(self) -> Dict:
+        if not self.filepath or not os.path.exists(self.filepath):
+            return {}
+        try:
+            with open(self.filepath) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            logger.warning(f"  ⚠ Unreadable airport cache {self.filepath}, starting fresh")
+            return {}
+
+    def save(self) -> None:
+        """Write pending changes to filepath, if the cache has one."""
+        if not self.filepath or not self.dirty:
+            return
+        fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(os.path.abspath(self.filepath)))
+        with os.fdopen(fd, "w") as f:
+            json.dump(self.entries, f, indent=2)
+        os.replace(temp_path, self.filepath)
+        self.dirty = False
+
+    def prewarm(self, filepath: str = IATA_CSV, locale: str = "*") -> int:
+        """
+        Seed unverified entries from the IATA list. Existing entries are kept.
+
+        Returns:
+            Number of entries added
+        """
+        added = 0
+        for row in load_iata_list(filepath):
+            for code in (row["code"], None):
+                key = self._key(row["city"], code, locale)
+                if key in self.entries:
+                    continue
+                self.entries[key] = {
+                    "code": row["code"],
+                    "option_text": f"{row['city']}, {row['name']} ({row['code']})",
+                    "form_value": None,
+                    "verified": False,
+                    "updated_at": datetime.now().isoformat(),
+                }
+                added += 1
+        self.dirty = self.dirty or added > 0
+        logger.info(f"  Airport cache pre-warmed with {added} entries")
+        return added
+
+    def lookup(self, city: str, code: Optional[str], locale: str) -> Optional[Dict]:
+        """
+        Best entry for the query: verified for this locale first, then the
+        locale-independent IATA entry. Stale verified entries are ignored.
+        """
+        for key in (self._key(city, code, locale), self._key(city, code, "*")):
+            entry = self.entries.get(key)
+            if not entry:
+                continue
+            if entry["verified"] and \
+                    datetime.now() - datetime.fromisoformat(entry["updated_at"]) > self.ttl:
+                continue
+            if entry["verified"]:
+                self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def store(self, city: str, code: Optional[str], locale: str,
+              option_text: str, form_value: Dict[str, str]) -> None:
+        """Record the values a real autocomplete selection produced."""
+        self.entries[self._key(city, code, locale)] = {
+            "code": code,
+            "option_text": option_text,
+            "form_value": form_value,
+            "verified": True,
+            "updated_at": datetime.now().isoformat(),
+        }
+        self.dirty = True
+
+    def invalidate(self, city: str, code: Optional[str], locale: str) -> None:
+        """Drop a verified entry that no longer sticks when applied."""
+        if self.entries.pop(self._key(city, code, locale), None) is not None:
+            self.dirty = True
+
+    def get_stats(self) -> Dict:
+        verified = sum(1 for e in self.entries.values() if e["verified"])
+        return {"entries": len(self.entries), "verified": verified,
+                "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,349 @@
+"""
+Async Home Page Object Model
+asyncio variant of HomePage built on playwright.async_api.
+
+Same fluent flow (open → select_trip_type → enter_origin → enter_destination
+→ select_dates → click_search → wait_for_results), but every action is a
+coroutine, so one process can drive many searches at once on a single event
+loop. run_searches() fans a list of route/date queries out over isolated
+contexts of one browser, bounded by a concurrency semaphore.
+"""
+from playwright.async_api import Browser, Page, async_playwright
+from typing import Dict, List, Optional
+from calendar_navigation import async_navigate_to_month
+from home_page import HomePage
+from waits import AsyncReadinessWaiter
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncHomePage:
+    """
+    Async Page Object for Lufthansa Home/Search Page.
+    Locators are shared with HomePage so both variants stay in sync.
+    """
+
+    # ==================== LOCATORS ====================
+
+    ROUND_TRIP_RADIO = HomePage.ROUND_TRIP_RADIO
+    ONE_WAY_RADIO = HomePage.ONE_WAY_RADIO
+    ORIGIN_INPUT = HomePage.ORIGIN_INPUT
+    DESTINATION_INPUT = HomePage.DESTINATION_INPUT
+    DROPDOWN_OPTION = HomePage.DROPDOWN_OPTION
+    DATE_INPUT = HomePage.DATE_INPUT
+    CALENDAR_CONTAINER = HomePage.CALENDAR_CONTAINER
+    MONTH_HEADER = HomePage.MONTH_HEADER
+    NEXT_MONTH_BUTTON = HomePage.NEXT_MONTH_BUTTON
+    PREV_MONTH_BUTTON = HomePage.PREV_MONTH_BUTTON
+    CALENDAR_DAY_BUTTON = HomePage.CALENDAR_DAY_BUTTON
+    SEARCH_BUTTON = HomePage.SEARCH_BUTTON
+    RESULT_SELECTORS = HomePage.RESULT_SELECTORS
+    RESULT_SIGNALS = HomePage.RESULT_SIGNALS
+    MONTH_NAMES = HomePage.MONTH_NAMES
+
+    def __init__(self, page: Page, url: str = "https://www.lufthansa.com/us/en/flight-search"):
+        self.page = page
+        self.url = url
+        self.waits = AsyncReadinessWaiter(page)
+        self.results_signal: Optional[str] = None
+
+    # ==================== PAGE ACTIONS ====================
+
+    async def open(self) -> 'AsyncHomePage':
+        """Navigate to the search page and handle initial overlays."""
+        logger.info("Opening Lufthansa home page...")
+        await self.page.goto(self.url, wait_until="domcontentloaded")
+        await self.waits.element_visible(self.ORIGIN_INPUT, timeout=15000)
+        await self.waits.network_idle(timeout=6000)
+        await self.remove_overlays()
+        return self
+
+    async def remove_overlays(self) -> 'AsyncHomePage':
+        """Accept consent and remove the consent/feedback overlays in one evaluate."""
+        await self.page.evaluate("""
+            () => {
+                document.querySelectorAll('button').forEach(btn => {
+                    const text = btn.textContent.toLowerCase();
+                    if (text.includes('agree') || text.includes('accept')) {
+                        try { btn.click(); } catch(e) {}
+                    }
+                });
+                ['consentOverlay', '__tealiumGDPRcpPrefs'].forEach(id => {
+                    const el = document.getElementById(id);
+                    if (el) el.remove();
+                });
+                document.querySelectorAll('a[aria-label*="Close feedback"]').forEach(el => {
+                    try { el.click(); } catch(e) {}
+                });
+            }
+        """)
+        return self
+
+    async def select_trip_type(self, trip_type: str = "round_trip") -> 'AsyncHomePage':
+        """Select trip type (round_trip or one_way)."""
+        logger.info(f"Selecting trip type: {trip_type}")
+
+        if trip_type.lower() == "round_trip":
+            selector = self.ROUND_TRIP_RADIO
+        elif trip_type.lower() == "one_way":
+            selector = self.ONE_WAY_RADIO
+        else:
+            raise ValueError(f"Invalid trip type: {trip_type}")
+
+        await self.page.evaluate("""
+            (selector) => {
+                const radio = document.querySelector(selector);
+                if (radio && !radio.checked) radio.click();
+            }
+        """, selector)
+        await self.waits.dom_condition(
+            "(selector) => { const r = document.querySelector(selector); return !r || r.checked; }",
+            arg=selector, timeout=500, description="trip type checked")
+        return self
+
+    async def _enter_airport(self, input_selector: str, city: str,
+                             airport_code: Optional[str]) -> None:
+        """Clear an airport field, type the city and pick the matching option."""
+        field = self.page.locator(input_selector).first
+        await field.click(force=True)
+        await field.fill("")
+        await field.press_sequentially(city, delay=100)
+
+        await self.waits.listbox_visible(self.DROPDOWN_OPTION, airport_code, timeout=2500)
+
+        selected = False
+        if airport_code:
+            for selector in [f"{self.DROPDOWN_OPTION}:has-text('{airport_code}')",
+                             f"{self.DROPDOWN_OPTION}:has-text('{city}')"]:
+                try:
+                    await self.page.locator(selector).first.click(force=True, timeout=3000)
+                    selected = True
+                    break
+                except Exception:
+                    continue
+        if not selected:
+            await self.page.keyboard.press("Enter")
+
+        await self.waits.listbox_hidden(self.DROPDOWN_OPTION, timeout=1000)
+
+    async def enter_origin(self, city: str, airport_code: Optional[str] = None) -> 'AsyncHomePage':
+        """Enter origin city and select airport."""
+        logger.info(f"Entering origin: {city}")
+        await self._enter_airport(self.ORIGIN_INPUT, city, airport_code)
+        return self
+
+    async def enter_destination(self, city: str, airport_code: Optional[str] = None) -> 'AsyncHomePage':
+        """Enter destination city and select airport."""
+        logger.info(f"Entering destination: {city}")
+        await self._enter_airport(self.DESTINATION_INPUT, city, airport_code)
+        return self
+
+    async def select_dates(self, departure_date: str, return_date: Optional[str] = None) -> 'AsyncHomePage':
+        """
+        Select travel dates from the calendar, falling back to JS injection.
+
+        Args:
+            departure_date: Departure date in MM/DD/YYYY format
+            return_date: Optional return date in MM/DD/YYYY format
+        """
+        logger.info(f"Selecting dates: {departure_date} - {return_date}")
+
+        try:
+            await self.page.locator(self.DATE_INPUT).first.click(force=True, timeout=5000)
+            await self.waits.element_visible(self.CALENDAR_CONTAINER, timeout=3000)
+            await self._select_date_from_calendar(departure_date)
+            if return_date:
+                await self._select_date_from_calendar(return_date)
+        except Exception as e:
+            logger.warning(f"  ⚠ Calendar selection failed: {e}")
+            await self._inject_dates_via_js(departure_date, return_date)
+
+        return self
+
+    async def _inject_dates_via_js(self, departure_date: str, return_date: Optional[str] = None) -> None:
+        """Fallback: set the date inputs directly and fire input/change events."""
+        previous = await self.waits.input_values(self.DATE_INPUT)
+        await self.page.evaluate("""
+            ([selector, dates]) => {
+                const inputs = document.querySelectorAll(selector);
+                dates.forEach((value, i) => {
+                    if (!value || !inputs[i]) return;
+                    inputs[i].value = value;
+                    inputs[i].dispatchEvent(new Event('input', { bubbles: true }));
+                    inputs[i].dispatchEvent(new Event('change', { bubbles: true }));
+                });
+            }
+        """, [self.DATE_INPUT, [departure_date, return_date or ""]])
+        await self.waits.value_changed(self.DATE_INPUT, previous, timeout=2000)
+
+    async def _select_date_from_calendar(self, date: str) -> None:
+        month, day, year = date.split('/')
+        month_name = self.MONTH_NAMES[int(month) - 1]
+        await self._navigate_to_month(month_name, year)
+        await self._click_calendar_day(str(int(day)), month_name, year)
+
+    async def _navigate_to_month(self, month_name: str, year: str, max_attempts: int = 12) -> None:
+        """Jump the calendar to the correct month and year in one batch"""
+        await async_navigate_to_month(self.page, month_name, year, self.MONTH_HEADER,
+                                      self.NEXT_MONTH_BUTTON, self.PREV_MONTH_BUTTON, max_attempts)
+
+    async def _click_calendar_day(self, day: str, month_name: str, year: str) -> None:
+        month_number = self.MONTH_NAMES.index(month_name) + 1
+        # Same strategies as HomePage._click_calendar_day
+        strategies = [
+            f"button[aria-label*='{month_name} {day}, {year}']",
+            f"button[aria-label*='{day} {month_name} {year}']",
+            f"button:text-is('{day}')",
+            f"td[data-date='{year}-{month_number:02d}-{int(day):02d}'] button",
+        ]
+
+        for selector in strategies:
+            try:
+                for button in await self.page.locator(selector).all():
+                    try:
+                        await button.wait_for(state="visible", timeout=1000)
+                    except Exception:
+                        continue
+                    previous = await self.waits.input_values(self.DATE_INPUT)
+                    await button.click(force=True)
+                    if await self.waits.value_changed(self.DATE_INPUT, previous, timeout=2000):
+                        return
+            except Exception:
+                continue
+
+        raise RuntimeError(f"Could not find day {day} {month_name} {year}")
+
+    async def click_search(self) -> 'AsyncHomePage':
+        """Click the search button, falling back to a JS click."""
+        logger.info("Clicking search button...")
+        await self.waits.mark_existing(self.RESULT_SIGNALS)
+        try:
+            await self.page.locator(self.SEARCH_BUTTON).first.click(force=True, timeout=5000)
+        except Exception:
+            await self.page.evaluate("""
+                () => {
+                    const btn = Array.from(document.querySelectorAll('button'))
+                        .find(b => b.textContent.includes('Search flights'));
+                    if (btn) btn.click();
+                }
+            """)
+        return self
+
+    async def wait_for_results(self, timeout: int = 20000) -> 'AsyncHomePage':
+        """Race results, no-results and error outcomes; see HomePage.wait_for_results."""
+        self.results_signal = await self.waits.first_signal(self.RESULT_SIGNALS, timeout=timeout)
+        if self.results_signal is None:
+            logger.warning("  ⚠ Results detection timeout")
+        elif self.results_signal.startswith("results"):
+            logger.info(f"  ✓ Results page loaded ({self.results_signal})")
+        else:
+            logger.warning(f"  ⚠ Search ended with {self.results_signal}")
+        return self
+
+    # ==================== COMPLETE SEARCH FLOW ====================
+
+    async def search_flight(self, origin_city: str, destination_city: str,
+                            departure_date: str, return_date: Optional[str] = None,
+                            origin_airport: Optional[str] = None,
+                            destination_airport: Optional[str] = None,
+                            trip_type: str = "round_trip") -> 'AsyncHomePage':
+        """
+        Complete flight search flow in one coroutine.
+        Takes the same arguments as HomePage.search_flight.
+        """
+        logger.info(f"Search: {origin_city} → {destination_city} ({departure_date} - {return_date})")
+
+        await self.select_trip_type(trip_type)
+        await self.enter_origin(origin_city, origin_airport)
+        await self.enter_destination(destination_city, destination_airport)
+        await self.select_dates(departure_date, return_date)
+        await self.click_search()
+        await self.wait_for_results()
+
+        return self
+
+
+# ==================== CONCURRENT SEARCHES ====================
+
+async def _search(page: Page, query: Dict, url: str, start: float) -> Dict:
+    try:
+        home_page = AsyncHomePage(page, url)
+        await home_page.open()
+        await home_page.search_flight(**query)
+        signal = home_page.results_signal
+        # Only rendered results pass; a timeout or a no-results/error banner fails
+        loaded = bool(signal) and signal.startswith("results")
+        return {"query": query, "status": int(loaded),
+                "error_message": "" if loaded else f"Search ended with {signal or 'timeout'}",
+                "duration_ms": (time.time() - start) * 1000, "signal": signal}
+    except Exception as e:
+        logger.warning(f"  ⚠ Search failed for {query}: {e}")
+        return {"query": query, "status": 0, "error_message": str(e),
+                "duration_ms": (time.time() - start) * 1000}
+
+
+async def _run_one(browser: Optional[Browser], pool, semaphore: asyncio.Semaphore,
+                   query: Dict, url: str, context_options: Dict) -> Dict:
+    """Run a single query in its own context once the semaphore admits it."""
+    async with semaphore:
+        start = time.time()
+        if pool is not None:
+            async with pool.lease() as lease:
+                return await _search(lease.page, query, url, start)
+
+        context = await browser.new_context(**context_options)
+        try:
+            return await _search(await context.new_page(), query, url, start)
+        finally:
+            await context.close()
+
+
+async def run_searches(queries: List[Dict], max_concurrency: int = 8,
+                       browser: Optional[Browser] = None, headless: bool = True,
+                       url: str = "https://www.lufthansa.com/us/en/flight-search",
+                       context_options: Optional[Dict] = None,
+                       pool=None) -> List[Dict]:
+    """
+    Run many searches concurrently across contexts of one browser.
+
+    Args:
+        queries: List of keyword dicts for AsyncHomePage.search_flight
+        max_concurrency: Maximum number of searches in flight at once
+        browser: Existing async browser to use; one is launched if omitted
+        headless: Headless flag for the launched browser
+        url: Search page URL
+        context_options: Extra keyword arguments for browser.new_context
+        pool: Optional AsyncBrowserPool to lease pages from instead of browser
+
+    Returns:
+        One result dict per query, in query order, with status,
+        error_message and duration_ms (same fields as TestLogger steps).
+        status is 1 only when results rendered (signal "results:..."); a
+        timeout, no-results or error banner counts as a failure
+
+    Example:
+        results = asyncio.run(run_searches([
+            {"origin_city": "New York", "destination_city": "Berlin",
+             "departure_date": "12/15/2025", "return_date": "12/25/2025",
+             "origin_airport": "JFK", "destination_airport": "BER"},
+        ], max_concurrency=12))
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    context_options = context_options or {}
+
+    if browser is not None or pool is not None:
+        return await asyncio.gather(*[
+            _run_one(browser, pool, semaphore, query, url, context_options) for query in queries
+        ])
+
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=headless)
+        try:
+            return await asyncio.gather(*[
+                _run_one(browser, None, semaphore, query, url, context_options) for query in queries
+            ])
+        finally:
+            await browser.close()
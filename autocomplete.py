@@ -0,0 +1,80 @@
+"""
+Autocomplete Input
+Fast entry for suggestion-backed inputs such as the origin/destination
+airport fields.
+
+Instead of typing at 100 ms per key and sleeping for the dropdown, the
+field is filled in one step (which also clears it), the last character is
+sent as a real keystroke so key-driven widgets fire their suggestion
+request, and the call returns as soon as the wanted option is visible.
+Character-by-character typing is kept only as an automatic fallback for
+widgets that ignore programmatic input.
+"""
+from typing import Optional
+from tracing import set_attribute, traced
+from waits import ReadinessWaiter
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AutocompleteInput:
+    """
+    Suggestion-aware text input.
+
+    Example:
+        origin = AutocompleteInput(page, "input[name*='originCode']")
+        if origin.type_and_wait("New York", match="JFK"):
+            page.locator("div[role='option']:has-text('JFK')").first.click()
+    """
+
+    def __init__(self, page, input_selector: str, option_selector: str = "div[role='option']",
+                 waits: Optional[ReadinessWaiter] = None):
+        self.page = page
+        self.input_selector = input_selector
+        self.option_selector = option_selector
+        self.waits = waits or ReadinessWaiter(page)
+        self.last_method: Optional[str] = None
+
+    @property
+    def field(self):
+        return self.page.locator(self.input_selector).first
+
+    @traced("autocomplete.type_and_wait", args=("text", "match"), record_result=True)
+    def type_and_wait(self, text: str, match: Optional[str] = None, timeout: int = 3000,
+                      fallback_delay: int = 100) -> bool:
+        """
+        Enter text and wait for a suggestion containing match (or any suggestion).
+
+        Args:
+            text: Text to enter, e.g. "New York"
+            match: Text the wanted option must contain, e.g. "JFK"
+            timeout: Ceiling for the suggestion to appear, per attempt
+            fallback_delay: Per-key delay for the typing fallback
+
+        Returns:
+            True if a matching option is visible; last_method records
+            whether "fill" or the "typed" fallback produced it
+        """
+        field = self.field
+        field.click(force=True)
+
+        # One-step fill, then a real keystroke for the last character
+        field.fill(text[:-1])
+        field.press_sequentially(text[-1:])
+        if self.waits.listbox_visible(self.option_selector, match, timeout=timeout):
+            self.last_method = "fill"
+            set_attribute("strategy", "fill")
+            return True
+
+        logger.info(f"  → No suggestions after fill, typing '{text}' key by key...")
+        field.fill("")
+        field.press_sequentially(text, delay=fallback_delay)
+        if self.waits.listbox_visible(self.option_selector, match, timeout=timeout):
+            self.last_method = "typed"
+            set_attribute("strategy", "typed")
+            return True
+
+        self.last_method = None
+        logger.warning(f"  ⚠ No suggestion matching '{match or text}'")
+        return False
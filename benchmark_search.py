@@ -0,0 +1,319 @@
+"""
+Search Benchmark
+Per-step latency benchmark for HomePage.search_flight against the offline
+fixture server.
+
+For N iterations it times open plus every search_flight step
+(select_trip_type, enter_origin, enter_destination, select_dates,
+click_search, wait_for_results) and reports p50/p95/p99 per step, total
+wall time and browser CPU time (renderer main-thread task time from CDP
+Performance.getMetrics). Percentiles cover the runs where a step succeeded;
+each step's failure count and rate are reported next to them. A search
+whose results never load counts as a wait_for_results failure.
+
+Results are saved as JSON; with --baseline the run is compared against a
+stored result and exits non-zero when any step's p95 regressed by more
+than --threshold or any step fails more often than in the baseline.
+
+With --reduced-motion the benchmark runs twice, animations on and then off
+(reduced_motion.py), and prints the per-step savings.
+
+Usage:
+    python benchmark_search.py --iterations 20 --output bench.json
+    python benchmark_search.py --iterations 20 --baseline bench.json --threshold 0.15
+    python benchmark_search.py --iterations 10 --reduced-motion
+"""
+from datetime import datetime
+from typing import Dict, List, Optional
+from tracing import Tracer
+import argparse
+import json
+import logging
+import math
+import os
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+STEPS = ["open", "select_trip_type", "enter_origin", "enter_destination",
+         "select_dates", "click_search", "wait_for_results"]
+
+DEFAULT_QUERY = {
+    "origin_city": "New York",
+    "destination_city": "Berlin",
+    "departure_date": "12/15/2025",
+    "return_date": "12/25/2025",
+    "origin_airport": "JFK",
+    "destination_airport": "BER",
+    "trip_type": "round_trip",
+}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples: List[float], failures: int = 0) -> Dict:
+    """Percentiles of the successful samples plus the failure count and rate."""
+    attempts = len(samples) + failures
+    return {
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+        "mean": sum(samples) / len(samples) if samples else 0.0,
+        "failures": failures,
+        "failure_rate": failures / attempts if attempts else 0.0,
+        "samples": samples,
+    }
+
+
+def _task_seconds(cdp) -> float:
+    metrics = cdp.send("Performance.getMetrics")["metrics"]
+    return next((m["value"] for m in metrics if m["name"] == "TaskDuration"), 0.0)
+
+
+def run_iteration(browser, url: str, query: Dict, context_options: Optional[Dict] = None,
+                  home_page_options: Optional[Dict] = None, reduced_motion: bool = False) -> Dict:
+    """
+    Run one timed search in a fresh context.
+    With reduced_motion the context runs with animations off and HomePage
+    skips its settle waits.
+
+    Returns:
+        {"steps": {step: ms}, "wall_ms": ..., "cpu_ms": ..., "status": 1|0,
+         "failed_step": step or None}. steps holds only the steps that
+        succeeded; the run stops at failed_step.
+    """
+    from home_page import HomePage
+
+    context_options = dict(context_options or {})
+    home_page_options = dict(home_page_options or {})
+    if reduced_motion:
+        import reduced_motion as motion
+        context_options = motion.context_options(**context_options)
+        home_page_options.setdefault("reduced_motion", True)
+    context = browser.new_context(**context_options)
+    if reduced_motion:
+        motion.install(context)
+    page = context.new_page()
+    cdp = context.new_cdp_session(page)
+    cdp.send("Performance.enable")
+    home_page = HomePage(page, url=url, **home_page_options)
+
+    actions = [
+        ("open", lambda: home_page.open()),
+        ("select_trip_type", lambda: home_page.select_trip_type(query["trip_type"])),
+        ("enter_origin", lambda: home_page.enter_origin(query["origin_city"], query["origin_airport"])),
+        ("enter_destination", lambda: home_page.enter_destination(query["destination_city"],
+                                                                  query["destination_airport"])),
+        ("select_dates", lambda: home_page.select_dates(query["departure_date"], query["return_date"])),
+        ("click_search", lambda: home_page.click_search()),
+        ("wait_for_results", lambda: home_page.wait_for_results()),
+    ]
+
+    steps: Dict[str, float] = {}
+    failed_step = None
+    cpu_start = _task_seconds(cdp)
+    wall_start = time.perf_counter()
+    for name, action in actions:
+        start = time.perf_counter()
+        try:
+            action()
+        except Exception as e:
+            logger.warning(f"  ⚠ Iteration failed at {name}: {e}")
+            failed_step = name
+            break
+        if name == "wait_for_results" and not home_page.results_loaded:
+            logger.warning(f"  ⚠ Iteration failed: search ended with {home_page.results_signal or 'timeout'}")
+            failed_step = name
+            break
+        steps[name] = (time.perf_counter() - start) * 1000
+    wall_ms = (time.perf_counter() - wall_start) * 1000
+    try:
+        cpu_ms = (_task_seconds(cdp) - cpu_start) * 1000
+    except Exception:
+        cpu_ms = 0.0
+    context.close()
+
+    return {"steps": steps, "wall_ms": wall_ms, "cpu_ms": cpu_ms,
+            "status": int(failed_step is None), "failed_step": failed_step}
+
+
+def run_benchmark(iterations: int = 10, headless: bool = True, query: Optional[Dict] = None,
+                  server_options: Optional[Dict] = None, context_options: Optional[Dict] = None,
+                  home_page_options: Optional[Dict] = None, label: str = "",
+                  trace_dir: Optional[str] = None, reduced_motion: bool = False) -> Dict:
+    """
+    Run the benchmark against a fresh fixture server.
+
+    Args:
+        iterations: Number of timed searches
+        headless: Browser headless flag
+        query: search_flight keyword arguments (DEFAULT_QUERY if omitted)
+        server_options: Keyword arguments for FixtureServer
+        context_options: Keyword arguments for browser.new_context
+        home_page_options: Extra keyword arguments for HomePage
+        label: Free-form name stored with the results
+        trace_dir: Write one Chrome trace-event JSON per iteration here
+        reduced_motion: Run with animations off (reduced_motion.py)
+
+    Returns:
+        Results dict, ready for save_results()/compare()
+    """
+    from fixture_server import FixtureServer
+    from playwright.sync_api import sync_playwright
+
+    query = dict(DEFAULT_QUERY, **(query or {}))
+    runs = []
+    with FixtureServer(**(server_options or {})) as server, sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=headless)
+        try:
+            for i in range(iterations):
+                options = dict(home_page_options or {})
+                if trace_dir:
+                    options["tracer"] = Tracer(f"search {i + 1}")
+                run = run_iteration(browser, server.search_url, query, context_options, options,
+                                    reduced_motion)
+                runs.append(run)
+                if trace_dir:
+                    os.makedirs(trace_dir, exist_ok=True)
+                    options["tracer"].export_chrome(os.path.join(trace_dir, f"search_{i + 1}.json"))
+                logger.info(f"  Iteration {i + 1}/{iterations}: {run['wall_ms']:.0f} ms "
+                            f"({'PASS' if run['status'] else 'FAIL'})")
+        finally:
+            browser.close()
+
+    return {
+        "label": label,
+        "reduced_motion": reduced_motion,
+        "timestamp": datetime.now().isoformat(),
+        "iterations": iterations,
+        "query": query,
+        "failures": sum(1 for r in runs if not r["status"]),
+        "steps": {step: summarize([r["steps"][step] for r in runs if step in r["steps"]],
+                                  sum(1 for r in runs if r["failed_step"] == step))
+                  for step in STEPS},
+        "wall_ms": summarize([r["wall_ms"] for r in runs]),
+        "cpu_ms": summarize([r["cpu_ms"] for r in runs]),
+    }
+
+
+def save_results(results: Dict, filepath: str) -> None:
+    with open(filepath, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(filepath: str) -> Dict:
+    with open(filepath) as f:
+        return json.load(f)
+
+
+def compare(results: Dict, baseline: Dict, threshold: float = 0.10,
+            stat: str = "p95") -> List[Dict]:
+    """
+    List steps (plus total wall time) whose stat regressed beyond threshold,
+    and steps that fail more often than in the baseline. A slower step and a
+    step that now fails are separate entries; failure entries carry
+    baseline_rate/current_rate instead of milliseconds.
+
+    Args:
+        threshold: Allowed fractional slowdown, e.g. 0.10 for +10%
+        stat: Which summary statistic to compare
+    """
+    current = dict(results["steps"], wall_ms=results["wall_ms"])
+    previous = dict(baseline["steps"], wall_ms=baseline["wall_ms"])
+    regressions = []
+    for step, summary in current.items():
+        if step not in previous:
+            continue
+        # Baselines saved before failure rates were recorded count as failure-free
+        before_rate = previous[step].get("failure_rate", 0.0)
+        after_rate = summary.get("failure_rate", 0.0)
+        if after_rate > before_rate:
+            regressions.append({"step": step, "baseline_rate": before_rate,
+                                "current_rate": after_rate})
+        if not previous[step][stat]:
+            continue
+        before, after = previous[step][stat], summary[stat]
+        change = (after - before) / before
+        if change > threshold:
+            regressions.append({"step": step, "baseline_ms": before,
+                                "current_ms": after, "change": change})
+    return regressions
+
+
+def print_report(results: Dict) -> None:
+    print("=" * 70)
+    print(f"SEARCH BENCHMARK {results['label']}".rstrip())
+    print(f"Iterations: {results['iterations']}   Failures: {results['failures']}")
+    print("=" * 70)
+    print(f"{'Step':<20}{'p50 ms':>12}{'p95 ms':>12}{'p99 ms':>12}{'failed':>12}")
+    for step in STEPS + ["wall_ms", "cpu_ms"]:
+        summary = results[step] if step in ("wall_ms", "cpu_ms") else results["steps"][step]
+        failed = (f"{summary['failures']} ({summary['failure_rate']:.0%})"
+                  if step in results["steps"] else "")
+        print(f"{step:<20}{summary['p50']:>12.1f}{summary['p95']:>12.1f}{summary['p99']:>12.1f}{failed:>12}")
+
+
+def print_savings(baseline: Dict, results: Dict, stat: str = "p50") -> None:
+    """Per-step stat of results next to baseline, with the time saved."""
+    print("=" * 70)
+    print(f"REDUCED MOTION SAVINGS ({stat})")
+    print("=" * 70)
+    print(f"{'Step':<20}{'animations ms':>15}{'reduced ms':>13}{'saved ms':>11}{'saved':>9}")
+    for step in STEPS + ["wall_ms"]:
+        before = (baseline[step] if step == "wall_ms" else baseline["steps"][step])[stat]
+        after = (results[step] if step == "wall_ms" else results["steps"][step])[stat]
+        share = f"{(before - after) / before:.0%}" if before else "-"
+        print(f"{step:<20}{before:>15.1f}{after:>13.1f}{before - after:>11.1f}{share:>9}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark HomePage.search_flight per step")
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", help="Stored results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Allowed p95 slowdown as a fraction (default 0.10)")
+    parser.add_argument("--offers-latency", type=int, default=500, help="Fixture /api/offers latency (ms)")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--label", default="")
+    parser.add_argument("--trace-dir", help="Export a Chrome trace per iteration (open in ui.perfetto.dev)")
+    parser.add_argument("--reduced-motion", action="store_true",
+                        help="Also run with animations off and print the per-step savings")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    server_options = {"latency_ms": {"offers": args.offers_latency}}
+    animated = None
+    if args.reduced_motion:
+        animated = run_benchmark(args.iterations, headless=not args.headed,
+                                 server_options=server_options, label=f"{args.label} animations".strip())
+    results = run_benchmark(args.iterations, headless=not args.headed, server_options=server_options,
+                            label=args.label, trace_dir=args.trace_dir,
+                            reduced_motion=args.reduced_motion)
+    save_results(results, args.output)
+    print_report(results)
+    if animated:
+        print()
+        print_savings(animated, results)
+    print(f"\nSaved to {args.output}")
+
+    if args.baseline:
+        regressions = compare(results, load_results(args.baseline), args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) against {args.baseline}:")
+            for r in regressions:
+                if "current_rate" in r:
+                    print(f"   {r['step']}: failure rate {r['baseline_rate']:.0%} → {r['current_rate']:.0%}")
+                else:
+                    print(f"   {r['step']}: {r['baseline_ms']:.1f} → {r['current_ms']:.1f} ms "
+                          f"({r['change']:+.0%})")
+            sys.exit(1)
+        print(f"\n✅ No regressions beyond {args.threshold:.0%} against {args.baseline}")
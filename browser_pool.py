@@ -0,0 +1,381 @@
+"""
+Browser Pool
+Keeps N warm Chromium browsers and leases contexts/pages to HomePage users,
+so route/date sweeps stop paying browser startup on every search.
+
+- Leases hand out a fresh context per search, or a reset page when
+  reuse_pages=True (cookies and the last site's localStorage/sessionStorage
+  cleared, page parked on about:blank). Storage of other origins, IndexedDB
+  and the HTTP cache survive a reset; use fresh contexts when every search
+  must start from a clean profile
+- A browser is recycled after max_searches_per_browser leases or once a
+  released page's JS heap crosses js_heap_ceiling_mb. The heap is the
+  page's CDP JSHeapTotalSize at release: a per-page proxy for renderer
+  growth, not the browser's resident memory
+- When every slot is leased, a lease waits up to lease_timeout seconds for
+  one to be released, then raises TimeoutError
+- get_stats() exposes lease waits and recycle counts for pool sizing
+
+BrowserPool is for playwright.sync_api, AsyncBrowserPool for
+playwright.async_api (run_searches in async_home_page).
+"""
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, List, Optional
+import asyncio
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Run on a reused page before it is parked: storage is per origin, so this
+# resets the site the search was on
+CLEAR_STORAGE_JS = """
+    () => {
+        try { localStorage.clear(); } catch (e) {}
+        try { sessionStorage.clear(); } catch (e) {}
+    }
+"""
+
+
+class Lease:
+    """A context/page pair on loan from a pool."""
+
+    def __init__(self, context, page, pooled: '_PooledBrowser'):
+        self.context = context
+        self.page = page
+        self.pooled = pooled
+
+
+class _PooledBrowser:
+    """Bookkeeping for one browser in the pool."""
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.searches = 0
+        self.active = 0
+        self.peak_js_heap_mb = 0.0  # largest JSHeapTotalSize of a released page
+        self.idle_pages: List = []  # (context, page) pairs kept for reuse
+
+    def exhausted(self, max_searches: int, js_heap_ceiling_mb: float) -> bool:
+        return self.searches >= max_searches or self.peak_js_heap_mb >= js_heap_ceiling_mb
+
+
+class _PoolBase:
+    """Slot selection, recycle policy and statistics shared by both pools."""
+
+    def __init__(self, playwright, size: int = 2, max_searches_per_browser: int = 50,
+                 js_heap_ceiling_mb: float = 512, max_leases_per_browser: int = 4,
+                 reuse_pages: bool = False, lease_timeout: float = 60,
+                 launch_options: Optional[Dict] = None, context_options: Optional[Dict] = None):
+        self.playwright = playwright
+        self.size = size
+        self.max_searches_per_browser = max_searches_per_browser
+        self.js_heap_ceiling_mb = js_heap_ceiling_mb
+        self.max_leases_per_browser = max_leases_per_browser
+        self.reuse_pages = reuse_pages
+        self.lease_timeout = lease_timeout
+        self.launch_options = launch_options or {"headless": True}
+        self.context_options = context_options or {}
+        self.browsers: List[_PooledBrowser] = []
+
+        self.leases = 0
+        self.lease_waits = 0
+        self.lease_wait_ms = 0.0
+        self.launches = 0
+        self.recycles = 0
+        self.recycles_by_js_heap = 0
+
+    def _pick(self) -> Optional[_PooledBrowser]:
+        """Least-loaded healthy browser with a free slot, or None."""
+        candidates = [b for b in self.browsers
+                      if b.active < self.max_leases_per_browser
+                      and not b.exhausted(self.max_searches_per_browser, self.js_heap_ceiling_mb)]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda b: (b.active, b.searches))
+
+    def _needs_recycle(self, pooled: _PooledBrowser) -> bool:
+        return pooled.active == 0 and pooled.exhausted(self.max_searches_per_browser,
+                                                       self.js_heap_ceiling_mb)
+
+    def _count_recycle(self, pooled: _PooledBrowser) -> None:
+        self.recycles += 1
+        if pooled.peak_js_heap_mb >= self.js_heap_ceiling_mb:
+            self.recycles_by_js_heap += 1
+        logger.info(f"  ↻ Recycling browser after {pooled.searches} searches "
+                    f"(peak page JS heap {pooled.peak_js_heap_mb:.0f} MB)")
+
+    def _exhausted_error(self) -> TimeoutError:
+        return TimeoutError(f"Browser pool exhausted: no slot released within {self.lease_timeout}s")
+
+    @staticmethod
+    def _js_heap_mb(metrics: Dict) -> float:
+        for metric in metrics.get("metrics", []):
+            if metric["name"] == "JSHeapTotalSize":
+                return metric["value"] / (1024 * 1024)
+        return 0.0
+
+    def get_stats(self) -> Dict:
+        """Counters for sizing the pool."""
+        return {
+            "browsers": len(self.browsers),
+            "active_leases": sum(b.active for b in self.browsers),
+            "leases": self.leases,
+            "lease_waits": self.lease_waits,
+            "lease_wait_ms": self.lease_wait_ms,
+            "avg_lease_wait_ms": self.lease_wait_ms / self.leases if self.leases else 0.0,
+            "launches": self.launches,
+            "recycles": self.recycles,
+            "recycles_by_js_heap": self.recycles_by_js_heap,
+        }
+
+
+class BrowserPool(_PoolBase):
+    """
+    Pool of warm browsers for playwright.sync_api.
+
+    When every slot is taken, a lease waits for another thread to release
+    one, like AsyncBrowserPool does, and raises TimeoutError after
+    lease_timeout seconds. Playwright's sync objects belong to the thread
+    that created them, so in a single-threaded script the wait can only
+    time out; size the pool for the deepest nesting of leases. Lease wait
+    time includes launching or recycling a browser before the lease could
+    be granted.
+
+    Example:
+        with sync_playwright() as p, BrowserPool(p, size=2) as pool:
+            for query in queries:
+                with pool.lease() as lease:
+                    HomePage(lease.page).open().search_flight(**query)
+            print(pool.get_stats())
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._available = threading.Condition()
+
+    def start(self) -> 'BrowserPool':
+        """Launch the warm browsers."""
+        while len(self.browsers) < self.size:
+            self.browsers.append(self._launch())
+        return self
+
+    def _launch(self) -> _PooledBrowser:
+        self.launches += 1
+        return _PooledBrowser(self.playwright.chromium.launch(**self.launch_options))
+
+    def _recycle(self, pooled: _PooledBrowser) -> None:
+        self._count_recycle(pooled)
+        self.browsers.remove(pooled)
+        try:
+            pooled.browser.close()
+        except Exception:
+            pass
+        self.browsers.append(self._launch())
+
+    def _acquire(self) -> _PooledBrowser:
+        start = time.time()
+        waited = False
+        with self._available:
+            while True:
+                for pooled in [b for b in self.browsers if self._needs_recycle(b)]:
+                    self._recycle(pooled)
+                    waited = True
+                if len(self.browsers) < self.size:
+                    self.start()
+                    waited = True
+                pooled = self._pick()
+                if pooled is not None:
+                    pooled.active += 1
+                    break
+                waited = True
+                remaining = start + self.lease_timeout - time.time()
+                if remaining <= 0 or not self._available.wait(remaining):
+                    raise self._exhausted_error()
+
+        if waited:
+            self.lease_waits += 1
+            self.lease_wait_ms += (time.time() - start) * 1000
+        return pooled
+
+    @contextmanager
+    def lease(self):
+        """Lease a context and page; returned to the pool on exit."""
+        pooled = self._acquire()
+        self.leases += 1
+
+        if self.reuse_pages and pooled.idle_pages:
+            context, page = pooled.idle_pages.pop()
+        else:
+            context = pooled.browser.new_context(**self.context_options)
+            page = context.new_page()
+
+        try:
+            yield Lease(context, page, pooled)
+        finally:
+            self._release(pooled, context, page)
+
+    def _release(self, pooled: _PooledBrowser, context, page) -> None:
+        pooled.searches += 1
+        try:
+            cdp = context.new_cdp_session(page)
+            cdp.send("Performance.enable")
+            pooled.peak_js_heap_mb = max(pooled.peak_js_heap_mb,
+                                         self._js_heap_mb(cdp.send("Performance.getMetrics")))
+            cdp.detach()
+        except Exception:
+            pass
+
+        reusable = self.reuse_pages and not pooled.exhausted(self.max_searches_per_browser,
+                                                             self.js_heap_ceiling_mb)
+        try:
+            if reusable:
+                context.clear_cookies()
+                page.evaluate(CLEAR_STORAGE_JS)
+                page.goto("about:blank")
+                pooled.idle_pages.append((context, page))
+            else:
+                context.close()
+        except Exception:
+            pass
+
+        with self._available:
+            pooled.active -= 1
+            self._available.notify_all()
+
+    def close(self) -> None:
+        """Close every browser in the pool."""
+        for pooled in self.browsers:
+            try:
+                pooled.browser.close()
+            except Exception:
+                pass
+        self.browsers = []
+
+    def __enter__(self) -> 'BrowserPool':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class AsyncBrowserPool(_PoolBase):
+    """
+    Pool of warm browsers for playwright.async_api.
+    Leases wait on a condition when every slot is taken, up to
+    lease_timeout seconds (then TimeoutError); those waits are counted in
+    lease_waits / lease_wait_ms.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._available = asyncio.Condition()
+
+    async def start(self) -> 'AsyncBrowserPool':
+        """Launch the warm browsers."""
+        while len(self.browsers) < self.size:
+            self.browsers.append(await self._launch())
+        return self
+
+    async def _launch(self) -> _PooledBrowser:
+        self.launches += 1
+        return _PooledBrowser(await self.playwright.chromium.launch(**self.launch_options))
+
+    async def _recycle(self, pooled: _PooledBrowser) -> None:
+        self._count_recycle(pooled)
+        self.browsers.remove(pooled)
+        try:
+            await pooled.browser.close()
+        except Exception:
+            pass
+        self.browsers.append(await self._launch())
+
+    async def _acquire(self) -> _PooledBrowser:
+        start = time.time()
+        waited = False
+        async with self._available:
+            while True:
+                for pooled in [b for b in self.browsers if self._needs_recycle(b)]:
+                    await self._recycle(pooled)
+                    waited = True
+                if len(self.browsers) < self.size:
+                    await self.start()
+                    waited = True
+                pooled = self._pick()
+                if pooled is not None:
+                    pooled.active += 1
+                    break
+                waited = True
+                remaining = start + self.lease_timeout - time.time()
+                if remaining <= 0:
+                    raise self._exhausted_error()
+                try:
+                    await asyncio.wait_for(self._available.wait(), remaining)
+                except asyncio.TimeoutError:
+                    raise self._exhausted_error()
+
+        if waited:
+            self.lease_waits += 1
+            self.lease_wait_ms += (time.time() - start) * 1000
+        return pooled
+
+    @asynccontextmanager
+    async def lease(self):
+        """Lease a context and page; returned to the pool on exit."""
+        pooled = await self._acquire()
+        self.leases += 1
+
+        if self.reuse_pages and pooled.idle_pages:
+            context, page = pooled.idle_pages.pop()
+        else:
+            context = await pooled.browser.new_context(**self.context_options)
+            page = await context.new_page()
+
+        try:
+            yield Lease(context, page, pooled)
+        finally:
+            await self._release(pooled, context, page)
+
+    async def _release(self, pooled: _PooledBrowser, context, page) -> None:
+        pooled.searches += 1
+        try:
+            cdp = await context.new_cdp_session(page)
+            await cdp.send("Performance.enable")
+            pooled.peak_js_heap_mb = max(pooled.peak_js_heap_mb,
+                                         self._js_heap_mb(await cdp.send("Performance.getMetrics")))
+            await cdp.detach()
+        except Exception:
+            pass
+
+        reusable = self.reuse_pages and not pooled.exhausted(self.max_searches_per_browser,
+                                                             self.js_heap_ceiling_mb)
+        try:
+            if reusable:
+                await context.clear_cookies()
+                await page.evaluate(CLEAR_STORAGE_JS)
+                await page.goto("about:blank")
+                pooled.idle_pages.append((context, page))
+            else:
+                await context.close()
+        except Exception:
+            pass
+
+        async with self._available:
+            pooled.active -= 1
+            self._available.notify_all()
+
+    async def close(self) -> None:
+        """Close every browser in the pool."""
+        for pooled in self.browsers:
+            try:
+                await pooled.browser.close()
+            except Exception:
+                pass
+        self.browsers = []
+
+    async def __aenter__(self) -> 'AsyncBrowserPool':
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
@@ -0,0 +1,244 @@
+"""
+Calendar Navigation
+Moves a month-view calendar to a target month in one batch instead of
+reading the header and sleeping after every "next month" click.
+
+The header is read once, the month offset is computed, and all clicks are
+dispatched inside a single page.evaluate. The header is then awaited once;
+if the widget dropped clicks (some re-render per click), the remainder is
+stepped one click at a time, waiting on the header rather than a sleep.
+async_navigate_to_month does the same for playwright.async_api pages.
+"""
+from typing import Optional, Tuple
+from tracing import set_attribute, traced
+from waits import AsyncReadinessWaiter, ReadinessWaiter
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December']
+
+NEXT_MONTH_BUTTON = "button[aria-label*='Next'], button[class*='next']"
+PREV_MONTH_BUTTON = "button[aria-label*='Previous'], button[class*='prev']"
+
+HEADER_CHANGED_JS = """
+    ([selector, previous]) => {
+        const header = document.querySelector(selector);
+        return header && header.innerText !== previous;
+    }
+"""
+
+HEADER_MATCHES_JS = """
+    ([selector, month, year]) => {
+        const header = document.querySelector(selector);
+        return !!header && header.innerText.includes(month) && header.innerText.includes(year);
+    }
+"""
+
+CLICK_N_TIMES_JS = """
+    ([selector, count]) => {
+        const button = document.querySelector(selector);
+        if (!button) return 0;
+        for (let i = 0; i < count; i++) button.click();
+        return count;
+    }
+"""
+
+
+# Full names first so "December" is not read as "Dec"
+MONTH_PATTERN = re.compile(r"\b(" + "|".join(MONTH_NAMES + [name[:3] for name in MONTH_NAMES]) + r")\b",
+                           re.IGNORECASE)
+YEAR_PATTERN = re.compile(r"\b(\d{4})\b")
+
+
+def parse_month_header(text: str) -> Optional[Tuple[int, int]]:
+    """
+    'December 2025' (or 'Dec 2025', '2025 December') → (2025, 12).
+
+    The first month named in the text wins, paired with the year after it
+    (or the one before it), so a two-month header such as
+    'December 2025 January 2026' reads as its first month.
+    """
+    month_match = MONTH_PATTERN.search(text)
+    if not month_match:
+        return None
+    following = YEAR_PATTERN.search(text, month_match.end())
+    preceding = YEAR_PATTERN.findall(text, 0, month_match.start())
+    if following:
+        year = following.group(1)
+    elif preceding:
+        year = preceding[-1]
+    else:
+        return None
+    abbreviation = month_match.group(1)[:3].lower()
+    month = next(i for i, name in enumerate(MONTH_NAMES) if name[:3].lower() == abbreviation) + 1
+    return int(year), month
+
+
+def month_offset(header_text: str, month_name: str, year: str) -> Optional[int]:
+    """Months between the displayed month and the target; None if the header is unreadable."""
+    shown = parse_month_header(header_text)
+    if shown is None:
+        return None
+    target_month = MONTH_NAMES.index(month_name) + 1
+    return (int(year) - shown[0]) * 12 + (target_month - shown[1])
+
+
+@traced("calendar.navigate_to_month", args=("month_name", "year", "header_selector"), record_result=True)
+def navigate_to_month(page, month_name: str, year: str, header_selector: str,
+                      next_selector: str = NEXT_MONTH_BUTTON,
+                      prev_selector: str = PREV_MONTH_BUTTON,
+                      max_steps: int = 12) -> bool:
+    """
+    Bring the calendar to month_name/year.
+
+    Args:
+        page: Playwright page with the calendar open
+        month_name: Full English month name, e.g. "December"
+        year: Four-digit year string
+        header_selector: Selector of the element showing the current month
+        max_steps: Safety limit on months to move
+
+    Returns:
+        True if the header shows the target month afterwards
+    """
+    waits = ReadinessWaiter(page)
+    try:
+        header_text = page.locator(header_selector).first.inner_text(timeout=2000)
+    except Exception:
+        logger.warning("  ⚠ Calendar header not found")
+        return False
+
+    offset = month_offset(header_text, month_name, year)
+    if offset is None:
+        logger.warning(f"  ⚠ Could not read calendar header '{header_text}'")
+        return _step_to_month(page, waits, month_name, year, header_selector,
+                              next_selector, prev_selector, max_steps)
+    if offset == 0:
+        logger.info(f"  ✓ Found {month_name} {year}")
+        return True
+    if abs(offset) > max_steps:
+        logger.warning(f"  ⚠ {month_name} {year} is {offset} months away, beyond the limit")
+        return False
+
+    # One batch of clicks, then a single wait on the header
+    button = next_selector if offset > 0 else prev_selector
+    set_attribute("offset", offset)
+    set_attribute("strategy", "batch")
+    page.evaluate(CLICK_N_TIMES_JS, [button, abs(offset)])
+    if waits.dom_condition(HEADER_MATCHES_JS, arg=[header_selector, month_name, year],
+                           timeout=2000, description="calendar month jump"):
+        logger.info(f"  ✓ Jumped {offset:+d} months to {month_name} {year}")
+        return True
+
+    logger.info("  → Batch jump fell short, stepping the rest...")
+    set_attribute("strategy", "batch+step")
+    return _step_to_month(page, waits, month_name, year, header_selector,
+                          next_selector, prev_selector, max_steps)
+
+
+@traced("calendar.step_to_month", args=("month_name", "year"), record_result=True)
+def _step_to_month(page, waits: ReadinessWaiter, month_name: str, year: str,
+                   header_selector: str, next_selector: str, prev_selector: str,
+                   max_steps: int) -> bool:
+    """
+    One click at a time, waiting for the header to change after each click.
+    The direction is re-read from the header every step; an unreadable
+    header steps forward.
+    """
+    for _ in range(max_steps):
+        try:
+            header_text = page.locator(header_selector).first.inner_text(timeout=2000)
+            if month_name in header_text and year in header_text:
+                logger.info(f"  ✓ Found {month_name} {year}")
+                return True
+            offset = month_offset(header_text, month_name, year)
+            button = prev_selector if offset is not None and offset < 0 else next_selector
+            page.locator(button).first.click(force=True, timeout=2000)
+            waits.dom_condition(HEADER_CHANGED_JS, arg=[header_selector, header_text], timeout=1000,
+                                description="month header change")
+        except Exception:
+            break
+
+    logger.warning(f"  ⚠ Could not navigate to {month_name} {year}")
+    return False
+
+
+async def async_navigate_to_month(page, month_name: str, year: str, header_selector: str,
+                                  next_selector: str = NEXT_MONTH_BUTTON,
+                                  prev_selector: str = PREV_MONTH_BUTTON,
+                                  max_steps: int = 12) -> bool:
+    """navigate_to_month for a playwright.async_api page."""
+    waits = AsyncReadinessWaiter(page)
+    try:
+        header_text = await page.locator(header_selector).first.inner_text(timeout=2000)
+    except Exception:
+        logger.warning("  ⚠ Calendar header not found")
+        return False
+
+    offset = month_offset(header_text, month_name, year)
+    if offset is None:
+        logger.warning(f"  ⚠ Could not read calendar header '{header_text}'")
+        return await _async_step_to_month(page, waits, month_name, year, header_selector,
+                                          next_selector, prev_selector, max_steps)
+    if offset == 0:
+        logger.info(f"  ✓ Found {month_name} {year}")
+        return True
+    if abs(offset) > max_steps:
+        logger.warning(f"  ⚠ {month_name} {year} is {offset} months away, beyond the limit")
+        return False
+
+    button = next_selector if offset > 0 else prev_selector
+    await page.evaluate(CLICK_N_TIMES_JS, [button, abs(offset)])
+    if await waits.dom_condition(HEADER_MATCHES_JS, arg=[header_selector, month_name, year],
+                                 timeout=2000, description="calendar month jump"):
+        logger.info(f"  ✓ Jumped {offset:+d} months to {month_name} {year}")
+        return True
+
+    logger.info("  → Batch jump fell short, stepping the rest...")
+    return await _async_step_to_month(page, waits, month_name, year, header_selector,
+                                      next_selector, prev_selector, max_steps)
+
+
+async def _async_step_to_month(page, waits: AsyncReadinessWaiter, month_name: str, year: str,
+                               header_selector: str, next_selector: str, prev_selector: str,
+                               max_steps: int) -> bool:
+    """_step_to_month for a playwright.async_api page."""
+    for _ in range(max_steps):
+        try:
+            header_text = await page.locator(header_selector).first.inner_text(timeout=2000)
+            if month_name in header_text and year in header_text:
+                logger.info(f"  ✓ Found {month_name} {year}")
+                return True
+            offset = month_offset(header_text, month_name, year)
+            button = prev_selector if offset is not None and offset < 0 else next_selector
+            await page.locator(button).first.click(force=True, timeout=2000)
+            await waits.dom_condition(HEADER_CHANGED_JS, arg=[header_selector, header_text],
+                                      timeout=1000, description="month header change")
+        except Exception:
+            break
+
+    logger.warning(f"  ⚠ Could not navigate to {month_name} {year}")
+    return False
+
+
+@traced("calendar.enter_date_directly", args=("input_selector", "index"), record_result=True)
+def enter_date_directly(page, input_selector: str, index: int, date: str) -> bool:
+    """
+    Type a MM/DD/YYYY date into the index-th date input, if the widget allows it.
+
+    Returns:
+        True if the input is editable and kept the typed value
+    """
+    field = page.locator(input_selector).nth(index)
+    try:
+        editable = field.evaluate("(el) => !el.readOnly && !el.disabled")
+        if not editable:
+            return False
+        field.fill(date, timeout=2000)
+        field.press("Enter")
+        return date in field.input_value()
+    except Exception:
+        return False
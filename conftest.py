@@ -0,0 +1,216 @@
+"""
+Shared pytest engine for the Lufthansa search suite.
+
+- lh_browser: one browser per session (per worker under pytest-xdist),
+  launched with the selected run profile; lh_context gives each test a
+  fresh context on it
+- search_query: parametrized from the route/date/trip-type matrix
+  (search_matrix.py), overridable with --matrix
+- --shard i/n: run every n-th matrix test only, so CI jobs can split the
+  suite; each job can still fan out further with -n (xdist)
+- --offline: point the suite at a local FixtureServer
+- overlay_suppressor: OverlaySuppressor installed on lh_context
+- strategy_cache / airport_cache: file-backed per worker
+  (selector_strategy_cache.<worker>.json, airport_cache.<worker>.json),
+  saved once at the end of the session
+- Profiles with tracing="on_failure" keep a Playwright trace for failed
+  tests only (failure_traces/, indexed by the session's run_id)
+- Terminal summary: matrix wall time next to the serial baseline (sum of
+  per-test durations)
+
+Examples:
+    pytest test_lufthansa_matrix.py --profile ci -n 4
+    pytest test_lufthansa_matrix.py --offline --shard 2/3
+"""
+from search_matrix import build_queries, load_matrix, query_id
+from run_profiles import PROFILE_ENV, PROFILES, get_profile
+from datetime import datetime
+import os
+import time
+import uuid
+import pytest
+
+LIVE_SEARCH_URL = "https://www.lufthansa.com/us/en/flight-search"
+MATRIX_MARKER = "search_matrix"
+
+QUERIES_KEY = pytest.StashKey[list]()
+START_KEY = pytest.StashKey[float]()
+RUN_ID_KEY = pytest.StashKey[str]()
+
+try:
+    import pytest_playwright  # noqa: F401  provides the session-scoped `playwright` fixture
+except ImportError:
+    from playwright.sync_api import sync_playwright
+
+    @pytest.fixture(scope="session")
+    def playwright():
+        with sync_playwright() as p:
+            yield p
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("lufthansa", "Lufthansa search matrix")
+    group.addoption("--profile", choices=sorted(PROFILES), default=None,
+                    help="Run profile (default: $LH_RUN_PROFILE or debug)")
+    group.addoption("--matrix", default=None, help="JSON file overriding the search matrix")
+    group.addoption("--shard", default=None, help="Run shard i of n, e.g. 2/4")
+    group.addoption("--offline", action="store_true",
+                    help="Search against a local FixtureServer instead of lufthansa.com")
+
+
+def _parse_shard(value):
+    try:
+        index, total = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise pytest.UsageError(f"--shard expects i/n, got '{value}'")
+    if not 1 <= index <= total:
+        raise pytest.UsageError(f"--shard index must be between 1 and {total}")
+    return index, total
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", f"{MATRIX_MARKER}: parametrized route/date/trip-type search")
+    if config.getoption("profile"):
+        os.environ[PROFILE_ENV] = config.getoption("profile")
+
+    start_date = None
+    if config.getoption("offline"):
+        from fixture_server import FixtureServer
+        start_date = datetime.strptime(FixtureServer.DEFAULT_PAGE_CONFIG["today"], "%Y-%m-%d").date()
+    config.stash[QUERIES_KEY] = build_queries(load_matrix(config.getoption("matrix")), start_date)
+    config.stash[START_KEY] = time.time()
+    config.stash[RUN_ID_KEY] = str(uuid.uuid4())[:8]
+
+
+def pytest_generate_tests(metafunc):
+    if "search_query" in metafunc.fixturenames:
+        queries = metafunc.config.stash[QUERIES_KEY]
+        metafunc.parametrize("search_query", queries, ids=[query_id(q) for q in queries])
+
+
+def pytest_collection_modifyitems(config, items):
+    matrix_items = [item for item in items if "search_query" in getattr(item, "fixturenames", ())]
+    for item in matrix_items:
+        item.add_marker(MATRIX_MARKER)
+
+    shard = config.getoption("shard")
+    if not shard:
+        return
+    index, total = _parse_shard(shard)
+    # Every xdist worker collects the same items, so this split is identical on all of them
+    ordered = sorted(matrix_items, key=lambda item: item.nodeid)
+    deselected = {item.nodeid for position, item in enumerate(ordered) if position % total != index - 1}
+    if deselected:
+        config.hook.pytest_deselected(items=[i for i in items if i.nodeid in deselected])
+        items[:] = [i for i in items if i.nodeid not in deselected]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+
+# ==================== FIXTURES ====================
+
+@pytest.fixture(scope="session")
+def run_profile():
+    return get_profile()
+
+
+@pytest.fixture(scope="session")
+def lh_browser(playwright, run_profile):
+    """One browser for the whole session (one per xdist worker)."""
+    browser = playwright.chromium.launch(**run_profile.launch_options())
+    yield browser
+    browser.close()
+
+
+@pytest.fixture(scope="session")
+def search_url(pytestconfig):
+    if not pytestconfig.getoption("offline"):
+        yield LIVE_SEARCH_URL
+        return
+    from fixture_server import FixtureServer
+    with FixtureServer() as server:
+        yield server.search_url
+
+
+@pytest.fixture
+def lh_context(request, lh_browser, run_profile):
+    """A fresh context per test on the shared browser."""
+    context = lh_browser.new_context(**run_profile.context_options())
+    if run_profile.reduced_motion:
+        import reduced_motion
+        reduced_motion.install(context)
+    if run_profile.block_requests:
+        from request_blocker import RequestBlocker
+        RequestBlocker().install(context)
+    recorder = chunk = None
+    if run_profile.tracing == "on_failure":
+        from failure_traces import FailureTraceRecorder
+        recorder = FailureTraceRecorder(context, request.config.stash[RUN_ID_KEY])
+        chunk = recorder.begin(request.node.name)
+    yield context
+    if recorder is not None:
+        report = getattr(request.node, "rep_call", None)
+        if report is not None and report.failed:
+            chunk.fail(report.longreprtext.splitlines()[-1] if report.longreprtext else "failed")
+        recorder.end(chunk)
+        recorder.stop()
+    context.close()
+
+
+@pytest.fixture
+def overlay_suppressor(lh_context):
+    """Consent/feedback overlays dismissed as they appear in lh_context."""
+    from overlay_suppressor import OverlaySuppressor
+    return OverlaySuppressor().install(lh_context)
+
+
+def _worker_path(prefix: str) -> str:
+    """One cache file per xdist worker, so workers never write the same file."""
+    return f"{prefix}.{os.environ.get('PYTEST_XDIST_WORKER', 'main')}.json"
+
+
+@pytest.fixture(scope="session")
+def strategy_cache():
+    from selector_cache import StrategyCache
+    cache = StrategyCache(_worker_path("selector_strategy_cache"))
+    yield cache
+    cache.save()
+
+
+@pytest.fixture(scope="session")
+def airport_cache():
+    from airport_cache import AirportCache
+    cache = AirportCache(_worker_path("airport_cache"))
+    yield cache
+    cache.save()
+
+
+# ==================== REPORTING ====================
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput"):
+        return
+    durations = {}
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            if getattr(report, "when", None) and MATRIX_MARKER in getattr(report, "keywords", {}):
+                durations[report.nodeid] = durations.get(report.nodeid, 0.0) + report.duration
+    if not durations:
+        return
+
+    wall = time.time() - config.stash[START_KEY]
+    serial = sum(durations.values())
+    workers = getattr(config.option, "numprocesses", None) or 1
+    terminalreporter.write_sep("=", "search matrix timing")
+    terminalreporter.write_line(f"Searches:        {len(durations)}"
+                                + (f" (shard {config.getoption('shard')})" if config.getoption("shard") else ""))
+    terminalreporter.write_line(f"Workers:         {workers}")
+    terminalreporter.write_line(f"Wall time:       {wall:.1f}s")
+    terminalreporter.write_line(f"Serial baseline: {serial:.1f}s (sum of per-test durations)")
+    if wall > 0:
+        terminalreporter.write_line(f"Speedup:         {serial / wall:.2f}x")
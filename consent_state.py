@@ -0,0 +1,108 @@
+"""
+Consent State Snapshots
+Captures the consent-accepted cookies and localStorage once with Playwright
+storage_state and loads them into new contexts, so the consent banner never
+shows and overlay handling becomes a cheap presence check.
+
+The snapshot is stored with its capture time. It is treated as stale after
+max_age_hours, or as soon as a page loaded with it still shows the banner;
+HomePage.remove_overlays() then falls back to the full cleanup and
+re-captures the snapshot.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Elements that only exist while the consent banner is up. offsetParent is
+# null for position: fixed overlays, so visibility is read from the layout
+BANNER_CHECK_JS = """
+    () => {
+        const ids = ['consentOverlay', '__tealiumGDPRcpPrefs'];
+        return ids.some(id => {
+            const el = document.getElementById(id);
+            if (!el || el.getClientRects().length === 0) return false;
+            const style = getComputedStyle(el);
+            return style.visibility !== 'hidden' && style.display !== 'none';
+        });
+    }
+"""
+
+
+class ConsentStateStore:
+    """
+    File-backed storage_state snapshot with an expiry.
+
+    Example:
+        store = ConsentStateStore()
+        context = browser.new_context(**store.context_options(viewport=...))
+        home_page = HomePage(context.new_page(), consent_store=store).open()
+    """
+
+    def __init__(self, filepath: str = "consent_state.json", max_age_hours: float = 24):
+        self.filepath = filepath
+        self.max_age = timedelta(hours=max_age_hours)
+
+    def _read(self) -> Optional[Dict]:
+        if not os.path.exists(self.filepath):
+            return None
+        try:
+            with open(self.filepath) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            logger.warning(f"  ⚠ Unreadable consent snapshot {self.filepath}, ignoring")
+            return None
+
+    def load(self) -> Optional[Dict]:
+        """Return the storage_state dict if a fresh snapshot exists, else None."""
+        snapshot = self._read()
+        if not snapshot:
+            return None
+        try:
+            captured_at = datetime.fromisoformat(snapshot["captured_at"])
+            storage_state = snapshot["storage_state"]
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"  Malformed consent snapshot {self.filepath} ({e!r}), treating as stale")
+            return None
+        if datetime.now() - captured_at > self.max_age:
+            logger.info("  Consent snapshot expired")
+            return None
+        return storage_state
+
+    def is_fresh(self) -> bool:
+        return self.load() is not None
+
+    def context_options(self, **options) -> Dict:
+        """
+        Keyword arguments for browser.new_context with the snapshot applied.
+
+        Args:
+            **options: Other new_context options (viewport, locale, ...)
+        """
+        storage_state = self.load()
+        if storage_state:
+            options["storage_state"] = storage_state
+        return options
+
+    def capture(self, context) -> None:
+        """Save the context's current cookies and localStorage as the snapshot."""
+        snapshot = {
+            "captured_at": datetime.now().isoformat(),
+            "storage_state": context.storage_state(),
+        }
+        with open(self.filepath, "w") as f:
+            json.dump(snapshot, f)
+        logger.info(f"  ✓ Consent snapshot saved to {self.filepath}")
+
+    def invalidate(self) -> None:
+        """Drop the snapshot, e.g. when it stopped suppressing the banner."""
+        if os.path.exists(self.filepath):
+            os.remove(self.filepath)
+
+    @staticmethod
+    def banner_present(page) -> bool:
+        """Single evaluate: is a consent overlay currently visible?"""
+        return bool(page.evaluate(BANNER_CHECK_JS))
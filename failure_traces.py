@@ -0,0 +1,182 @@
+"""
+Failure Traces
+Playwright tracing that only keeps a trace when a search fails.
+
+Tracing runs for the whole context, but each search is its own trace
+chunk: a passing search ends with stop_chunk() and no path, so Playwright
+discards it; a failed one is written to failure_traces/ and indexed by the
+TestLogger run_id. The store is capped by trace count and total bytes,
+oldest traces going first.
+
+Example:
+    logger = TestLogger()
+    recorder = FailureTraceRecorder(context, run_id=logger.run_id).start()
+    HomePage(page, failure_traces=recorder).open().search_flight(...)
+    recorder.stop()
+
+Open a kept trace with `playwright show-trace failure_traces/<file>.zip`.
+"""
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+
+class FailureTraceStore:
+    """
+    Directory of kept traces with a JSON index and a retention cap.
+
+    Args:
+        directory: Where trace zips and index.json live
+        max_traces: Keep at most this many traces
+        max_bytes: Keep at most this many bytes of traces
+    """
+
+    def __init__(self, directory: str = "failure_traces", max_traces: int = 20,
+                 max_bytes: int = 200 * 1024 * 1024):
+        self.directory = directory
+        self.max_traces = max_traces
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(directory, "index.json")
+
+    def load_index(self) -> List[Dict]:
+        if not os.path.exists(self.index_path):
+            return []
+        try:
+            with open(self.index_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            logger.warning(f"  ⚠ Unreadable trace index {self.index_path}, starting fresh")
+            return []
+
+    def _save_index(self, entries: List[Dict]) -> None:
+        with open(self.index_path, "w") as f:
+            json.dump(entries, f, indent=2)
+
+    def add(self, source_path: str, run_id: str, label: str, reason: str) -> Dict:
+        """Move a trace zip into the store, index it and apply retention."""
+        os.makedirs(self.directory, exist_ok=True)
+        entries = self.load_index()
+        slug = re.sub(r"[^\w.-]+", "_", label)[:60]
+        filename = f"{run_id}_{datetime.now():%Y%m%d-%H%M%S-%f}_{slug}.zip"
+        path = os.path.join(self.directory, filename)
+        shutil.move(source_path, path)
+        entry = {
+            "run_id": run_id,
+            "label": label,
+            "reason": str(reason).replace("\n", " ")[:200],
+            "file": filename,
+            "bytes": os.path.getsize(path),
+            "created": datetime.now().isoformat(),
+        }
+        entries.append(entry)
+        self._save_index(self._enforce_retention(entries))
+        return entry
+
+    def _enforce_retention(self, entries: List[Dict]) -> List[Dict]:
+        kept = list(entries)
+        while kept and (len(kept) > self.max_traces or
+                        sum(e["bytes"] for e in kept) > self.max_bytes):
+            oldest = kept.pop(0)
+            try:
+                os.remove(os.path.join(self.directory, oldest["file"]))
+            except OSError:
+                pass
+            logger.info(f"  Dropped trace {oldest['file']} (retention)")
+        return kept
+
+    def traces_for(self, run_id: str) -> List[Dict]:
+        return [e for e in self.load_index() if e["run_id"] == run_id]
+
+    def get_stats(self) -> Dict:
+        entries = self.load_index()
+        return {"traces": len(entries), "bytes": sum(e["bytes"] for e in entries),
+                "runs": len({e["run_id"] for e in entries})}
+
+
+class _Chunk:
+    """Handle for one traced search; call fail() for failures that don't raise."""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.failure: Optional[str] = None
+
+    def fail(self, reason: str) -> None:
+        self.failure = reason
+
+
+class FailureTraceRecorder:
+    """
+    Per-context tracer that keeps chunks for failed searches only.
+
+    Args:
+        context: Playwright BrowserContext
+        run_id: TestLogger run_id the kept traces are indexed under
+        store: Where kept traces go (default FailureTraceStore())
+    """
+
+    def __init__(self, context, run_id: str, store: Optional[FailureTraceStore] = None):
+        self.context = context
+        self.run_id = run_id
+        self.store = store or FailureTraceStore()
+        self.started = False
+        self.kept: List[Dict] = []
+        self.discarded = 0
+
+    def start(self) -> 'FailureTraceRecorder':
+        if not self.started:
+            self.context.tracing.start(screenshots=True, snapshots=True)
+            self.started = True
+        return self
+
+    @contextmanager
+    def search(self, label: str = "search_flight") -> Iterator[_Chunk]:
+        """Trace the block as one chunk; kept if it raises or chunk.fail() is called."""
+        chunk = self.begin(label)
+        try:
+            yield chunk
+        except Exception as e:
+            chunk.fail(f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            self.end(chunk)
+
+    def begin(self, label: str) -> '_Chunk':
+        """Start a chunk explicitly, for flows that don't fit a with block."""
+        self.start()
+        self.context.tracing.start_chunk(title=label)
+        return _Chunk(label)
+
+    def end(self, chunk: '_Chunk') -> Optional[Dict]:
+        """Close a chunk: discard it, or keep it if it failed. Returns the index entry if kept."""
+        label = chunk.label
+        try:
+            if chunk.failure is None:
+                self.context.tracing.stop_chunk()
+                self.discarded += 1
+                return None
+            fd, temp_path = tempfile.mkstemp(suffix=".zip")
+            os.close(fd)
+            self.context.tracing.stop_chunk(path=temp_path)
+            entry = self.store.add(temp_path, self.run_id, label, chunk.failure)
+            self.kept.append(entry)
+            logger.info(f"  Trace kept for failed search: {entry['file']}")
+            return entry
+        except Exception as e:
+            logger.warning(f"  ⚠ Could not finish trace chunk: {e}")
+            return None
+
+    def stop(self) -> None:
+        if self.started:
+            try:
+                self.context.tracing.stop()
+            except Exception:
+                pass
+            self.started = False
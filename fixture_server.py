@@ -0,0 +1,245 @@
+"""
+Offline Fixture Server
+Local HTTP stand-in for www.lufthansa.com/us/en/flight-search so HomePage
+can be benchmarked and regression-tested without network access.
+
+The page (fixtures/flight_search.html) mirrors the selectors HomePage uses:
+- originCode / destinationCode inputs with a div[role='option'] listbox
+  fed by /api/airports
+- travelDatetime inputs and a div.calendar with an h2 month header,
+  a "Next month" button and td[role='gridcell'] days
+- a "Search flights" button that fetches /api/offers and renders
+  div.flight-offer rows with span.price
+
+Latency and failure injection are configurable per endpoint and seeded, so
+the full search_flight flow runs deterministically.
+
+Usage:
+    with FixtureServer(latency_ms={"offers": 800}) as server:
+        HomePage(page, url=server.search_url).open().search_flight(...)
+
+Run `python fixture_server.py --port 8080` to browse it by hand.
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, Optional
+from urllib.parse import parse_qs, urlparse
+from airport_cache import load_iata_list
+import argparse
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+SEARCH_PATH = "/us/en/flight-search"
+
+AIRPORTS = load_iata_list()
+
+
+class FixtureServer:
+    """
+    Threaded local server for the flight-search stand-in page.
+
+    Args:
+        port: Port to bind, 0 picks a free one
+        latency_ms: Delay per endpoint: "page", "airports", "offers"
+        failure_rate: Probability per endpoint of answering HTTP 500
+        no_results: Answer /api/offers with an empty result set
+        seed: Seed for failure injection
+        page_config: Overrides for the in-page behaviour (see DEFAULT_PAGE_CONFIG)
+    """
+
+    DEFAULT_LATENCY_MS = {"page": 0, "airports": 150, "offers": 500}
+
+    DEFAULT_PAGE_CONFIG = {
+        "today": "2025-11-28",           # first month the calendar shows
+        "consent_banner": True,
+        "consent_delay_ms": 300,
+        "autocomplete_debounce_ms": 150,
+        "month_step_ms": 50,             # render delay after "Next month"
+        "calendar_close_ms": 300,        # close animation; 0 under prefers-reduced-motion
+        "typed_dates": False,            # allow typing into the date inputs
+    }
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 latency_ms: Optional[Dict[str, int]] = None,
+                 failure_rate: Optional[Dict[str, float]] = None,
+                 no_results: bool = False, seed: int = 0,
+                 page_config: Optional[Dict] = None):
+        self.host = host
+        self.port = port
+        self.latency_ms = dict(self.DEFAULT_LATENCY_MS, **(latency_ms or {}))
+        self.failure_rate = failure_rate or {}
+        self.no_results = no_results
+        self.page_config = dict(self.DEFAULT_PAGE_CONFIG, **(page_config or {}))
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.request_counts: Dict[str, int] = {}
+
+        with open(os.path.join(FIXTURE_DIR, "flight_search.html"), encoding="utf-8") as f:
+            self._page_template = f.read()
+
+    # ==================== LIFECYCLE ====================
+
+    def start(self) -> 'FixtureServer':
+        server = self
+
+        class Handler(_FixtureHandler):
+            fixture = server
+
+        self._httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Fixture server on {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> 'FixtureServer':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def search_url(self) -> str:
+        return self.base_url + SEARCH_PATH
+
+    # ==================== BEHAVIOUR ====================
+
+    def should_fail(self, endpoint: str) -> bool:
+        rate = self.failure_rate.get(endpoint, 0.0)
+        with self._lock:
+            self.request_counts[endpoint] = self.request_counts.get(endpoint, 0) + 1
+            return rate > 0 and self._random.random() < rate
+
+    def delay(self, endpoint: str) -> None:
+        latency = self.latency_ms.get(endpoint, 0)
+        if latency:
+            time.sleep(latency / 1000)
+
+    def render_page(self) -> bytes:
+        config = f"<script>window.__FIXTURE_CONFIG__ = {json.dumps(self.page_config)};</script>"
+        return self._page_template.replace("</head>", config + "\n</head>", 1).encode("utf-8")
+
+    @staticmethod
+    def find_airports(query: str, airports: Iterable[Dict] = AIRPORTS) -> list:
+        query = query.strip().lower()
+        return [a for a in airports
+                if a["code"].lower() == query
+                or a["city"].lower().startswith(query)
+                or a["name"].lower().startswith(query)]
+
+    @staticmethod
+    def airport_code(value: str) -> str:
+        """'New York (JFK)' or 'JFK' → 'JFK'."""
+        match = re.search(r"\(([A-Z]{3})\)", value)
+        return match.group(1) if match else value.strip().upper()[:3]
+
+    def offers_payload(self, origin: str, destination: str, departure: str, ret: str) -> Dict:
+        """Deterministic air-bounds style payload; prices derive from the query."""
+        if self.no_results:
+            return {"data": {"airBoundGroups": []}}
+
+        origin = self.airport_code(origin)
+        destination = self.airport_code(destination)
+
+        digest = hashlib.sha1(f"{origin}|{destination}|{departure}|{ret}".encode()).hexdigest()
+        base = 500 + int(digest[:6], 16) % 1000
+        groups = []
+        for i, (hub, number) in enumerate([("FRA", 401), ("MUC", 411), ("ZRH", 17)]):
+            groups.append({
+                "boundDetails": {"segments": [{
+                    "flightNumber": f"LH{number}",
+                    "origin": origin,
+                    "destination": hub,
+                    "departureDateTime": departure,
+                }]},
+                "airBounds": [{
+                    "fareFamilyCode": "ECOSTAND",
+                    "prices": {"totalPrices": [
+                        {"total": round(base + i * 87.35, 2), "currencyCode": "USD"}
+                    ]},
+                }],
+            })
+        return {"data": {"airBoundGroups": groups}}
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    fixture: FixtureServer = None
+
+    def log_message(self, format, *args):
+        logger.debug("fixture: " + format % args)
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json(self, payload, status: int = 200) -> None:
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json")
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        if url.path in (SEARCH_PATH, SEARCH_PATH + "/", "/"):
+            endpoint, handler = "page", lambda: self._send(200, self.fixture.render_page(),
+                                                           "text/html; charset=utf-8")
+        elif url.path == "/api/airports":
+            endpoint, handler = "airports", lambda: self._json(
+                self.fixture.find_airports(query.get("q", "")))
+        elif url.path == "/api/offers":
+            endpoint, handler = "offers", lambda: self._json(self.fixture.offers_payload(
+                query.get("origin", ""), query.get("destination", ""),
+                query.get("departure", ""), query.get("return", "")))
+        else:
+            self._send(404, b"Not found", "text/plain")
+            return
+
+        self.fixture.delay(endpoint)
+        if self.fixture.should_fail(endpoint):
+            self._json({"error": "injected failure", "endpoint": endpoint}, status=500)
+            return
+        handler()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the offline flight-search fixture")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--offers-latency", type=int, default=500, help="ms")
+    parser.add_argument("--offers-failure-rate", type=float, default=0.0)
+    parser.add_argument("--no-results", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    server = FixtureServer(port=args.port, latency_ms={"offers": args.offers_latency},
+                           failure_rate={"offers": args.offers_failure_rate},
+                           no_results=args.no_results).start()
+    print(f"Serving {server.search_url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,190 @@
+"""
+HAR Record & Replay
+Records a complete search_flight session to a HAR archive, then replays it
+through route_from_har, so the whole flow (search, price extraction, ML
+logging) runs offline in seconds, without network variance.
+
+Archives are kept per route and dates:
+    har_archives/JFK-BER_2025-12-15_2025-12-25.har
+
+During replay every request that is not in the archive is aborted and
+reported in missed_requests, so drift between the recording and the
+current flow is visible instead of silently hitting the network.
+
+This is a context-level wrapper rather than a HomePage mode: HAR routing
+has to be attached to the browser context before its pages are created,
+and the recording must cover whatever flow runs in that context.
+
+Usage:
+    python har_replay.py record --origin-airport JFK --destination-airport BER
+    python har_replay.py replay --origin-airport JFK --destination-airport BER
+"""
+from typing import Dict, List, Optional
+import argparse
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+MODES = ("off", "record", "replay")
+
+
+class HarSession:
+    """
+    Attaches HAR recording or replay to a browser context.
+
+    Args:
+        mode: "off", "record" or "replay"
+        archive_dir: Directory holding the per-route archives
+        url_filter: Glob limiting which requests are recorded/replayed
+    """
+
+    def __init__(self, mode: str = "replay", archive_dir: str = "har_archives",
+                 url_filter: Optional[str] = None):
+        if mode not in MODES:
+            raise ValueError(f"Invalid HAR mode: {mode}")
+        self.mode = mode
+        self.archive_dir = archive_dir
+        self.url_filter = url_filter
+        self.missed_requests: List[Dict] = []
+        self.path: Optional[str] = None
+
+    @staticmethod
+    def _iso(date: Optional[str]) -> str:
+        """MM/DD/YYYY → YYYY-MM-DD"""
+        if not date:
+            return "oneway"
+        month, day, year = date.split('/')
+        return f"{year}-{int(month):02d}-{int(day):02d}"
+
+    def archive_path(self, origin: str, destination: str, departure_date: str,
+                     return_date: Optional[str] = None) -> str:
+        name = f"{origin}-{destination}_{self._iso(departure_date)}_{self._iso(return_date)}.har"
+        return os.path.join(self.archive_dir, name.replace(" ", "_"))
+
+    def list_archives(self) -> List[str]:
+        if not os.path.isdir(self.archive_dir):
+            return []
+        return sorted(f for f in os.listdir(self.archive_dir) if f.endswith(".har"))
+
+    def attach(self, context, origin: str, destination: str, departure_date: str,
+               return_date: Optional[str] = None) -> str:
+        """
+        Start recording into, or replaying from, the archive for this query.
+        A recording is written when the context closes.
+
+        Returns:
+            The archive path
+        """
+        self.path = self.archive_path(origin, destination, departure_date, return_date)
+        self.missed_requests = []
+
+        if self.mode == "record":
+            os.makedirs(self.archive_dir, exist_ok=True)
+            context.route_from_har(self.path, url=self.url_filter, update=True,
+                                   update_content="embed", update_mode="full")
+            logger.info(f"  ● Recording HAR to {self.path}")
+        elif self.mode == "replay":
+            if not os.path.exists(self.path):
+                raise FileNotFoundError(f"No HAR archive for this search: {self.path}")
+            # Routes run last-registered first: unmatched requests fall back to the miss handler
+            context.route("**/*", self._on_miss)
+            context.route_from_har(self.path, url=self.url_filter, not_found="fallback")
+            logger.info(f"  ▶ Replaying HAR from {self.path}")
+        return self.path
+
+    def _on_miss(self, route) -> None:
+        request = route.request
+        self.missed_requests.append({"method": request.method, "url": request.url,
+                                     "resource_type": request.resource_type})
+        route.abort()
+
+    def report(self) -> Dict:
+        by_type: Dict[str, int] = {}
+        for miss in self.missed_requests:
+            by_type[miss["resource_type"]] = by_type.get(miss["resource_type"], 0) + 1
+        return {"mode": self.mode, "archive": self.path,
+                "missed": len(self.missed_requests), "missed_by_type": by_type,
+                "missed_urls": [m["url"] for m in self.missed_requests]}
+
+
+def run_search(browser, query: Dict, mode: str = "replay", archive_dir: str = "har_archives",
+               url: str = "https://www.lufthansa.com/us/en/flight-search",
+               test_logger=None, context_options: Optional[Dict] = None) -> Dict:
+    """
+    Run one HomePage.search_flight under HAR record/replay and extract the price.
+
+    Args:
+        browser: Sync Playwright browser
+        query: search_flight keyword arguments
+        mode: "record" or "replay"
+        test_logger: Optional TestLogger; the search is logged as one step
+
+    Returns:
+        Dict with status, duration_ms, price candidate and the HAR report
+    """
+    from home_page import HomePage
+
+    session = HarSession(mode, archive_dir)
+    context = browser.new_context(**(context_options or {}))
+    origin = query.get("origin_airport") or query["origin_city"]
+    destination = query.get("destination_airport") or query["destination_city"]
+    session.attach(context, origin, destination, query["departure_date"], query.get("return_date"))
+
+    start = time.time()
+    status, error, price = 1, "", None
+    try:
+        home_page = HomePage(context.new_page(), url=url)
+        home_page.open().search_flight(**query)
+        price = home_page.find_price()
+    except Exception as e:
+        status, error = 0, str(e)
+    finally:
+        context.close()  # flushes the recording
+    duration_ms = (time.time() - start) * 1000
+
+    if test_logger:
+        test_logger.log_step(f"Search Flight (HAR {mode})", "har_" + mode, session.path,
+                             status, error, duration_ms, context=query)
+
+    return {"status": status, "error_message": error, "duration_ms": duration_ms,
+            "price": price, "har": session.report()}
+
+
+if __name__ == "__main__":
+    from playwright.sync_api import sync_playwright
+    from ml_logger import TestLogger
+
+    parser = argparse.ArgumentParser(description="Record or replay a search_flight session as HAR")
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("--origin-city", default="New York")
+    parser.add_argument("--destination-city", default="Berlin")
+    parser.add_argument("--origin-airport", default="JFK")
+    parser.add_argument("--destination-airport", default="BER")
+    parser.add_argument("--departure-date", default="12/15/2025")
+    parser.add_argument("--return-date", default="12/25/2025")
+    parser.add_argument("--archive-dir", default="har_archives")
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    query = {
+        "origin_city": args.origin_city, "destination_city": args.destination_city,
+        "origin_airport": args.origin_airport, "destination_airport": args.destination_airport,
+        "departure_date": args.departure_date, "return_date": args.return_date,
+    }
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=not args.headed)
+        try:
+            result = run_search(browser, query, args.mode, args.archive_dir, test_logger=TestLogger())
+        finally:
+            browser.close()
+
+    print(f"\n{'PASS' if result['status'] else 'FAIL'} in {result['duration_ms']:.0f} ms")
+    if result["price"]:
+        print(f"Price: {result['price']['text']}")
+    if args.mode == "replay":
+        print(f"Requests missing from archive: {result['har']['missed']}")
+        for url in result["har"]["missed_urls"][:20]:
+            print(f"   {url}")
@@ -7,9 +7,24 @@ Encapsulates all complexity of the Lufthansa home page including:
 - Trip type selection
 """
 from pages.base_page import BasePage
+from contextlib import nullcontext
 from playwright.sync_api import Page
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from urllib.parse import urlparse
+from airport_cache import AirportCache
+from autocomplete import AutocompleteInput
+from calendar_navigation import enter_date_directly, navigate_to_month
+from consent_state import ConsentStateStore
+from failure_traces import FailureTraceRecorder
+from offer_capture import OfferCapture
+from overlay_suppressor import OverlaySuppressor
+from price_extractor import PriceExtractor
+from selector_cache import StrategyCache
+from tracing import Tracer, set_attribute, traced
+from wait_accounting import WaitLedger, wait_step
+from waits import ReadinessWaiter
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -37,20 +52,108 @@ class HomePage(BasePage):
     CALENDAR_CONTAINER = "div[class*='calendar']"
     MONTH_HEADER = "div[class*='calendar'] h2, div[class*='month'], span[class*='month']"
     NEXT_MONTH_BUTTON = "button[aria-label*='Next'], button[class*='next']"
+    PREV_MONTH_BUTTON = "button[aria-label*='Previous'], button[class*='prev']"
     CALENDAR_DAY_BUTTON = "td[role='gridcell']:not([aria-disabled='true']) button"
     
     # Search
     SEARCH_BUTTON = "button:has-text('Search flights')"
     
+    # Results
+    RESULT_SELECTORS = [
+        "div[class*='flight']",
+        "div[class*='price']",
+        "span[class*='price']",
+        "div[class*='offer']"
+    ]
+    
+    # Raced in one wait by wait_for_results; earlier entries win ties, so the
+    # negative outcomes are checked before the generic containers. Element
+    # signals must be visible and fresh: click_search marks whatever already
+    # matched (form containers, the previous search's rows) so it can't count
+    RESULT_SIGNALS = [
+        {"name": "error", "selector": "[class*='error-banner'], [role='alert'][class*='error']",
+         "visible": True, "fresh": True},
+        {"name": "no_results", "selector": "[class*='no-results'], [class*='noResults']",
+         "visible": True, "fresh": True},
+        {"name": "no_results", "selector": None, "text": "no flights found"},
+    ] + [{"name": f"results:{selector}", "selector": selector, "visible": True, "fresh": True}
+         for selector in RESULT_SELECTORS]
+    
     # Overlays
     CONSENT_BUTTONS = "button"
     
-    def __init__(self, page: Page, url: str = "https://www.lufthansa.com/us/en/flight-search"):
+    # Form fields search_many diffs between queries, in the order they are set
+    FORM_FIELDS = {
+        "trip_type": ROUND_TRIP_RADIO,
+        "origin": ORIGIN_INPUT,
+        "destination": DESTINATION_INPUT,
+        "dates": DATE_INPUT,
+    }
+    # Positional order for tuple queries in search_many
+    SEARCH_ARGS = ("origin_city", "destination_city", "departure_date", "return_date",
+                   "origin_airport", "destination_airport", "trip_type")
+    
+    MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June',
+                   'July', 'August', 'September', 'October', 'November', 'December']
+    
+    def __init__(self, page: Page, url: str = "https://www.lufthansa.com/us/en/flight-search",
+                 consent_store: Optional[ConsentStateStore] = None,
+                 capture_offers: bool = False,
+                 strategy_cache: Optional[StrategyCache] = None,
+                 airport_cache: Optional[AirportCache] = None,
+                 tracer: Optional[Tracer] = None,
+                 failure_traces: Optional[FailureTraceRecorder] = None,
+                 overlay_suppressor: Optional[OverlaySuppressor] = None,
+                 reduced_motion: bool = False,
+                 wait_ledger: Optional[WaitLedger] = None):
         super().__init__(page)
         self.url = url
+        self.waits = ReadinessWaiter(page)
+        self.consent_store = consent_store
+        self.price_extractor = PriceExtractor()
+        self.offer_capture = OfferCapture().attach(page) if capture_offers else None
+        # In-memory unless the caller passes file-backed caches; save_caches() persists them
+        self.strategy_cache = strategy_cache if strategy_cache is not None else StrategyCache()
+        self.site = urlparse(url).netloc
+        self.locale = "/".join(urlparse(url).path.split("/")[1:3])  # e.g. "us/en"
+        self.airport_cache = airport_cache if airport_cache is not None else AirportCache()
+        self.last_strategies: Dict[str, str] = {}  # slot -> winning strategy, for TestLogger
+        self.tracer = tracer  # spans for every action and helper when set
+        self.failure_traces = failure_traces  # keeps a Playwright trace of failed searches
+        self.overlay_suppressor = overlay_suppressor  # dismisses overlays as they appear
+        self.reduced_motion = reduced_motion  # animations off (reduced_motion.install), shorter settle waits
+        self.wait_ledger = wait_ledger  # per-action wait accounting when set
+        self.results_loaded: Optional[bool] = None
+        self.results_signal: Optional[str] = None  # winning wait_for_results signal
+        self.form_state: Dict[str, Any] = {}  # field -> (query value, input values) set by search_many
+        
+    def _use_strategy(self, slot: str, name: str) -> None:
+        """Note the winning strategy for TestLogger and the current trace span."""
+        self.last_strategies[slot] = name
+        set_attribute("strategy", name)
+        
+    def save_caches(self) -> None:
+        """Persist the strategy and airport caches once (file-backed caches only)."""
+        self.strategy_cache.save()
+        self.airport_cache.save()
+        
+    def _settle_listbox(self) -> None:
+        """
+        Wait for the dropdown to close. It still has to close (the widget may
+        hide it from JS), but without animations it does so almost at once,
+        so the ceiling is lower.
+        """
+        self.waits.listbox_hidden(self.DROPDOWN_OPTION, timeout=300 if self.reduced_motion else 1000)
+        
+    @property
+    def offers(self) -> List[Dict]:
+        """Structured offers captured from the search API (capture_offers=True)."""
+        return self.offer_capture.offers if self.offer_capture else []
         
     # ==================== PAGE ACTIONS ====================
     
+    @traced()
+    @wait_step()
     def open(self) -> 'HomePage':
         """
         Navigate to home page and handle initial overlays.
@@ -58,10 +161,45 @@ class HomePage(BasePage):
         """
         logger.info("Opening Lufthansa home page...")
         self.navigate_to(self.url)
-        self.wait_for_timeout(6000)  # Allow page to fully load
+        # Ready once the search form is rendered; network idle is best effort
+        # because analytics beacons can keep the connection busy
+        self.waits.element_visible(self.ORIGIN_INPUT, timeout=15000)
+        self.waits.network_idle(timeout=6000)
         self.remove_overlays()
         return self
         
+    @traced()
+    @wait_step()
+    def remove_overlays(self) -> 'HomePage':
+        """
+        Handle consent/feedback overlays.
+        With a fresh consent snapshot this is a single presence check; the
+        full cleanup only runs when the banner is actually showing, after
+        which the snapshot is re-captured. With an installed overlay
+        suppressor there is nothing to wait for or clean up.
+        """
+        if self.overlay_suppressor is not None and self.overlay_suppressor.installed:
+            logger.info(f"  ✓ Overlay suppressor active ({self.overlay_suppressor.total} dismissed)")
+            if (self.consent_store is not None and self.overlay_suppressor.counts.get("consent_clicked")
+                    and not self.consent_store.is_fresh()):
+                self.consent_store.capture(self.page.context)
+            return self
+            
+        if self.consent_store is None:
+            super().remove_overlays()
+            return self
+            
+        if self.consent_store.is_fresh() and not self.consent_store.banner_present(self.page):
+            logger.info("  ✓ Consent snapshot active, no overlays")
+            return self
+            
+        logger.info("  → Consent banner present, refreshing snapshot...")
+        super().remove_overlays()
+        self.consent_store.capture(self.page.context)
+        return self
+        
+    @traced(args=("trip_type",))
+    @wait_step()
     def select_trip_type(self, trip_type: str = "round_trip") -> 'HomePage':
         """
         Select trip type (round_trip or one_way).
@@ -89,10 +227,14 @@ class HomePage(BasePage):
             }
         """, selector)
         
-        self.wait_for_timeout(500)
+        self.waits.dom_condition(
+            "(selector) => { const r = document.querySelector(selector); return !r || r.checked; }",
+            arg=selector, timeout=500, description="trip type checked")
         logger.info(f"✓ {trip_type.replace('_', ' ').title()} selected")
         return self
         
+    @traced(args=("city", "airport_code"))
+    @wait_step()
     def enter_origin(self, city: str, airport_code: Optional[str] = None) -> 'HomePage':
         """
         Enter origin city and select airport.
@@ -107,17 +249,15 @@ class HomePage(BasePage):
         """
         logger.info(f"Entering origin: {city}")
         
-        origin_field = self.get_element(self.ORIGIN_INPUT).first
-        
-        # Clear and fill
-        logger.info("  → Clearing origin field...")
-        self.clear_input(origin_field)
-        
-        logger.info(f"  → Typing '{city}'...")
-        self.fill_input(origin_field, city, clear_first=False, delay=100)
+        # Cache hit (verified on this site): set the field directly, no
+        # autocomplete round trip. Without a code the site's first suggestion wins
+        if self._apply_cached_airport(self.ORIGIN_INPUT, city, airport_code):
+            return self
         
-        # Wait for dropdown
-        self.wait_for_timeout(2500)
+        # Fill in one step (replaces any previous value) and wait for the option
+        logger.info(f"  → Entering '{city}'...")
+        AutocompleteInput(self.page, self.ORIGIN_INPUT, self.DROPDOWN_OPTION,
+                          self.waits).type_and_wait(city, airport_code, timeout=2500)
         
         # Select airport
         if airport_code:
@@ -133,9 +273,12 @@ class HomePage(BasePage):
             self.page.keyboard.press("Enter")
             logger.info("  ✓ First airport selected")
             
-        self.wait_for_timeout(1000)
+        self._settle_listbox()
+        self._remember_airport(self.ORIGIN_INPUT, city, airport_code)
         return self
         
+    @traced(args=("city", "airport_code"))
+    @wait_step()
     def enter_destination(self, city: str, airport_code: Optional[str] = None) -> 'HomePage':
         """
         Enter destination city and select airport.
@@ -150,39 +293,41 @@ class HomePage(BasePage):
         """
         logger.info(f"Entering destination: {city}")
         
-        dest_field = self.get_element(self.DESTINATION_INPUT).first
-        
-        # Clear and fill
-        logger.info("  → Clearing destination field...")
-        self.clear_input(dest_field)
-        
-        logger.info(f"  → Typing '{city}'...")
-        self.fill_input(dest_field, city, clear_first=False, delay=100)
+        # Cache hit (verified on this site): set the field directly, no
+        # autocomplete round trip. Without a code the site's first suggestion wins
+        if self._apply_cached_airport(self.DESTINATION_INPUT, city, airport_code):
+            return self
         
-        # Wait for dropdown
-        self.wait_for_timeout(2500)
+        # Fill in one step (replaces any previous value) and wait for the option
+        logger.info(f"  → Entering '{city}'...")
+        AutocompleteInput(self.page, self.DESTINATION_INPUT, self.DROPDOWN_OPTION,
+                          self.waits).type_and_wait(city, airport_code, timeout=2500)
         
         # Select airport
         if airport_code:
             logger.info(f"  → Selecting {airport_code}...")
             try:
-                # Try multiple selectors for robustness
-                selectors = [
-                    f"{self.DROPDOWN_OPTION}:has-text('{airport_code}')",
-                    f"{self.DROPDOWN_OPTION}:has-text('{city}')"
-                ]
+                # Try multiple selectors, last winner first
+                selectors = self.strategy_cache.order(self.site, "destination_option", [
+                    (f"{self.DROPDOWN_OPTION}:has-text('{airport_code}')", "airport code"),
+                    (f"{self.DROPDOWN_OPTION}:has-text('{city}')", "city name"),
+                ])
                 
                 selected = False
-                for selector in selectors:
+                for selector, strategy_name in selectors:
                     try:
                         self.get_element(selector).first.click(force=True, timeout=3000)
+                        self.strategy_cache.record(self.site, "destination_option", strategy_name, True)
+                        self._use_strategy("destination_option", strategy_name)
                         selected = True
                         break
                     except Exception:
+                        self.strategy_cache.record(self.site, "destination_option", strategy_name, False)
                         continue
                         
                 if not selected:
                     self.page.keyboard.press("Enter")
+                    self._use_strategy("destination_option", "enter key")
                     
                 logger.info(f"  ✓ {airport_code} selected")
             except Exception:
@@ -192,9 +337,86 @@ class HomePage(BasePage):
             self.page.keyboard.press("Enter")
             logger.info("  ✓ First airport selected")
             
-        self.wait_for_timeout(1000)
+        self._settle_listbox()
+        self._remember_airport(self.DESTINATION_INPUT, city, airport_code)
         return self
         
+    @traced(args=("input_selector",), record_result=True)
+    def _apply_cached_airport(self, input_selector: str, city: str,
+                              airport_code: Optional[str]) -> bool:
+        """
+        Set an airport field from a verified cache entry.
+        Drops the entry when the values do not stick.
+        """
+        entry = self.airport_cache.lookup(city, airport_code, self.locale)
+        if not entry or not entry["verified"] or not entry["form_value"]:
+            return False
+            
+        # Only change/blur are dispatched: an input event would reopen the suggestions.
+        # The values are compared after a frame, once the widget's handlers (and any
+        # re-render) have run; the visible field must show the cached option text.
+        applied = self.page.evaluate("""
+            ([selector, values, label]) => {
+                const field = document.querySelector(selector);
+                if (!field) return false;
+                const scope = field.parentElement || document;
+                const targets = Object.keys(values).map(name =>
+                    [scope.querySelector(`input[name="${CSS.escape(name)}"]`), values[name]]);
+                if (targets.some(([el]) => !el)) return false;
+                targets.forEach(([el, value]) => {
+                    el.value = value;
+                    el.dispatchEvent(new Event('change', { bubbles: true }));
+                });
+                field.dispatchEvent(new Event('blur'));
+                return new Promise(resolve => requestAnimationFrame(() => setTimeout(() => {
+                    const current = document.querySelector(selector);
+                    const currentScope = (current && current.parentElement) || document;
+                    resolve(!!current
+                        && (!label || current.value === label)
+                        && Object.keys(values).every(name => {
+                            const el = currentScope.querySelector(`input[name="${CSS.escape(name)}"]`);
+                            return el && el.value === values[name];
+                        }));
+                }, 0)));
+            }
+        """, [input_selector, entry["form_value"], entry.get("option_text")])
+        
+        if applied:
+            logger.info(f"  ✓ {entry['option_text']} set from airport cache")
+            self._use_strategy(input_selector, "airport cache")
+            return True
+            
+        logger.info("  → Cached airport values did not stick, refreshing entry")
+        self.airport_cache.invalidate(city, airport_code, self.locale)
+        return False
+        
+    @traced(args=("input_selector",))
+    def _remember_airport(self, input_selector: str, city: str, airport_code: Optional[str]) -> None:
+        """Capture the field and its hidden companions after a real selection."""
+        try:
+            captured = self.page.evaluate("""
+                (selector) => {
+                    const field = document.querySelector(selector);
+                    if (!field || !field.value) return null;
+                    const values = {};
+                    (field.parentElement || document).querySelectorAll('input').forEach(el => {
+                        if (el.name && (el === field || el.type === 'hidden')) values[el.name] = el.value;
+                    });
+                    return { text: field.value, values };
+                }
+            """, input_selector)
+            if not captured:
+                return
+            # Don't cache a selection that landed on a different airport
+            if airport_code and not any(airport_code in v for v in captured["values"].values()):
+                return
+            self.airport_cache.store(city, airport_code, self.locale,
+                                     captured["text"], captured["values"])
+        except Exception:
+            logger.debug("  Could not capture airport form values")
+        
+    @traced(args=("departure_date", "return_date"))
+    @wait_step()
     def select_dates(self, departure_date: str, return_date: Optional[str] = None) -> 'HomePage':
         """
         Select travel dates with robust fallback strategies.
@@ -209,20 +431,56 @@ class HomePage(BasePage):
         """
         logger.info(f"Selecting dates: {departure_date} - {return_date}")
         
-        # Try to open calendar
+        # Try the entry paths, fastest known first; each is timed so the
+        # faster one is picked automatically on later searches
+        paths = self.strategy_cache.order(self.site, "date_entry", [
+            (self._enter_dates_directly, "direct entry"),
+            (self._pick_dates_from_calendar, "calendar"),
+        ], by="speed")
+        
+        for path, path_name in paths:
+            start = time.time()
+            if path(departure_date, return_date):
+                self.strategy_cache.record(self.site, "date_entry", path_name, True,
+                                           (time.time() - start) * 1000)
+                self._use_strategy("date_entry", path_name)
+                break
+            self.strategy_cache.record(self.site, "date_entry", path_name, False)
+        else:
+            logger.info("  → Falling back to JS injection...")
+            self._inject_dates_via_js(departure_date, return_date)
+            
+        # Verify dates
+        self._verify_dates(departure_date, return_date)
+        
+        return self
+        
+    @traced(record_result=True)
+    def _enter_dates_directly(self, departure_date: str, return_date: Optional[str] = None) -> bool:
+        """
+        Type the dates into the inputs, when the widget accepts typed dates.
+        Skips calendar navigation entirely.
+        """
+        if not enter_date_directly(self.page, self.DATE_INPUT, 0, departure_date):
+            return False
+        if return_date and not enter_date_directly(self.page, self.DATE_INPUT, 1, return_date):
+            return False
+        logger.info("  ✓ Dates typed into inputs")
+        return True
+        
+    @traced(record_result=True)
+    def _pick_dates_from_calendar(self, departure_date: str, return_date: Optional[str] = None) -> bool:
+        """Open the calendar and click the dates. Returns False if the calendar fails."""
         logger.info("  → Opening calendar...")
         date_field = self.get_element(self.DATE_INPUT).first
         
         try:
             date_field.click(force=True, timeout=5000)
-            self.wait_for_timeout(3000)
+            self.waits.element_visible(self.CALENDAR_CONTAINER, timeout=3000)
         except Exception:
-            logger.warning("  ⚠ Calendar click failed, using JS injection...")
-            # Fallback: Inject dates directly
-            self._inject_dates_via_js(departure_date, return_date)
-            return self
+            logger.warning("  ⚠ Calendar click failed")
+            return False
             
-        # Try to select dates from calendar
         try:
             self._select_date_from_calendar(departure_date, is_departure=True)
             
@@ -230,21 +488,19 @@ class HomePage(BasePage):
                 self._select_date_from_calendar(return_date, is_departure=False)
                 
             logger.info("  ✓ Dates selected from calendar")
+            return True
         except Exception as e:
             logger.warning(f"  ⚠ Calendar selection failed: {e}")
-            logger.info("  → Falling back to JS injection...")
-            self._inject_dates_via_js(departure_date, return_date)
+            return False
             
-        # Verify dates
-        self._verify_dates(departure_date, return_date)
-        
-        return self
-        
+    @traced()
     def _inject_dates_via_js(self, departure_date: str, return_date: Optional[str] = None) -> None:
         """
         Fallback method: Inject dates directly using JavaScript.
         Reduces flakiness when calendar interaction fails.
         """
+        self._use_strategy("calendar_day", "js injection")
+        previous = self.waits.input_values(self.DATE_INPUT)
         self.page.evaluate(f"""
             () => {{
                 const inputs = document.querySelectorAll('input[name*="travelDatetime"]');
@@ -261,9 +517,10 @@ class HomePage(BasePage):
                 }}
             }}
         """)
-        self.wait_for_timeout(2000)
+        self.waits.value_changed(self.DATE_INPUT, previous, timeout=2000)
         logger.info("  ✓ Dates injected via JavaScript")
         
+    @traced(args=("date", "is_departure"))
     def _select_date_from_calendar(self, date: str, is_departure: bool = True) -> None:
         """
         Select a specific date from the calendar widget.
@@ -275,9 +532,7 @@ class HomePage(BasePage):
         """
         # Parse date
         month, day, year = date.split('/')
-        month_names = ['January', 'February', 'March', 'April', 'May', 'June',
-                      'July', 'August', 'September', 'October', 'November', 'December']
-        month_name = month_names[int(month) - 1]
+        month_name = self.MONTH_NAMES[int(month) - 1]
         
         date_type = "departure" if is_departure else "return"
         logger.info(f"  → Selecting {date_type} date: {month_name} {day}, {year}")
@@ -288,62 +543,56 @@ class HomePage(BasePage):
         # Click the day
         self._click_calendar_day(day, month_name, year)
         
+    @traced(args=("month_name", "year"))
     def _navigate_to_month(self, month_name: str, year: str, max_attempts: int = 12) -> None:
-        """Navigate calendar to the correct month and year"""
-        for attempt in range(max_attempts):
-            try:
-                month_header = self.get_element(self.MONTH_HEADER).first
-                header_text = self.get_text(month_header, timeout=2000)
-                
-                if month_name in header_text and year in header_text:
-                    logger.info(f"  ✓ Found {month_name} {year}")
-                    return
-                    
-                # Click next month
-                next_btn = self.get_element(self.NEXT_MONTH_BUTTON).first
-                next_btn.click(force=True, timeout=2000)
-                self.wait_for_timeout(1000)
-            except Exception:
-                break
-                
-        logger.warning(f"  ⚠ Could not navigate to {month_name} {year}")
+        """Jump the calendar to the correct month and year in one batch"""
+        navigate_to_month(self.page, month_name, year, self.MONTH_HEADER,
+                          self.NEXT_MONTH_BUTTON, self.PREV_MONTH_BUTTON, max_attempts)
         
+    @traced(args=("day", "month_name", "year"))
     def _click_calendar_day(self, day: str, month_name: str, year: str) -> None:
         """
         Click a specific day in the calendar.
         Uses multiple strategies for robustness.
+        
+        Raises:
+            RuntimeError: No strategy changed the date input
         """
         day = str(int(day))  # Remove leading zero
+        month_number = self.MONTH_NAMES.index(month_name) + 1
         
-        # Multiple selection strategies
-        strategies = [
+        # Multiple selection strategies, ordered by what worked last time
+        strategies = self.strategy_cache.order(self.site, "calendar_day", [
             (f"button[aria-label*='{month_name} {day}, {year}']", "aria-label exact"),
             (f"button[aria-label*='{day} {month_name} {year}']", "aria-label alternate"),
-            (f"button:has-text('{day}')", "text content"),
-            (f"td[data-date='{year}-{int(month_name):02d}-{int(day):02d}'] button", "data attribute"),
-        ]
+            (f"button:text-is('{day}')", "text content"),
+            (f"td[data-date='{year}-{month_number:02d}-{int(day):02d}'] button", "data attribute"),
+        ])
         
         for selector, strategy_name in strategies:
             try:
                 buttons = self.get_elements(selector)
                 for btn in buttons:
                     if self.is_visible(btn, timeout=1000):
+                        previous = self.waits.input_values(self.DATE_INPUT)
                         btn.click(force=True)
+                        if not self.waits.value_changed(self.DATE_INPUT, previous, timeout=2000):
+                            continue
                         logger.info(f"  ✓ Day {day} selected (via {strategy_name})")
-                        self.wait_for_timeout(2000)
+                        self.strategy_cache.record(self.site, "calendar_day", strategy_name, True)
+                        self._use_strategy("calendar_day", strategy_name)
+                        set_attribute("selector", selector)
                         return
             except Exception:
-                continue
+                pass
+            self.strategy_cache.record(self.site, "calendar_day", strategy_name, False)
                 
-        # Fallback: Use first available date
-        logger.warning(f"  ⚠ Could not find day {day}, using first available")
-        try:
-            first_day = self.get_element(self.CALENDAR_DAY_BUTTON).first
-            first_day.click(force=True)
-            self.wait_for_timeout(2000)
-        except Exception:
-            pass
+        # Clicking some other day would pass as a calendar win with the wrong
+        # date; fail so select_dates falls through to the next entry path
+        logger.warning(f"  ⚠ Could not find day {day}")
+        raise RuntimeError(f"Calendar day {month_name} {day}, {year} not found")
             
+    @traced()
     def _verify_dates(self, departure_date: str, return_date: Optional[str] = None) -> None:
         """Verify that dates were set correctly"""
         logger.info("  → Verifying dates...")
@@ -363,6 +612,8 @@ class HomePage(BasePage):
         except Exception:
             logger.warning("  ⚠ Could not verify dates")
             
+    @traced()
+    @wait_step()
     def click_search(self) -> 'HomePage':
         """
         Click the search button with fallback strategies.
@@ -371,6 +622,11 @@ class HomePage(BasePage):
             self for method chaining
         """
         logger.info("Clicking search button...")
+        self.results_loaded = None
+        self.results_signal = None
+        if self.offer_capture:
+            self.offer_capture.reset()
+        self.waits.mark_existing(self.RESULT_SIGNALS)
         
         try:
             search_btn = self.get_element(self.SEARCH_BUTTON).first
@@ -389,44 +645,75 @@ class HomePage(BasePage):
             
         return self
         
+    @traced(args=("timeout",))
+    @wait_step()
     def wait_for_results(self, timeout: int = 20000) -> 'HomePage':
         """
         Wait for search results to load.
+        Races every result container against the "no flights found" and
+        error-banner outcomes in one wait; the winner is kept in
+        results_signal ("offers", "results:<selector>", "no_results",
+        "error" or None on timeout).
         
         Args:
-            timeout: Timeout in milliseconds
+            timeout: Ceiling in milliseconds
             
         Returns:
             self for method chaining
         """
-        logger.info(f"Waiting for results ({timeout/1000}s)...")
-        self.wait_for_timeout(timeout)
-        
-        # Check if results loaded
+        logger.info(f"Waiting for results (up to {timeout/1000}s)...")
+        
+        # Response-listener mode: done as soon as the offer JSON is parsed
+        if self.offer_capture:
+            if self.offer_capture.wait(timeout=timeout):
+                logger.info(f"  ✓ {len(self.offers)} offers captured from search API")
+                self.results_loaded = True
+                self.results_signal = "offers"
+                set_attribute("signal", self.results_signal)
+                return self
+            logger.warning("  ⚠ No offer response captured, checking DOM...")
+            timeout = 1000
+        
+        self.results_loaded = False
         try:
-            result_selectors = [
-                "div[class*='flight']",
-                "div[class*='price']",
-                "span[class*='price']",
-                "div[class*='offer']"
-            ]
-            
-            for selector in result_selectors:
-                try:
-                    self.wait_for_selector(selector, timeout=5000)
-                    logger.info("  ✓ Results page loaded")
-                    return self
-                except Exception:
-                    continue
-                    
-            logger.warning("  ⚠ Results detection timeout")
+            self.results_signal = self.waits.first_signal(self.RESULT_SIGNALS, timeout=timeout)
+            set_attribute("signal", self.results_signal)
+            if self.results_signal is None:
+                logger.warning("  ⚠ Results detection timeout")
+            elif self.results_signal.startswith("results"):
+                self.results_loaded = True
+                logger.info(f"  ✓ Results page loaded ({self.results_signal})")
+            elif self.results_signal == "no_results":
+                logger.warning("  ⚠ No flights found for this search")
+            else:
+                logger.warning("  ⚠ Search returned an error banner")
         except Exception:
             logger.warning("  ⚠ Could not verify results loaded")
             
         return self
         
+    @traced()
+    def extract_prices(self) -> List[Dict]:
+        """
+        Collect every price candidate on the results page in one round trip.
+        
+        Returns:
+            List of dicts with amount, currency, text, selector and position
+        """
+        return self.price_extractor.extract(self.page)
+        
+    @traced(args=("currency", "min_amount"))
+    def find_price(self, currency: Optional[str] = "USD", min_amount: float = 300,
+                   max_amount: Optional[float] = None) -> Optional[Dict]:
+        """
+        Return the first plausible price on the results page, or None.
+        See PriceExtractor.find_price for the bounds.
+        """
+        return self.price_extractor.find_price(self.page, currency, min_amount, max_amount)
+        
     # ==================== COMPLETE SEARCH FLOW ====================
     
+    @traced(args=("origin_city", "destination_city", "trip_type"))
     def search_flight(self, origin_city: str, destination_city: str,
                      departure_date: str, return_date: Optional[str] = None,
                      origin_airport: Optional[str] = None,
@@ -464,17 +751,161 @@ class HomePage(BasePage):
         logger.info(f"Dates: {departure_date} - {return_date}")
         logger.info("=" * 70)
         
-        # Execute search flow
-        (self
-            .select_trip_type(trip_type)
-            .enter_origin(origin_city, origin_airport)
-            .enter_destination(destination_city, destination_airport)
-            .select_dates(departure_date, return_date)
-            .click_search()
-            .wait_for_results())
+        # Execute search flow; with failure_traces set, the trace is kept only if it fails
+        label = f"{origin_airport or origin_city}-{destination_airport or destination_city} {departure_date}"
+        with (self.failure_traces.search(label) if self.failure_traces else nullcontext()) as chunk:
+            (self
+                .select_trip_type(trip_type)
+                .enter_origin(origin_city, origin_airport)
+                .enter_destination(destination_city, destination_airport)
+                .select_dates(departure_date, return_date)
+                .click_search()
+                .wait_for_results())
+            if chunk is not None and not self.results_loaded:
+                chunk.fail("Results did not load")
             
         logger.info("=" * 70)
         logger.info("SEARCH COMPLETED")
         logger.info("=" * 70)
         
         return self
+        
+    # ==================== MULTI-SEARCH ====================
+    
+    def _read_form(self) -> Dict[str, List[str]]:
+        """Current input values of every FORM_FIELDS entry in one round trip (radios as checked)."""
+        return self.page.evaluate("""
+            (fields) => Object.fromEntries(Object.entries(fields).map(([name, selector]) => [
+                name,
+                Array.from(document.querySelectorAll(selector))
+                    .map(i => i.type === 'radio' ? String(i.checked) : i.value),
+            ]))
+        """, self.FORM_FIELDS)
+        
+    def _changed_fields(self, wanted: Dict[str, Any]) -> List[str]:
+        """
+        Fields whose wanted value differs from what search_many last set, or
+        whose inputs no longer hold what was set (e.g. the page reloaded).
+        """
+        on_page = self._read_form() if self.form_state else {}
+        changed = []
+        for field in self.FORM_FIELDS:
+            previous = self.form_state.get(field)
+            if previous is None or previous[0] != wanted[field] or previous[1] != on_page.get(field):
+                changed.append(field)
+        # The return-date input follows the trip type
+        if "trip_type" in changed and "dates" not in changed:
+            changed.append("dates")
+        return changed
+        
+    @traced(args=("timeout",), record_result=True)
+    @wait_step()
+    def return_to_form(self, timeout: int = 5000) -> bool:
+        """
+        Go back from the results to the search form without reloading it.
+        Falls back to open() (and forgets the form state) when history
+        navigation does not bring the form back.
+        
+        Returns:
+            True if the form came back through history, False if reloaded
+        """
+        try:
+            self.page.go_back(wait_until="commit", timeout=timeout)
+        except Exception:
+            logger.debug("  History navigation failed")
+        if self.waits.element_visible(self.ORIGIN_INPUT, timeout=timeout):
+            logger.info("  ✓ Back on the search form")
+            return True
+        logger.warning("  ⚠ Form not restored from history, reloading...")
+        self.form_state = {}
+        self.open()
+        return False
+        
+    @traced()
+    def search_many(self, queries: Sequence[Union[Dict, Sequence]],
+                    collect: Optional[Callable[['HomePage'], Any]] = None) -> List[Dict]:
+        """
+        Run several searches on one form page, editing only the fields that
+        differ from the previous query. Call open() first.
+        
+        Args:
+            queries: search_flight keyword dicts, or tuples in SEARCH_ARGS
+                order, e.g. ("New York", "Berlin", "12/15/2025", "12/25/2025")
+            collect: Called on the results page of each search; its return
+                value is stored under "result" (e.g. lambda p: p.find_price())
+            
+        Returns:
+            One dict per query with query, status (1/0), error_message,
+            changed fields, results_loaded, signal, result and duration_ms.
+            A failed query is recorded and the batch continues
+            
+        Example:
+            home_page.open().search_many([
+                ("New York", "Berlin", "12/15/2025", "12/25/2025", "JFK", "BER"),
+                ("New York", "Berlin", "12/16/2025", "12/26/2025", "JFK", "BER"),
+            ], collect=lambda p: p.find_price())
+        """
+        set_attribute("queries", len(queries))
+        runs = []
+        for position, query in enumerate(queries):
+            query = dict(query) if isinstance(query, dict) else dict(zip(self.SEARCH_ARGS, query))
+            start = time.time()
+            changed: List[str] = []
+            result = None
+            try:
+                if position > 0:
+                    self.return_to_form()
+                    
+                wanted = {
+                    "trip_type": query.get("trip_type", "round_trip"),
+                    "origin": (query["origin_city"], query.get("origin_airport")),
+                    "destination": (query["destination_city"], query.get("destination_airport")),
+                    "dates": (query["departure_date"], query.get("return_date")),
+                }
+                changed = self._changed_fields(wanted)
+                logger.info(f"Search {position + 1}/{len(queries)}: "
+                            f"{query['origin_city']} → {query['destination_city']} "
+                            f"{query['departure_date']} - {query.get('return_date')} "
+                            f"(editing {', '.join(changed) or 'nothing'})")
+                
+                label = (f"{query.get('origin_airport') or query['origin_city']}-"
+                         f"{query.get('destination_airport') or query['destination_city']} "
+                         f"{query['departure_date']}")
+                with (self.failure_traces.search(label) if self.failure_traces else nullcontext()) as chunk:
+                    if "trip_type" in changed:
+                        self.select_trip_type(wanted["trip_type"])
+                    if "origin" in changed:
+                        self.enter_origin(*wanted["origin"])
+                    if "destination" in changed:
+                        self.enter_destination(*wanted["destination"])
+                    if "dates" in changed:
+                        self.select_dates(*wanted["dates"])
+                        
+                    on_page = self._read_form()
+                    self.form_state = {field: (wanted[field], on_page.get(field))
+                                       for field in self.FORM_FIELDS}
+                    
+                    self.click_search().wait_for_results()
+                    if chunk is not None and not self.results_loaded:
+                        chunk.fail("Results did not load")
+                    if collect is not None:
+                        result = collect(self)
+                status, error = 1, ""
+            except Exception as e:
+                # The form is in an unknown state: re-enter every field next time
+                logger.warning(f"  ⚠ Search {position + 1}/{len(queries)} failed: {e}")
+                self.form_state = {}
+                self.results_loaded, self.results_signal = False, None
+                status, error = 0, str(e)
+                
+            runs.append({
+                "query": query,
+                "status": status,
+                "error_message": error,
+                "changed": changed,
+                "results_loaded": self.results_loaded,
+                "signal": self.results_signal,
+                "result": result,
+                "duration_ms": (time.time() - start) * 1000,
+            })
+        return runs
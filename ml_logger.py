@@ -3,6 +3,15 @@ import os
 from datetime import datetime
 import uuid
 
+COLUMNS = [
+    "timestamp", "run_id", "step_name", "action_type",
+    "selector", "status", "error_message", "duration_ms", "context", "strategy",
+    "wait_slept_ms", "wait_met_ms", "wait_timeout_ms"
+]
+
+# action_type of the per-step rows written by log_waits()
+WAITS_ACTION_TYPE = "waits"
+
 class TestLogger:
     def __init__(self, filepath="test_history.csv"):
         self.filepath = filepath
@@ -11,14 +20,25 @@ class TestLogger:
         
         # Initialize file with headers if it doesn't exist
         if not os.path.exists(self.filepath):
-            df = pd.DataFrame(columns=[
-                "timestamp", "run_id", "step_name", "action_type", 
-                "selector", "status", "error_message", "duration_ms"
-            ])
+            df = pd.DataFrame(columns=COLUMNS)
             df.to_csv(self.filepath, index=False)
+        else:
+            self._migrate_columns()
 
-    def log_step(self, step_name, action_type, selector, status, error_msg="", duration_ms=0, context=None):
-        """Log a single test step with optional context (e.g., dates used)"""
+    def _migrate_columns(self):
+        """Add columns introduced after the file was created so appended rows line up"""
+        df = pd.read_csv(self.filepath)
+        missing = [col for col in COLUMNS if col not in df.columns]
+        if missing:
+            for col in missing:
+                df[col] = ""
+            df[COLUMNS].to_csv(self.filepath, index=False)
+
+    def log_step(self, step_name, action_type, selector, status, error_msg="", duration_ms=0, context=None,
+                 strategy="", waits=None):
+        """Log a single test step with optional context (e.g., dates used) and the selector strategy that won.
+        waits is the step's WaitLedger totals (slept / met / timed-out ms)"""
+        waits = waits or {}
         entry = {
             "timestamp": datetime.now().isoformat(),
             "run_id": self.run_id,
@@ -28,16 +48,28 @@ class TestLogger:
             "status": status,  # 1 for success, 0 for failure
             "error_message": str(error_msg).replace("\n", " ")[:200],
             "duration_ms": duration_ms,
-            "context": str(context) if context else ""
+            "context": str(context) if context else "",
+            "strategy": strategy or "",
+            "wait_slept_ms": round(waits.get("slept_ms", 0.0), 1),
+            "wait_met_ms": round(waits.get("met_ms", 0.0), 1),
+            "wait_timeout_ms": round(waits.get("timeout_ms", 0.0), 1)
         }
         self.logs.append(entry)
         
         # Append immediately to file
-        df = pd.DataFrame([entry])
+        df = pd.DataFrame([entry], columns=COLUMNS)
         # Check if file exists to write header
         header = not os.path.exists(self.filepath)
         df.to_csv(self.filepath, mode='a', header=header, index=False)
         print(f"   [ML-LOG] Recorded step: {step_name} -> {'PASS' if status else 'FAIL'}")
 
+    def log_waits(self, ledger):
+        """Add one row per step of a WaitLedger (slept / met / timed-out ms per step)"""
+        for step_name, totals in ledger.summary().items():
+            self.log_step(step_name, WAITS_ACTION_TYPE, "", 1,
+                          f"{totals['timeouts']} wait(s) timed out" if totals["timeouts"] else "",
+                          round(totals["slept_ms"] + totals["met_ms"] + totals["timeout_ms"], 1),
+                          waits=totals)
+
     def get_history(self):
         return pd.read_csv(self.filepath)
@@ -0,0 +1,202 @@
+"""
+Offer Capture
+Response-listener mode for the search flow. The results page is filled from
+XHR/fetch JSON; capturing that JSON as it arrives gives structured offers
+(flights, fares, currencies) without waiting for the DOM to render and
+without re-scanning it.
+
+The payload schema is not published, so parsing is structural:
+- fare   = any object with a numeric amount-like key and a currency-like key
+- flight = any object with a flight number, or both origin and destination
+- offer  = each element of the outermost list whose elements contain fares
+"""
+from fnmatch import fnmatch
+from typing import Any, Dict, Iterable, List, Optional
+from wait_accounting import accounted
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_URL_PATTERNS = (
+    "*offer*",
+    "*air-bounds*",
+    "*airbounds*",
+    "*fare*",
+    "*availability*",
+    "*flight-search*",
+)
+
+AMOUNT_KEYS = ("amount", "total", "totalPrice", "totalAmount", "price", "value")
+CURRENCY_KEYS = ("currency", "currencyCode")
+FLIGHT_NUMBER_KEYS = ("flightNumber", "flightNo", "marketingFlightNumber")
+ORIGIN_KEYS = ("origin", "originLocationCode", "departureAirport", "from")
+DESTINATION_KEYS = ("destination", "destinationLocationCode", "arrivalAirport", "to")
+FLIGHT_FIELDS = ORIGIN_KEYS + DESTINATION_KEYS + FLIGHT_NUMBER_KEYS + (
+    "departureDateTime", "arrivalDateTime", "departure", "arrival",
+    "marketingAirlineCode", "carrier", "duration")
+
+
+def _first(node: Dict, keys: Iterable[str]) -> Any:
+    for key in keys:
+        if key in node and node[key] not in (None, ""):
+            return node[key]
+    return None
+
+
+def _as_fare(node: Dict) -> Optional[Dict]:
+    currency = _first(node, CURRENCY_KEYS)
+    amount = _first(node, AMOUNT_KEYS)
+    if isinstance(amount, dict):
+        # {"total": {"value": 845.2, "currencyCode": "USD"}} is handled when the walk reaches it
+        return None
+    try:
+        amount = float(amount)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(currency, str):
+        return None
+    return {"amount": amount, "currency": currency}
+
+
+def _is_flight(node: Dict) -> bool:
+    return _first(node, FLIGHT_NUMBER_KEYS) is not None or (
+        _first(node, ORIGIN_KEYS) is not None and _first(node, DESTINATION_KEYS) is not None)
+
+
+def _walk(node: Any, fares: List[Dict], flights: List[Dict]) -> None:
+    if isinstance(node, dict):
+        fare = _as_fare(node)
+        if fare:
+            fares.append(fare)
+        if _is_flight(node):
+            flights.append({k: node[k] for k in FLIGHT_FIELDS
+                            if k in node and not isinstance(node[k], (dict, list))})
+        for value in node.values():
+            _walk(value, fares, flights)
+    elif isinstance(node, list):
+        for item in node:
+            _walk(item, fares, flights)
+
+
+def _offer_list(node: Any) -> Optional[List]:
+    """Breadth-first search for the outermost list whose elements all carry fares."""
+    queue = [node]
+    while queue:
+        current = queue.pop(0)
+        if isinstance(current, list) and current and all(isinstance(i, dict) for i in current):
+            if all(_fares_in(item) for item in current):
+                return current
+        children = current.values() if isinstance(current, dict) else \
+            current if isinstance(current, list) else []
+        queue.extend(c for c in children if isinstance(c, (dict, list)))
+    return None
+
+
+def _fares_in(node: Any) -> List[Dict]:
+    fares: List[Dict] = []
+    _walk(node, fares, [])
+    return fares
+
+
+def parse_offers(payload: Any) -> List[Dict]:
+    """
+    Turn a search-response JSON payload into structured offers.
+
+    Returns:
+        List of {"price", "currency", "fares", "flights"} dicts, where price
+        is the lowest fare in the offer
+    """
+    items = _offer_list(payload)
+    if items is None:
+        return []
+
+    offers = []
+    for item in items:
+        fares: List[Dict] = []
+        flights: List[Dict] = []
+        _walk(item, fares, flights)
+        cheapest = min(fares, key=lambda f: f["amount"])
+        offers.append({
+            "price": cheapest["amount"],
+            "currency": cheapest["currency"],
+            "fares": fares,
+            "flights": flights,
+        })
+    return offers
+
+
+class OfferCapture:
+    """
+    Listens to page responses and parses offer/fare JSON once, as it arrives.
+
+    Example:
+        capture = OfferCapture().attach(page)
+        ... click search ...
+        if capture.wait(timeout=20000):
+            print(capture.offers[0]["price"], capture.offers[0]["currency"])
+    """
+
+    def __init__(self, url_patterns: Iterable[str] = DEFAULT_URL_PATTERNS):
+        self.url_patterns = list(url_patterns)
+        self.offers: List[Dict] = []
+        self.responses_parsed = 0
+        self.page = None
+
+    def attach(self, page) -> 'OfferCapture':
+        """Start listening on page."""
+        self.page = page
+        page.on("response", self._on_response)
+        return self
+
+    def detach(self) -> None:
+        if self.page:
+            self.page.remove_listener("response", self._on_response)
+            self.page = None
+
+    def reset(self) -> None:
+        """Forget offers from a previous search."""
+        self.offers = []
+
+    def is_candidate(self, response) -> bool:
+        """Cheap header/URL check before any body is read."""
+        if response.request.resource_type not in ("xhr", "fetch"):
+            return False
+        if "json" not in response.headers.get("content-type", ""):
+            return False
+        return any(fnmatch(response.url, pattern) for pattern in self.url_patterns)
+
+    def _on_response(self, response) -> None:
+        if not self.is_candidate(response) or not response.ok:
+            return
+        try:
+            payload = response.json()
+        except Exception:
+            return
+        self.responses_parsed += 1
+        offers = parse_offers(payload)
+        if offers:
+            logger.info(f"  ✓ Captured {len(offers)} offers from {response.url}")
+            self.offers.extend(offers)
+
+    def has_offers(self) -> bool:
+        return bool(self.offers)
+
+    @accounted("offer_response")
+    def wait(self, timeout: int = 20000) -> bool:
+        """
+        Block until offers were captured, up to timeout ms.
+
+        Listeners registered with attach() run before this predicate, so the
+        predicate only has to look at what was already parsed.
+        """
+        if self.has_offers():
+            return True
+        try:
+            self.page.wait_for_event("response", predicate=lambda r: self.has_offers(),
+                                     timeout=timeout)
+            return True
+        except Exception:
+            return self.has_offers()
+
+    def cheapest(self) -> Optional[Dict]:
+        return min(self.offers, key=lambda o: o["price"]) if self.offers else None
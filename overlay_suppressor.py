@@ -0,0 +1,148 @@
+"""
+Overlay Suppressor
+Dismisses the consent banner, the Tealium GDPR preferences layer and the
+feedback widget the moment they enter the page, instead of polling for them
+after every navigation.
+
+Installed once per context: an init script starts a MutationObserver in
+every page and frame before the site's own scripts run. Each batch of added
+nodes (or a known overlay being unhidden) triggers one sweep that clicks
+the consent accept button, removes the overlay elements and closes the
+feedback links. Every dismissal is reported back to Python through an
+exposed binding, so get_stats() needs no page round trip.
+
+Usage:
+    suppressor = OverlaySuppressor().install(context)
+    HomePage(context.new_page(), overlay_suppressor=suppressor).open()
+    print(suppressor.get_stats())
+"""
+from typing import Dict, Iterable
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+BINDING_NAME = "__lhOverlaySuppressed"
+
+DEFAULT_OVERLAY_IDS = ("consentOverlay", "__tealiumGDPRcpPrefs")
+DEFAULT_CLOSE_SELECTORS = ('a[aria-label*="Close feedback"]',)
+DEFAULT_CONSENT_TEXTS = ("agree", "accept", "consent")
+
+SUPPRESSOR_JS = """
+(config) => {
+    if (window.__lhOverlaySuppressor) return;
+    const state = window.__lhOverlaySuppressor = { counts: {} };
+    const report = (kind, detail) => {
+        state.counts[kind] = (state.counts[kind] || 0) + 1;
+        try { window[config.binding] && window[config.binding](kind, detail); } catch (e) {}
+    };
+    const consentButtons = config.ids.map(id => `#${CSS.escape(id)} button`)
+        .concat(["[id*='consent'] button", "[class*='consent'] button"]).join(', ');
+
+    const sweep = () => {
+        document.querySelectorAll(consentButtons).forEach(btn => {
+            if (btn.dataset.lhSuppressed) return;
+            const text = btn.textContent.toLowerCase();
+            if (!config.consentTexts.some(t => text.includes(t))) return;
+            btn.dataset.lhSuppressed = '1';
+            try { btn.click(); report('consent_clicked', text.trim().slice(0, 40)); } catch (e) {}
+        });
+        config.ids.forEach(id => {
+            const el = document.getElementById(id);
+            if (el) { el.remove(); report('overlay_removed', id); }
+        });
+        document.querySelectorAll(config.closeSelectors.join(', ')).forEach(el => {
+            if (el.dataset.lhSuppressed) return;
+            el.dataset.lhSuppressed = '1';
+            try { el.click(); report('feedback_closed', el.getAttribute('aria-label') || ''); } catch (e) {}
+        });
+    };
+
+    // One sweep per mutation batch, and only when something relevant changed
+    const observer = new MutationObserver(mutations => {
+        if (mutations.some(m => m.type === 'attributes'
+                ? config.ids.includes(m.target.id)
+                : Array.from(m.addedNodes).some(n => n.nodeType === 1))) {
+            sweep();
+        }
+    });
+    observer.observe(document, {
+        childList: true, subtree: true,
+        attributes: true, attributeFilter: ['hidden', 'style', 'class'],
+    });
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', sweep, { once: true });
+    } else {
+        sweep();
+    }
+}
+"""
+
+
+class OverlaySuppressor:
+    """
+    Init-script overlay dismissal with per-context counters.
+
+    Args:
+        overlay_ids: Element ids removed as soon as they appear
+        close_selectors: Feedback widget close links clicked once each (keep
+            these specific: a generic "Close" would hit dialogs and menus)
+        consent_texts: Lower-case button texts that accept consent (only
+            buttons inside the overlays or consent containers are clicked)
+    """
+
+    def __init__(self, overlay_ids: Iterable[str] = DEFAULT_OVERLAY_IDS,
+                 close_selectors: Iterable[str] = DEFAULT_CLOSE_SELECTORS,
+                 consent_texts: Iterable[str] = DEFAULT_CONSENT_TEXTS):
+        self.config = {
+            "ids": list(overlay_ids),
+            "closeSelectors": list(close_selectors),
+            "consentTexts": list(consent_texts),
+            "binding": BINDING_NAME,
+        }
+        self.installed = False
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Start a new run."""
+        self.counts: Dict[str, int] = {}
+        self.dismissed_by_target: Dict[str, int] = {}
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def script(self) -> str:
+        """The init script with this suppressor's configuration bound in."""
+        return f"({SUPPRESSOR_JS})({json.dumps(self.config)});"
+
+    def _on_suppressed(self, source, kind: str, detail: str) -> None:
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        self.dismissed_by_target[detail] = self.dismissed_by_target.get(detail, 0) + 1
+        logger.debug(f"  Overlay suppressed: {kind} ({detail})")
+
+    def install(self, target) -> 'OverlaySuppressor':
+        """
+        Install on a BrowserContext (every page it opens) or a single page.
+        Pages that already exist get the observer immediately as well.
+
+        Args:
+            target: Context or page
+        """
+        target.expose_binding(BINDING_NAME, self._on_suppressed)
+        target.add_init_script(script=self.script())
+        pages = getattr(target, "pages", None)
+        for page in pages if pages is not None else [target]:
+            try:
+                page.evaluate(SUPPRESSOR_JS, self.config)
+            except Exception:
+                logger.debug("  Could not start overlay observer on an open page")
+        self.installed = True
+        return self
+
+    def get_stats(self) -> Dict:
+        return {
+            "dismissed": self.total,
+            "by_kind": dict(self.counts),
+            "by_target": dict(self.dismissed_by_target),
+        }
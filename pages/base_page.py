@@ -0,0 +1,147 @@
+"""
+Base Page Object
+Playwright helpers shared by the page objects:
+- Navigation and element lookup
+- Input handling (clear, type, dropdown selection)
+- Visibility checks and waits
+- Consent/feedback overlay cleanup
+"""
+from playwright.sync_api import Locator, Page
+from typing import List, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Overlays that block clicks on the search form
+OVERLAY_IDS = ["consentOverlay", "__tealiumGDPRcpPrefs"]
+CONSENT_BUTTON = ("#consentOverlay button:has-text('Agree'), "
+                  "#consentOverlay button:has-text('Accept'), "
+                  "#__tealiumGDPRcpPrefs button:has-text('Accept')")
+FEEDBACK_CLOSE = 'a[aria-label*="Close feedback"]'
+
+REMOVE_OVERLAYS_JS = """
+    ([ids, feedbackClose]) => {
+        ids.forEach(id => {
+            const el = document.getElementById(id);
+            if (el) el.remove();
+        });
+        const close = document.querySelector(feedbackClose);
+        if (close) close.click();
+    }
+"""
+
+
+class BasePage:
+    """
+    Base class for page objects.
+    Wraps the Playwright page with the lookups and input helpers the
+    page objects build on.
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    # ==================== NAVIGATION ====================
+
+    def navigate_to(self, url: str) -> None:
+        """Open url and wait for the DOM, not for every subresource."""
+        logger.info(f"  → Navigating to {url}")
+        self.page.goto(url, wait_until="domcontentloaded")
+
+    # ==================== ELEMENTS ====================
+
+    def get_element(self, selector: str) -> Locator:
+        """Locator for selector (use .first / .nth() to pick a match)."""
+        return self.page.locator(selector)
+
+    def get_elements(self, selector: str) -> List[Locator]:
+        """One locator per element currently matching selector."""
+        return self.page.locator(selector).all()
+
+    def get_text(self, element: Union[str, Locator], timeout: int = 5000) -> str:
+        """Visible text of an element or the first match of a selector."""
+        return self._locator(element).inner_text(timeout=timeout)
+
+    def is_visible(self, element: Union[str, Locator], timeout: int = 0) -> bool:
+        """
+        Whether an element is visible, waiting up to timeout ms for it.
+
+        Args:
+            element: Locator or selector (first match)
+            timeout: Milliseconds to wait; 0 checks once
+        """
+        locator = self._locator(element)
+        if not timeout:
+            return locator.is_visible()
+        try:
+            locator.wait_for(state="visible", timeout=timeout)
+            return True
+        except Exception:
+            return False
+
+    def _locator(self, element: Union[str, Locator]) -> Locator:
+        return self.page.locator(element).first if isinstance(element, str) else element
+
+    # ==================== INPUT ====================
+
+    def clear_input(self, element: Union[str, Locator]) -> None:
+        """Empty a text input, including values the widget restores on focus."""
+        field = self._locator(element)
+        field.click(force=True)
+        field.fill("")
+        self.page.keyboard.press("Control+A")
+        self.page.keyboard.press("Backspace")
+
+    def fill_input(self, element: Union[str, Locator], text: str, clear_first: bool = True,
+                   delay: int = 0) -> None:
+        """
+        Type text into an input.
+
+        Args:
+            element: Locator or selector (first match)
+            text: Text to enter
+            clear_first: Empty the input before typing
+            delay: Milliseconds between key presses (0 fills in one step)
+        """
+        field = self._locator(element)
+        if clear_first:
+            self.clear_input(field)
+        if delay:
+            field.press_sequentially(text, delay=delay)
+        else:
+            field.fill(text)
+
+    def select_from_dropdown(self, text: str, option_selector: str, timeout: int = 3000) -> None:
+        """
+        Click the first dropdown option containing text.
+        Raises if no such option shows up within timeout.
+        """
+        option = self.page.locator(option_selector).filter(has_text=text).first
+        option.click(timeout=timeout)
+
+    # ==================== WAITS ====================
+
+    def wait_for_selector(self, selector: str, timeout: int = 5000, state: str = "visible") -> None:
+        self.page.wait_for_selector(selector, timeout=timeout, state=state)
+
+    def wait_for_timeout(self, ms: int) -> None:
+        self.page.wait_for_timeout(ms)
+
+    # ==================== OVERLAYS ====================
+
+    def remove_overlays(self) -> None:
+        """
+        Accept cookie consent if the banner is up, then remove the overlay
+        elements and close the feedback form.
+        """
+        try:
+            consent = self.page.locator(CONSENT_BUTTON).first
+            if consent.is_visible():
+                consent.click(timeout=2000)
+                logger.info("  ✓ Cookie consent accepted")
+        except Exception:
+            logger.debug("  No consent button to click")
+        try:
+            self.page.evaluate(REMOVE_OVERLAYS_JS, [OVERLAY_IDS, FEEDBACK_CLOSE])
+        except Exception:
+            logger.debug("  Could not remove overlays")
@@ -0,0 +1,138 @@
+"""
+Price Extractor
+Collects every price candidate on the results page in a single
+page.evaluate round trip, instead of one inner_text() IPC call per element
+(each of which could burn a full timeout on a missing element) plus a
+page.content() download for the regex fallback.
+
+Each candidate carries amount, currency, the matched text, the selector that
+matched (None for the visible-text fallback) and the element's position.
+"""
+from typing import Dict, List, Optional
+from tracing import traced
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Union of the price selectors used across the test scripts, most specific first
+PRICE_SELECTORS = [
+    "span[class*='price']",
+    "div[class*='price'] span",
+    "span[class*='amount']",
+    "div[class*='fare'] span",
+    "span[data-test*='price']",
+    "span[class*='total']",
+    "div[class*='total'] span",
+]
+
+EXTRACT_JS = """
+    ([selectors, textFallback]) => {
+        const SYMBOLS = { '$': 'USD', '€': 'EUR', '£': 'GBP' };
+        const PRICE = /(USD|EUR|GBP|[$€£])\\s*(\\d[\\d.,]*)|(\\d[\\d.,]*)\\s*(USD|EUR|GBP|[€£])/g;
+
+        const toAmount = (raw) => {
+            const lastComma = raw.lastIndexOf(','), lastDot = raw.lastIndexOf('.');
+            let normalized;
+            if (lastComma > lastDot && raw.length - lastComma === 3) {
+                normalized = raw.replace(/\\./g, '').replace(',', '.');   // 1.234,56
+            } else {
+                normalized = raw.replace(/,/g, '');                     // 1,234.56
+            }
+            return parseFloat(normalized.replace(/\\.$/, ''));
+        };
+
+        const parse = (text) => {
+            const found = [];
+            for (const m of text.matchAll(PRICE)) {
+                const unit = m[1] || m[4];
+                const amount = toAmount(m[2] || m[3]);
+                if (!isNaN(amount)) {
+                    found.push({ amount, currency: SYMBOLS[unit] || unit, text: m[0].trim() });
+                }
+            }
+            return found;
+        };
+
+        const candidates = [];
+        const seen = new Set();
+        selectors.forEach(selector => {
+            document.querySelectorAll(selector).forEach(el => {
+                if (seen.has(el)) return;
+                seen.add(el);
+                const rect = el.getBoundingClientRect();
+                parse(el.innerText || '').forEach(p => candidates.push({
+                    ...p,
+                    selector,
+                    source: 'element',
+                    x: rect.x + window.scrollX,
+                    y: rect.y + window.scrollY,
+                    width: rect.width,
+                    height: rect.height,
+                    visible: rect.width > 0 && rect.height > 0,
+                }));
+            });
+        });
+
+        if (textFallback && candidates.length === 0 && document.body) {
+            parse(document.body.innerText).forEach(p => candidates.push({
+                ...p, selector: null, source: 'text',
+                x: null, y: null, width: null, height: null, visible: true,
+            }));
+        }
+        return candidates;
+    }
+"""
+
+
+class PriceExtractor:
+    """
+    Single round-trip price extraction for any Playwright page.
+
+    Example:
+        best = PriceExtractor().find_price(page, currency="USD", min_amount=300)
+        if best:
+            print(best["text"], best["amount"], best["selector"])
+    """
+
+    def __init__(self, selectors: Optional[List[str]] = None, text_fallback: bool = True):
+        self.selectors = selectors or PRICE_SELECTORS
+        self.text_fallback = text_fallback
+
+    @traced("price.extract")
+    def extract(self, page) -> List[Dict]:
+        """
+        Return every price candidate on the page in document order.
+
+        The visible-text fallback only runs (inside the same evaluate) when
+        no selector produced a candidate.
+        """
+        candidates = page.evaluate(EXTRACT_JS, [self.selectors, self.text_fallback])
+        logger.info(f"  Price candidates: {len(candidates)}")
+        return candidates
+
+    def find_price(self, page, currency: Optional[str] = "USD", min_amount: float = 0,
+                   max_amount: Optional[float] = None,
+                   fallback_max_amount: Optional[float] = 5000) -> Optional[Dict]:
+        """
+        Pick the first plausible price candidate.
+
+        Args:
+            page: Playwright page on the results view
+            currency: ISO code to require, or None for any
+            min_amount: Lower bound for all candidates
+            max_amount: Upper bound for element candidates
+            fallback_max_amount: Upper bound for visible-text candidates,
+                which are noisier than element matches
+
+        Returns:
+            The winning candidate dict, or None
+        """
+        for candidate in self.extract(page):
+            if currency and candidate["currency"] != currency:
+                continue
+            upper = fallback_max_amount if candidate["source"] == "text" else max_amount
+            if candidate["amount"] < min_amount or (upper is not None and candidate["amount"] > upper):
+                continue
+            logger.info(f"  ✓ Price {candidate['text']} via {candidate['selector'] or 'page text'}")
+            return candidate
+        return None
@@ -0,0 +1,74 @@
+"""
+Reduced Motion
+Performance mode that takes CSS animations and transitions out of the
+flow, so calendar and dropdown interactions no longer need settle sleeps.
+
+- The context emulates prefers-reduced-motion: reduce (sites that honour
+  it skip their own motion, including JS-timed open/close effects)
+- An init script injects a style sheet that cuts every transition and
+  animation to 0.01 ms; the end events still fire, so widgets that close
+  on transitionend/animationend keep working
+
+Usage:
+    context = browser.new_context(**context_options(viewport=...))
+    install(context)
+    HomePage(context.new_page(), reduced_motion=True).open()
+
+Run `python benchmark_search.py --reduced-motion` for the per-step savings.
+"""
+from typing import Dict
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+STYLE_ID = "lh-reduced-motion"
+
+REDUCED_MOTION_CSS = """
+*, *::before, *::after {
+    transition-duration: 0.01ms !important;
+    transition-delay: 0s !important;
+    animation-duration: 0.01ms !important;
+    animation-delay: 0s !important;
+    animation-iteration-count: 1 !important;
+    scroll-behavior: auto !important;
+}
+"""
+
+INJECT_STYLE_JS = """
+(([id, css]) => {
+    const add = () => {
+        if (document.getElementById(id)) return;
+        const style = document.createElement('style');
+        style.id = id;
+        style.textContent = css;
+        (document.head || document.documentElement).appendChild(style);
+    };
+    if (document.documentElement) add();
+    else document.addEventListener('DOMContentLoaded', add, { once: true });
+})
+"""
+
+
+def context_options(**options) -> Dict:
+    """new_context keyword arguments with reduced motion emulated; explicit options win."""
+    return {"reduced_motion": "reduce", **options}
+
+
+def install(target) -> None:
+    """
+    Inject the kill-switch style sheet on a BrowserContext or Page.
+    Pages that already exist get the style and the media emulation now.
+
+    Args:
+        target: Context (every page it opens) or a single page
+    """
+    arg = [STYLE_ID, REDUCED_MOTION_CSS]
+    target.add_init_script(script=f"{INJECT_STYLE_JS.strip()}({json.dumps(arg)});")
+    pages = getattr(target, "pages", None)
+    for page in pages if pages is not None else [target]:
+        try:
+            page.emulate_media(reduced_motion="reduce")
+            page.evaluate(INJECT_STYLE_JS, arg)
+        except Exception:
+            logger.debug("  Could not apply reduced motion to an open page")
@@ -0,0 +1,199 @@
+"""
+Request Blocker
+Request-interception layer for the flight-search flow. Aborts requests for
+assets the flow never uses (images, fonts, media, analytics, Tealium tags)
+before they leave the browser.
+
+- Deny/allow lists by resource type and URL glob; allow always wins
+- Per-run counters of blocked requests and bytes, by resource type
+- Benchmark mode comparing page-ready time with and without blocking
+
+Usage:
+    blocker = RequestBlocker()
+    blocker.install(context)          # or a single page
+    HomePage(context.new_page()).open()
+    print(blocker.get_stats())
+
+Run `python request_blocker.py --runs 3` for the benchmark.
+"""
+from fnmatch import fnmatch
+from typing import Dict, Iterable, Optional
+import argparse
+import json
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOCKED_TYPES = ("image", "media", "font")
+
+DEFAULT_BLOCKED_URLS = (
+    "*tiqcdn.com*",             # Tealium tag manager / consent
+    "*tealium*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*adobedtm.com*",
+    "*omtrdc.net*",
+    "*demdex.net*",
+    "*hotjar*",
+    "*facebook.net*",
+    "*bing.com/bat*",
+)
+
+
+class RequestBlocker:
+    """
+    Route handler that aborts requests matching the deny lists.
+
+    Blocked requests never reach the network, so their size cannot be read
+    from the response. Bytes blocked are estimated from Content-Length
+    values this blocker saw for the same URL through learn_sizes() (the
+    benchmark's baseline run feeds these); unknown sizes count as 0.
+    """
+
+    def __init__(self, blocked_types: Iterable[str] = DEFAULT_BLOCKED_TYPES,
+                 blocked_urls: Iterable[str] = DEFAULT_BLOCKED_URLS,
+                 allowed_types: Iterable[str] = (),
+                 allowed_urls: Iterable[str] = ()):
+        self.blocked_types = set(blocked_types)
+        self.blocked_urls = list(blocked_urls)
+        self.allowed_types = set(allowed_types)
+        self.allowed_urls = list(allowed_urls)
+        self._size_hints: Dict[str, int] = {}  # Content-Length by URL, from learn_sizes()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Start a new run."""
+        self.requests_seen = 0
+        self.requests_blocked = 0
+        self.bytes_blocked = 0
+        self.blocked_by_type: Dict[str, int] = {}
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """Decide whether a request is blocked. Allow lists win over deny lists."""
+        if resource_type in self.allowed_types:
+            return False
+        if any(fnmatch(url, pattern) for pattern in self.allowed_urls):
+            return False
+        if resource_type in self.blocked_types:
+            return True
+        return any(fnmatch(url, pattern) for pattern in self.blocked_urls)
+
+    def _handle(self, route) -> None:
+        request = route.request
+        self.requests_seen += 1
+        if self.should_block(request.url, request.resource_type):
+            self.requests_blocked += 1
+            self.bytes_blocked += self._size_hints.get(request.url, 0)
+            self.blocked_by_type[request.resource_type] = \
+                self.blocked_by_type.get(request.resource_type, 0) + 1
+            route.abort("blockedbyclient")
+        else:
+            route.fallback()
+
+    def install(self, target) -> 'RequestBlocker':
+        """
+        Install on a BrowserContext or Page.
+
+        Args:
+            target: Context (covers every page) or a single page
+        """
+        target.route("**/*", self._handle)
+        return self
+
+    def uninstall(self, target) -> None:
+        target.unroute("**/*", self._handle)
+
+    def learn_sizes(self, target) -> None:
+        """Record Content-Length of responses on target for bytes_blocked estimates."""
+        def on_response(response):
+            length = response.headers.get("content-length")
+            if length and length.isdigit():
+                self._size_hints[response.url] = int(length)
+        target.on("response", on_response)
+
+    def get_stats(self) -> Dict:
+        return {
+            "requests_seen": self.requests_seen,
+            "requests_blocked": self.requests_blocked,
+            "bytes_blocked": self.bytes_blocked,
+            "blocked_by_type": dict(self.blocked_by_type),
+        }
+
+
+# ==================== BENCHMARK ====================
+
+def _page_ready_ms(browser, url: str, blocker: RequestBlocker, block: bool,
+                   context_options: Dict) -> float:
+    """Time from goto until the search form is usable; unblocked runs teach blocker sizes."""
+    from home_page import HomePage
+    from waits import ReadinessWaiter
+
+    context = browser.new_context(**context_options)
+    try:
+        if block:
+            blocker.install(context)
+        else:
+            blocker.learn_sizes(context)
+        page = context.new_page()
+        waits = ReadinessWaiter(page)
+
+        start = time.time()
+        page.goto(url, wait_until="domcontentloaded")
+        waits.element_visible(HomePage.ORIGIN_INPUT, timeout=15000)
+        waits.network_idle(timeout=6000)
+        return (time.time() - start) * 1000
+    finally:
+        context.close()
+
+
+def benchmark_page_ready(browser, url: str = "https://www.lufthansa.com/us/en/flight-search",
+                         runs: int = 3, blocker: Optional[RequestBlocker] = None,
+                         context_options: Optional[Dict] = None) -> Dict:
+    """
+    Compare page-ready time with and without request blocking.
+    Runs alternate (unblocked, blocked) so network drift hits both sides.
+
+    Returns:
+        Dict with per-run timings, averages, saving and blocker counters
+    """
+    blocker = blocker or RequestBlocker()
+    context_options = context_options or {}
+    unblocked, blocked = [], []
+
+    for i in range(runs):
+        unblocked.append(_page_ready_ms(browser, url, blocker, False, context_options))
+        blocker.reset_stats()
+        blocked.append(_page_ready_ms(browser, url, blocker, True, context_options))
+        logger.info(f"  Run {i + 1}/{runs}: {unblocked[-1]:.0f} ms → {blocked[-1]:.0f} ms")
+
+    avg_unblocked = sum(unblocked) / len(unblocked)
+    avg_blocked = sum(blocked) / len(blocked)
+    return {
+        "url": url,
+        "runs": runs,
+        "unblocked_ms": unblocked,
+        "blocked_ms": blocked,
+        "avg_unblocked_ms": avg_unblocked,
+        "avg_blocked_ms": avg_blocked,
+        "saving_ms": avg_unblocked - avg_blocked,
+        "last_run_blocker": blocker.get_stats(),
+    }
+
+
+if __name__ == "__main__":
+    from playwright.sync_api import sync_playwright
+
+    parser = argparse.ArgumentParser(description="Benchmark page-ready time with request blocking")
+    parser.add_argument("--url", default="https://www.lufthansa.com/us/en/flight-search")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=True)
+        try:
+            print(json.dumps(benchmark_page_ready(browser, args.url, args.runs), indent=2))
+        finally:
+            browser.close()
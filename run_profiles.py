@@ -0,0 +1,275 @@
+"""
+Run Profiles
+Named launch settings for the test_lufthansa_*.py entry points, replacing
+the hardcoded headless=False / slow_mo / viewport / screenshot paths.
+
+- debug: headed, slow_mo, tracing on, screenshots at every checkpoint,
+  review pauses kept (the previous behaviour)
+- ci: headless, no slow_mo, screenshots and traces kept on failure only,
+  no review pauses, reduced motion (no animation settle sleeps)
+- throughput: ci plus analytics/media blocking, a smaller viewport and
+  sampled screenshots
+
+Screenshots go through ScreenshotService (background writes, JPEG, dedupe).
+Every session context gets an OverlaySuppressor (session.overlays), and
+every session a WaitLedger (session.wait_ledger) whose per-step summary is
+printed on close.
+
+Select with --profile on the command line or LH_RUN_PROFILE in the
+environment (default: debug). Artifacts go to LH_ARTIFACT_DIR (default:
+./artifacts).
+
+Example:
+    session = launch(playwright)
+    session.page.goto(...)
+    session.screenshot("results")
+    session.close()
+"""
+from typing import Dict, List, Optional, Sequence
+from failure_traces import FailureTraceRecorder
+from overlay_suppressor import OverlaySuppressor
+from screenshot_service import ScreenshotService
+from wait_accounting import WaitLedger
+import argparse
+import logging
+import os
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "LH_RUN_PROFILE"
+ARTIFACT_DIR_ENV = "LH_ARTIFACT_DIR"
+DEFAULT_PROFILE = "debug"
+
+# Keep timers and rendering running at full speed when the window is hidden or headless
+BACKGROUND_ARGS = [
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+]
+HEADLESS_ARGS = ["--disable-gpu", "--disable-dev-shm-usage", "--disable-extensions"] + BACKGROUND_ARGS
+
+
+class RunProfile:
+    """
+    Launch, context and artifact settings for one kind of run.
+
+    Args:
+        tracing: "always", "on_failure" (kept in failure_traces/) or "off"
+        screenshots: "always" (every checkpoint), "sampled", "on_failure" or "off"
+        screenshot_format: "jpeg", "png" or "webp" (webp needs Pillow)
+        review_pauses: Keep the "browser stays open for review" sleeps
+        block_requests: Install RequestBlocker (analytics, images, media, fonts)
+        reduced_motion: Emulate prefers-reduced-motion, cut CSS animations and
+            skip animation settle sleeps (see reduced_motion.py)
+    """
+
+    def __init__(self, name: str, headless: bool, slow_mo: int = 0,
+                 viewport: Optional[Dict[str, int]] = None, launch_args: Sequence[str] = (),
+                 tracing: str = "off", screenshots: str = "on_failure",
+                 review_pauses: bool = False, block_requests: bool = False,
+                 screenshot_format: str = "jpeg", screenshot_quality: int = 70,
+                 screenshot_sample_rate: float = 0.1, reduced_motion: bool = False):
+        self.name = name
+        self.headless = headless
+        self.slow_mo = slow_mo
+        self.viewport = viewport or {'width': 1920, 'height': 1080}
+        self.launch_args: List[str] = list(launch_args)
+        self.tracing = tracing
+        self.screenshots = screenshots
+        self.screenshot_format = screenshot_format
+        self.screenshot_quality = screenshot_quality
+        self.screenshot_sample_rate = screenshot_sample_rate
+        self.review_pauses = review_pauses
+        self.block_requests = block_requests
+        self.reduced_motion = reduced_motion
+
+    def launch_options(self, slow_mo: Optional[int] = None) -> Dict:
+        """
+        Keyword arguments for playwright.chromium.launch.
+
+        Args:
+            slow_mo: Per-script pace; only replaces the profile's slow_mo when
+                the profile slows down at all (ci/throughput stay at 0)
+        """
+        if slow_mo is None or not self.slow_mo:
+            slow_mo = self.slow_mo
+        return {"headless": self.headless, "slow_mo": slow_mo, "args": list(self.launch_args)}
+
+    def context_options(self, **options) -> Dict:
+        """Keyword arguments for browser.new_context; explicit options win."""
+        defaults = {"viewport": dict(self.viewport)}
+        if self.reduced_motion:
+            defaults["reduced_motion"] = "reduce"
+        return {**defaults, **options}
+
+    def __repr__(self) -> str:
+        return f"RunProfile({self.name!r}, headless={self.headless}, slow_mo={self.slow_mo})"
+
+
+PROFILES: Dict[str, RunProfile] = {
+    "debug": RunProfile("debug", headless=False, slow_mo=200, tracing="always",
+                        screenshots="always", review_pauses=True, launch_args=BACKGROUND_ARGS),
+    "ci": RunProfile("ci", headless=True, tracing="on_failure", screenshots="on_failure",
+                     reduced_motion=True, launch_args=HEADLESS_ARGS),
+    "throughput": RunProfile("throughput", headless=True, viewport={'width': 1280, 'height': 800},
+                             screenshots="sampled", screenshot_sample_rate=0.05,
+                             block_requests=True, reduced_motion=True, launch_args=HEADLESS_ARGS),
+}
+
+
+def get_profile(name: Optional[str] = None) -> RunProfile:
+    """Profile by name, else from LH_RUN_PROFILE, else debug."""
+    name = name or os.environ.get(PROFILE_ENV) or DEFAULT_PROFILE
+    if name not in PROFILES:
+        raise ValueError(f"Unknown run profile '{name}', expected one of: {', '.join(PROFILES)}")
+    return PROFILES[name]
+
+
+def parse_cli(argv: Optional[Sequence[str]] = None) -> RunProfile:
+    """
+    Read --profile from the command line for script entry points.
+    The choice is exported to LH_RUN_PROFILE so launch() picks it up.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--profile", choices=sorted(PROFILES))
+    args, _ = parser.parse_known_args(argv)
+    if args.profile:
+        os.environ[PROFILE_ENV] = args.profile
+    return get_profile()
+
+
+def artifact_dir() -> str:
+    path = os.environ.get(ARTIFACT_DIR_ENV, "artifacts")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+class RunSession:
+    """Browser, context and page launched for a profile, plus artifact handling."""
+
+    def __init__(self, playwright, profile: RunProfile, name: str,
+                 context_options: Optional[Dict] = None, run_id: Optional[str] = None,
+                 slow_mo: Optional[int] = None):
+        self.profile = profile
+        self.name = name
+        self.run_id = run_id or str(uuid.uuid4())[:8]
+        self.browser = playwright.chromium.launch(**profile.launch_options(slow_mo))
+        self.context = self.browser.new_context(**profile.context_options(**(context_options or {})))
+        self.blocker = None
+        if profile.block_requests:
+            from request_blocker import RequestBlocker
+            self.blocker = RequestBlocker()
+            self.blocker.install(self.context)
+        self.overlays = OverlaySuppressor().install(self.context)
+        self.wait_ledger = WaitLedger(name).activate()
+        if profile.reduced_motion:
+            import reduced_motion
+            reduced_motion.install(self.context)
+        self.failure_traces: Optional[FailureTraceRecorder] = None
+        self._trace_chunk = None
+        if profile.tracing == "always":
+            self.context.tracing.start(screenshots=True, snapshots=True)
+        elif profile.tracing == "on_failure":
+            self.failure_traces = FailureTraceRecorder(self.context, self.run_id)
+            self._trace_chunk = self.failure_traces.begin(name)
+        self.page = self.context.new_page()
+        self.screenshots = ScreenshotService(
+            artifact_dir(), policy=profile.screenshots, sample_rate=profile.screenshot_sample_rate,
+            image_format=profile.screenshot_format, quality=profile.screenshot_quality, prefix=name)
+        logger.info(f"  Run profile: {profile.name}")
+
+    def _path(self, label: str, extension: str) -> str:
+        return os.path.join(artifact_dir(), f"{self.name}_{label}.{extension}")
+
+    def screenshot(self, label: str, failure: bool = False, element: Optional[str] = None,
+                   full_page: Optional[bool] = None) -> Optional[str]:
+        """
+        Take a screenshot if the profile's policy allows it; the file is
+        written in the background. Failure captures are full-page by default.
+
+        Returns:
+            The image path, or None when skipped
+        """
+        if full_page is None:
+            full_page = failure and element is None
+        return self.screenshots.capture(self.page, label, failure=failure, element=element,
+                                        full_page=full_page)
+
+    def mark_failed(self, reason) -> None:
+        """Keep this run's trace under the on_failure tracing policy."""
+        if self._trace_chunk is not None:
+            self._trace_chunk.fail(str(reason))
+
+    def step(self, name: str) -> None:
+        """Attribute the following waits to name in the wait summary."""
+        self.wait_ledger.begin_step(name)
+
+    def sleep(self, ms: int) -> None:
+        """A fixed sleep, recorded in the wait summary."""
+        self.wait_ledger.sleep(self.page, ms)
+
+    def wait_for_selector(self, selector: str, timeout: int = 30000, state: str = "visible"):
+        """page.wait_for_selector, recorded in the wait summary; still raises on timeout."""
+        start = time.perf_counter()
+        met = False
+        try:
+            handle = self.page.wait_for_selector(selector, state=state, timeout=timeout)
+            met = True
+            return handle
+        finally:
+            self.wait_ledger.record("wait_for_selector", "condition",
+                                    (time.perf_counter() - start) * 1000, timeout, met)
+
+    def pause(self, ms: int) -> None:
+        """A review pause that only the debug profile keeps."""
+        if self.profile.review_pauses:
+            self.wait_ledger.sleep(self.page, ms, wait="review_pause")
+
+    def settle(self, ms: int) -> None:
+        """A sleep that only lets an animation finish; skipped under reduced motion."""
+        if not self.profile.reduced_motion:
+            self.wait_ledger.sleep(self.page, ms, wait="settle")
+
+    def close(self) -> None:
+        if self.failure_traces is not None:
+            kept = self.failure_traces.end(self._trace_chunk)
+            self.failure_traces.stop()
+            if kept:
+                print(f"   Trace: {os.path.join(self.failure_traces.store.directory, kept['file'])}")
+        elif self.profile.tracing == "always":
+            path = self._path("trace", "zip")
+            try:
+                self.context.tracing.stop(path=path)
+                print(f"   Trace: {path}")
+            except Exception as e:
+                logger.warning(f"  ⚠ Could not save trace: {e}")
+        self.screenshots.close()
+        cost = self.screenshots.report()
+        if cost["captured"]:
+            print(f"   Screenshots: {cost['written']} written ({cost['kilobytes']} KB), "
+                  f"{cost['duplicates']} duplicate, {cost['blocked_ms']:.0f} ms blocking")
+        if self.overlays.total:
+            print(f"   Overlays: {self.overlays.total} dismissed by the suppressor")
+        if self.wait_ledger.entries:
+            print(self.wait_ledger.format_summary())
+        self.context.close()
+        self.browser.close()
+
+
+def launch(playwright, name: str = "run", profile: Optional[RunProfile] = None,
+           context_options: Optional[Dict] = None, run_id: Optional[str] = None,
+           slow_mo: Optional[int] = None) -> RunSession:
+    """
+    Shared launcher for every test_lufthansa_*.py entry point.
+
+    Args:
+        playwright: Sync Playwright instance
+        name: Prefix for screenshots and traces, e.g. "final"
+        profile: Explicit profile; defaults to get_profile()
+        context_options: Extra new_context options (e.g. storage_state)
+        run_id: TestLogger run_id that kept failure traces are indexed under
+        slow_mo: The script's own pace under profiles that slow down (debug)
+    """
+    return RunSession(playwright, profile or get_profile(), name, context_options, run_id, slow_mo)
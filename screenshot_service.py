@@ -0,0 +1,212 @@
+"""
+Screenshot Service
+Policy-driven screenshots that keep encoding and disk writes off the test
+flow.
+
+- Policies: "always", "sampled" (a fraction of checkpoints), "on_failure",
+  "off"; failure captures are taken under every policy except "off"
+- Viewport (default), full-page or element-only captures
+- JPEG/PNG are encoded by the browser; WebP is re-encoded from PNG with
+  Pillow when it is installed (JPEG otherwise)
+- Identical frames (same content hash) are written once
+- report() gives the per-run cost: time the flow was blocked, background
+  encode/write time, bytes written, frames dropped
+
+Example:
+    shots = ScreenshotService("artifacts", policy="sampled", sample_rate=0.2)
+    shots.capture(page, "results")
+    shots.capture(page, "error", failure=True, full_page=True)
+    shots.close()
+    print(shots.report())
+"""
+from typing import Dict, Optional, Set
+import hashlib
+import io
+import logging
+import os
+import queue
+import random
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+try:
+    from PIL import Image
+except ImportError:  # WebP needs Pillow; fall back to browser-encoded JPEG
+    Image = None
+
+POLICIES = ("always", "sampled", "on_failure", "off")
+EXTENSIONS = {"jpeg": "jpg", "png": "png", "webp": "webp"}
+
+
+class ScreenshotService:
+    """
+    Screenshot capture with a background writer thread.
+
+    Args:
+        output_dir: Directory for the images
+        policy: "always", "sampled", "on_failure" or "off"
+        sample_rate: Fraction of non-failure checkpoints kept under "sampled"
+        image_format: "jpeg", "png" or "webp"
+        quality: JPEG/WebP quality (1-100)
+        full_page: Default capture area; False captures the viewport only
+        prefix: File name prefix, e.g. the script name
+    """
+
+    def __init__(self, output_dir: str = "artifacts", policy: str = "on_failure",
+                 sample_rate: float = 0.1, image_format: str = "jpeg", quality: int = 70,
+                 full_page: bool = False, prefix: str = "", seed: Optional[int] = None):
+        if policy not in POLICIES:
+            raise ValueError(f"Invalid screenshot policy: {policy}")
+        if image_format not in EXTENSIONS:
+            raise ValueError(f"Invalid screenshot format: {image_format}")
+        if image_format == "webp" and Image is None:
+            logger.warning("  ⚠ Pillow not installed, writing JPEG instead of WebP")
+            image_format = "jpeg"
+        self.output_dir = output_dir
+        self.policy = policy
+        self.sample_rate = sample_rate
+        self.image_format = image_format
+        self.quality = quality
+        self.full_page = full_page
+        self.prefix = prefix
+        self._random = random.Random(seed)
+        self._hashes: Dict[str, str] = {}  # content hash -> path
+        self._names: Set[str] = set()  # file names already taken
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self.stats = {"captured": 0, "written": 0, "skipped": 0, "duplicates": 0, "failed": 0,
+                      "capture_ms": 0.0, "encode_ms": 0.0, "write_ms": 0.0, "bytes": 0}
+
+    def should_capture(self, failure: bool = False) -> bool:
+        if self.policy == "off":
+            return False
+        if failure or self.policy == "always":
+            return True
+        if self.policy == "sampled":
+            return self._random.random() < self.sample_rate
+        return False
+
+    def capture(self, page, label: str, failure: bool = False, element: Optional[str] = None,
+                full_page: Optional[bool] = None) -> Optional[str]:
+        """
+        Take a screenshot if the policy allows it and queue it for writing.
+
+        Args:
+            page: Playwright page
+            label: Name of the checkpoint, e.g. "results"
+            failure: Failure captures bypass "on_failure"/"sampled" filtering
+            element: Selector to capture only that element
+            full_page: Override the default capture area
+
+        Returns:
+            Path the image is (or already was) queued to, or None when skipped.
+            A label captured again with different content gets a numbered
+            name (results.jpg, results_2.jpg, ...)
+        """
+        if not self.should_capture(failure):
+            self.stats["skipped"] += 1
+            return None
+
+        browser_format = "png" if self.image_format == "webp" else self.image_format
+        options = {"type": browser_format}
+        if browser_format == "jpeg":
+            options["quality"] = self.quality
+
+        start = time.perf_counter()
+        try:
+            if element:
+                data = page.locator(element).first.screenshot(**options)
+            else:
+                data = page.screenshot(full_page=self.full_page if full_page is None else full_page,
+                                       **options)
+        except Exception as e:
+            self.stats["failed"] += 1
+            logger.warning(f"  ⚠ Screenshot '{label}' failed: {e}")
+            return None
+        self.stats["capture_ms"] += (time.perf_counter() - start) * 1000
+        self.stats["captured"] += 1
+
+        digest = hashlib.sha1(data).hexdigest()
+        with self._lock:
+            if digest in self._hashes:
+                self.stats["duplicates"] += 1
+                return self._hashes[digest]
+            name = f"{self.prefix}_{label}" if self.prefix else label
+            # A checkpoint label can repeat with different content; number the later frames
+            base, count = name, 1
+            while name in self._names:
+                count += 1
+                name = f"{base}_{count}"
+            self._names.add(name)
+            path = os.path.join(self.output_dir, f"{name}.{EXTENSIONS[self.image_format]}")
+            self._hashes[digest] = path
+
+        self._ensure_worker()
+        self._queue.put((path, data))
+        return path
+
+    # ==================== BACKGROUND WRITER ====================
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            os.makedirs(self.output_dir, exist_ok=True)
+            self._worker = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, path: str, data: bytes) -> None:
+        try:
+            if self.image_format == "webp":
+                start = time.perf_counter()
+                buffer = io.BytesIO()
+                Image.open(io.BytesIO(data)).save(buffer, "WEBP", quality=self.quality)
+                data = buffer.getvalue()
+                self.stats["encode_ms"] += (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            with open(path, "wb") as f:
+                f.write(data)
+            with self._lock:
+                self.stats["write_ms"] += (time.perf_counter() - start) * 1000
+                self.stats["bytes"] += len(data)
+                self.stats["written"] += 1
+        except Exception as e:
+            with self._lock:
+                self.stats["failed"] += 1
+            logger.warning(f"  ⚠ Could not write screenshot {path}: {e}")
+
+    def flush(self) -> None:
+        """Block until every queued screenshot is on disk."""
+        self._queue.join()
+
+    def close(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            self._queue.put(None)
+            self._worker.join()
+        self._worker = None
+
+    def report(self) -> Dict:
+        """Per-run capture cost; blocked_ms is the time the test flow waited."""
+        return {
+            "policy": self.policy,
+            "format": self.image_format,
+            "captured": self.stats["captured"],
+            "written": self.stats["written"],
+            "duplicates": self.stats["duplicates"],
+            "skipped": self.stats["skipped"],
+            "failed": self.stats["failed"],
+            "blocked_ms": round(self.stats["capture_ms"], 1),
+            "background_ms": round(self.stats["encode_ms"] + self.stats["write_ms"], 1),
+            "kilobytes": round(self.stats["bytes"] / 1024, 1),
+        }
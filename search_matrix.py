@@ -0,0 +1,80 @@
+"""
+Search Matrix
+Expands routes × departure dates × trip types into search_flight queries
+for the parametrized pytest suite (see conftest.py).
+
+The default matrix is small; pass a JSON file with the same keys as
+DEFAULT_MATRIX to conftest's --matrix option to grow it:
+
+    {
+        "routes": [["New York", "JFK", "Berlin", "BER"], ...],
+        "departure_offsets": [30, 60],
+        "stay_lengths": [7, 10],
+        "trip_types": ["round_trip", "one_way"]
+    }
+
+Departure dates are offsets in days from start_date (today by default).
+"""
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+import json
+
+DEFAULT_MATRIX = {
+    "routes": [
+        ["New York", "JFK", "Berlin", "BER"],
+        ["New York", "JFK", "Frankfurt", "FRA"],
+        ["Chicago", "ORD", "Munich", "MUC"],
+        ["Boston", "BOS", "Frankfurt", "FRA"],
+        ["Los Angeles", "LAX", "Munich", "MUC"],
+    ],
+    "departure_offsets": [30, 60],
+    "stay_lengths": [7, 10],
+    "trip_types": ["round_trip", "one_way"],
+}
+
+
+def load_matrix(filepath: Optional[str] = None) -> Dict:
+    """DEFAULT_MATRIX, with any keys from filepath overriding it."""
+    matrix = dict(DEFAULT_MATRIX)
+    if filepath:
+        with open(filepath) as f:
+            matrix.update(json.load(f))
+    return matrix
+
+
+def build_queries(matrix: Optional[Dict] = None, start_date: Optional[date] = None) -> List[Dict]:
+    """
+    Every search_flight query in the matrix.
+    One-way searches are generated once per departure, not once per stay length.
+    """
+    matrix = matrix or DEFAULT_MATRIX
+    start_date = start_date or datetime.now().date()
+    queries = []
+    for origin_city, origin_airport, destination_city, destination_airport in matrix["routes"]:
+        for offset in matrix["departure_offsets"]:
+            departure = start_date + timedelta(days=offset)
+            for trip_type in matrix["trip_types"]:
+                stays = matrix["stay_lengths"] if trip_type == "round_trip" else [None]
+                for stay in stays:
+                    queries.append({
+                        "origin_city": origin_city,
+                        "destination_city": destination_city,
+                        "origin_airport": origin_airport,
+                        "destination_airport": destination_airport,
+                        "departure_date": departure.strftime("%m/%d/%Y"),
+                        "return_date": (departure + timedelta(days=stay)).strftime("%m/%d/%Y")
+                        if stay is not None else None,
+                        "trip_type": trip_type,
+                    })
+    return queries
+
+
+def query_id(query: Dict) -> str:
+    """Readable test id, e.g. JFK-BER_12-15_rt10."""
+    route = f"{query['origin_airport']}-{query['destination_airport']}"
+    departure = query["departure_date"][:5].replace('/', '-')
+    if query["trip_type"] == "one_way":
+        return f"{route}_{departure}_ow"
+    stay = (datetime.strptime(query["return_date"], "%m/%d/%Y")
+            - datetime.strptime(query["departure_date"], "%m/%d/%Y")).days
+    return f"{route}_{departure}_rt{stay}"
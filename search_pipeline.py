@@ -0,0 +1,232 @@
+"""
+Resumable Search Pipeline
+Runs the search_flight flow as stages (open → trip_type → origin →
+destination → dates → search → results), capturing a form checkpoint after
+each stage that passes. When a stage fails, the page is restored from the
+last checkpoint (storage state plus the form field values) and the flow
+resumes at the failed stage, instead of repeating navigation, overlay
+removal and both airport entries.
+
+A failed "results" stage resumes at "search": the form is restored and the
+search is clicked again.
+
+Retry cost (restore plus re-run stages) is reported separately from the
+first attempt.
+
+Example:
+    report = SearchPipeline(HomePage(page), max_retries=2).run(query)
+    print(report["first_attempt_ms"], report["retry_ms"], report["resumed_from"])
+"""
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+STAGES = ["open", "trip_type", "origin", "destination", "dates", "search", "results"]
+
+# Every named input: text values, hidden airport/date companions and radio state
+CAPTURE_FIELDS_JS = """
+    () => Array.from(document.querySelectorAll('input'))
+        .filter(el => el.name || el.id)
+        .map(el => ({
+            name: el.name, id: el.id, type: el.type, value: el.value,
+            checked: (el.type === 'radio' || el.type === 'checkbox') ? el.checked : null,
+        }))
+"""
+
+# Only change/blur are dispatched: an input event would reopen the autocomplete
+RESTORE_FIELDS_JS = """
+    (fields) => {
+        let restored = 0;
+        for (const field of fields) {
+            const el = field.id ? document.getElementById(field.id)
+                : document.querySelector(`input[name="${CSS.escape(field.name)}"][value="${CSS.escape(field.value)}"]`)
+                  || document.querySelector(`input[name="${CSS.escape(field.name)}"]`);
+            if (!el) continue;
+            if (field.checked !== null) {
+                if (el.checked === field.checked) continue;
+                el.checked = field.checked;
+            } else {
+                if (el.value === field.value) continue;
+                el.value = field.value;
+            }
+            el.dispatchEvent(new Event('change', { bubbles: true }));
+            el.dispatchEvent(new Event('blur'));
+            restored++;
+        }
+        return restored;
+    }
+"""
+
+RESTORE_LOCAL_STORAGE_JS = """
+    (items) => items.forEach(({ name, value }) => localStorage.setItem(name, value))
+"""
+
+
+class FormCheckpoint:
+    """Page state after a stage: URL, storage state and form field values."""
+
+    def __init__(self, stage: str, url: str, storage_state: Dict, fields: List[Dict]):
+        self.stage = stage
+        self.url = url
+        self.storage_state = storage_state
+        self.fields = fields
+
+
+class SearchPipeline:
+    """
+    search_flight as resumable stages on a HomePage.
+
+    Args:
+        home_page: HomePage to drive
+        max_retries: Restores allowed per run
+        test_logger: Optional TestLogger; each stage attempt is logged with the
+            strategies HomePage picked, retries prefixed "retry"
+    """
+
+    RETRY_FROM = {"results": "search"}
+
+    def __init__(self, home_page, max_retries: int = 2, test_logger=None):
+        self.home_page = home_page
+        self.max_retries = max_retries
+        self.test_logger = test_logger
+        self.checkpoints: Dict[str, FormCheckpoint] = {}
+
+    # ==================== STAGES ====================
+
+    def _field_filled(self, selector: str, count: int = 1) -> Callable[[], bool]:
+        def check() -> bool:
+            values = self.home_page.waits.input_values(selector)
+            return len(values) >= count and all(values[:count])
+        return check
+
+    def _stages(self, query: Dict) -> List[Tuple[str, Callable, Optional[Callable[[], bool]]]]:
+        page = self.home_page
+        return [
+            ("open", page.open, None),
+            ("trip_type", lambda: page.select_trip_type(query.get("trip_type", "round_trip")), None),
+            ("origin", lambda: page.enter_origin(query["origin_city"], query.get("origin_airport")),
+             self._field_filled(page.ORIGIN_INPUT)),
+            ("destination", lambda: page.enter_destination(query["destination_city"],
+                                                           query.get("destination_airport")),
+             self._field_filled(page.DESTINATION_INPUT)),
+            ("dates", lambda: page.select_dates(query["departure_date"], query.get("return_date")),
+             self._field_filled(page.DATE_INPUT, 2 if query.get("return_date") else 1)),
+            ("search", page.click_search, None),
+            ("results", page.wait_for_results, lambda: bool(page.results_loaded)),
+        ]
+
+    # ==================== CHECKPOINTS ====================
+
+    def capture(self, stage: str) -> FormCheckpoint:
+        page = self.home_page.page
+        checkpoint = FormCheckpoint(stage, page.url, page.context.storage_state(),
+                                    page.evaluate(CAPTURE_FIELDS_JS))
+        self.checkpoints[stage] = checkpoint
+        return checkpoint
+
+    def restore(self, checkpoint: FormCheckpoint) -> None:
+        """Reload the form and re-apply the checkpoint's storage and field values."""
+        home_page = self.home_page
+        page = home_page.page
+        if page.is_closed():
+            page = page.context.new_page()
+            home_page.page = home_page.waits.page = page
+
+        if checkpoint.storage_state.get("cookies"):
+            page.context.add_cookies(checkpoint.storage_state["cookies"])
+        page.goto(checkpoint.url, wait_until="domcontentloaded")
+        home_page.waits.element_visible(home_page.ORIGIN_INPUT, timeout=15000)
+
+        origin = page.evaluate("() => location.origin")
+        for entry in checkpoint.storage_state.get("origins", []):
+            if entry["origin"] == origin and entry.get("localStorage"):
+                page.evaluate(RESTORE_LOCAL_STORAGE_JS, entry["localStorage"])
+        home_page.remove_overlays()
+
+        restored = page.evaluate(RESTORE_FIELDS_JS, checkpoint.fields)
+        logger.info(f"  ↺ Restored checkpoint '{checkpoint.stage}' ({restored} fields)")
+
+    # ==================== RUN ====================
+
+    def _log(self, stage: str, status: int, error: str, duration_ms: float, query: Dict,
+             retry: bool) -> None:
+        if self.test_logger:
+            strategy = ", ".join(self.home_page.last_strategies.values())
+            if retry:
+                strategy = f"retry: {strategy}" if strategy else "retry"
+            self.test_logger.log_step(f"Stage {stage}", "pipeline", "", status, error, duration_ms,
+                                      context=query, strategy=strategy)
+
+    def run(self, query: Dict) -> Dict:
+        """
+        Run every stage, resuming from checkpoints on failure.
+
+        Args:
+            query: search_flight keyword arguments
+
+        Returns:
+            Dict with status, failed_stage, first_attempt_ms, retry_ms,
+            restore_ms, checkpoint_ms, retries, resumed_from and per-stage runs
+        """
+        stages = self._stages(query)
+        names = [name for name, _, _ in stages]
+        self.checkpoints = {}
+        report = {"status": 1, "failed_stage": None, "first_attempt_ms": 0.0, "retry_ms": 0.0,
+                  "restore_ms": 0.0, "checkpoint_ms": 0.0, "retries": 0, "resumed_from": [],
+                  "stages": []}
+
+        index = 0
+        while index < len(stages):
+            name, action, check = stages[index]
+            retry = report["retries"] > 0
+            self.home_page.last_strategies.clear()
+            start = time.perf_counter()
+            try:
+                action()
+                error = "" if check is None or check() else f"{name} stage check failed"
+            except Exception as e:
+                error = str(e)
+            duration_ms = (time.perf_counter() - start) * 1000
+            report["retry_ms" if retry else "first_attempt_ms"] += duration_ms
+            report["stages"].append({"stage": name, "status": int(not error), "duration_ms": duration_ms,
+                                     "retry": retry, "error": error})
+            self._log(name, int(not error), error, duration_ms, query, retry)
+
+            if not error:
+                start = time.perf_counter()
+                try:
+                    self.capture(name)
+                except Exception as e:
+                    logger.debug(f"  Could not capture checkpoint after {name}: {e}")
+                report["checkpoint_ms"] += (time.perf_counter() - start) * 1000
+                index += 1
+                continue
+
+            logger.warning(f"  ⚠ Stage '{name}' failed: {error}")
+            if report["retries"] >= self.max_retries:
+                report["status"] = 0
+                report["failed_stage"] = name
+                break
+
+            report["retries"] += 1
+            resume = names.index(self.RETRY_FROM.get(name, name))
+            previous = self.checkpoints.get(names[resume - 1]) if resume > 0 else None
+            start = time.perf_counter()
+            try:
+                if previous:
+                    self.restore(previous)
+            except Exception as e:
+                logger.warning(f"  ⚠ Restore failed, restarting from the beginning: {e}")
+                resume = 0
+            restore_ms = (time.perf_counter() - start) * 1000
+            report["restore_ms"] += restore_ms
+            report["retry_ms"] += restore_ms
+            report["resumed_from"].append(names[resume])
+            index = resume
+
+        logger.info(f"  Pipeline {'completed' if report['status'] else 'failed'}: "
+                    f"first attempt {report['first_attempt_ms']:.0f} ms, "
+                    f"retries {report['retries']} costing {report['retry_ms']:.0f} ms")
+        return report
@@ -0,0 +1,136 @@
+"""
+Selector Strategy Cache
+Remembers, per site, which selector strategy won for each multi-strategy
+lookup (calendar day, destination dropdown option, ...), so the last winner
+is tried first and strategies that keep failing sink to the end instead of
+burning their visibility timeouts on every search.
+
+Scores decay on every update (a win adds 1, a miss subtracts 1, older
+results fade by `decay`), so a site redesign re-ranks the strategies
+within a few searches.
+
+In memory unless a filepath is given. Updates are batched: save() writes
+the file once (through a temp file and os.replace), typically at the end
+of a run. Parallel workers (pytest-xdist, the async pool) should each use
+their own file.
+"""
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple, TypeVar
+import json
+import logging
+import os
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class StrategyCache:
+    """
+    Persistent per-site ranking of selector strategies.
+
+    Example:
+        cache = StrategyCache("selector_strategy_cache.json")
+        for selector, name in cache.order("www.lufthansa.com", "calendar_day", strategies):
+            ...
+            cache.record("www.lufthansa.com", "calendar_day", name, success=True)
+        cache.save()
+    """
+
+    def __init__(self, filepath: Optional[str] = None, decay: float = 0.8,
+                 dead_score: float = -2.0):
+        self.filepath = filepath
+        self.decay = decay
+        self.dead_score = dead_score
+        self.data: Dict[str, Dict[str, Dict]] = self._load()
+        self.dirty = False
+
+    def _load(self) -> Dict:
+        if not self.filepath or not os.path.exists(self.filepath):
+            return {}
+        try:
+            with open(self.filepath) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            logger.warning(f"  ⚠ Unreadable strategy cache {self.filepath}, starting fresh")
+            return {}
+
+    def save(self) -> None:
+        """Write pending updates to filepath, if the cache has one."""
+        if not self.filepath or not self.dirty:
+            return
+        fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(os.path.abspath(self.filepath)))
+        with os.fdopen(fd, "w") as f:
+            json.dump(self.data, f, indent=2)
+        os.replace(temp_path, self.filepath)
+        self.dirty = False
+
+    def _slot(self, site: str, slot: str) -> Dict:
+        return self.data.setdefault(site, {}).setdefault(slot, {
+            "strategies": {}, "first_try_hits": 0, "first_try_misses": 0, "predicted": None,
+        })
+
+    def _entry(self, site: str, slot: str, name: str) -> Dict:
+        return self._slot(site, slot)["strategies"].setdefault(name, {
+            "score": 0.0, "wins": 0, "misses": 0, "avg_ms": None, "last_result": None,
+        })
+
+    def order(self, site: str, slot: str, strategies: Sequence[Tuple[T, str]],
+              by: str = "score") -> List[Tuple[T, str]]:
+        """
+        Reorder (value, name) strategies: best first, dead ones last.
+
+        Args:
+            by: "score" ranks by decayed win/miss score; unknown strategies
+                keep their original relative position at score 0.
+                "speed" ranks live strategies by average winning duration;
+                unmeasured ones go first so every path gets timed once.
+        """
+        known = self._slot(site, slot)["strategies"]
+
+        def rank(item):
+            index, (_, name) = item
+            entry = known.get(name)
+            score = entry["score"] if entry else 0.0
+            if by == "speed":
+                avg_ms = entry["avg_ms"] if entry and entry["avg_ms"] is not None else -1.0
+                return (score <= self.dead_score, avg_ms, index)
+            return (score <= self.dead_score, -score, index)
+
+        ordered = [s for _, s in sorted(enumerate(strategies), key=rank)]
+        self._slot(site, slot)["predicted"] = ordered[0][1] if ordered else None
+        return ordered
+
+    def record(self, site: str, slot: str, name: str, success: bool,
+               duration_ms: Optional[float] = None) -> None:
+        """Record the outcome of trying one strategy (persisted by save())."""
+        slot_data = self._slot(site, slot)
+        for entry in slot_data["strategies"].values():
+            entry["score"] *= self.decay
+
+        entry = self._entry(site, slot, name)
+        entry["score"] += 1.0 if success else -1.0
+        entry["wins" if success else "misses"] += 1
+        entry["last_result"] = datetime.now().isoformat() if success else entry["last_result"]
+        if success and duration_ms is not None:
+            entry["avg_ms"] = duration_ms if entry["avg_ms"] is None \
+                else 0.7 * entry["avg_ms"] + 0.3 * duration_ms
+
+        if slot_data["predicted"] == name:
+            slot_data["first_try_hits" if success else "first_try_misses"] += 1
+            slot_data["predicted"] = None
+        self.dirty = True
+
+    def get_stats(self, site: Optional[str] = None) -> Dict:
+        """Hit/miss statistics; a hit means the first strategy tried won."""
+        sites = {site: self.data.get(site, {})} if site else self.data
+        return {
+            s: {slot: {
+                "first_try_hits": d["first_try_hits"],
+                "first_try_misses": d["first_try_misses"],
+                "strategies": {n: {k: e[k] for k in ("score", "wins", "misses", "avg_ms")}
+                               for n, e in d["strategies"].items()},
+            } for slot, d in slots.items()}
+            for s, slots in sites.items()
+        }
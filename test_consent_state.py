@@ -0,0 +1,86 @@
+"""
+Lufthansa Playwright Test - CONSENT SNAPSHOT VERSION
+Checks against the offline FixtureServer that a consent snapshot which no
+longer suppresses the banner is detected, so HomePage.remove_overlays()
+re-captures it.
+
+    pytest test_consent_state.py --profile ci
+"""
+from consent_state import ConsentStateStore
+from fixture_server import FixtureServer
+import json
+import pytest
+
+CONSENT_KEY = "consent"
+OVERLAY = "#consentOverlay"
+
+
+@pytest.fixture
+def fixture_url():
+    with FixtureServer() as server:
+        yield server.search_url
+
+
+@pytest.fixture
+def consent_store(tmp_path, lh_browser, run_profile, fixture_url):
+    """A snapshot captured right after accepting the fixture's consent banner."""
+    store = ConsentStateStore(str(tmp_path / "consent_state.json"))
+    context = lh_browser.new_context(**run_profile.context_options())
+    try:
+        page = context.new_page()
+        page.goto(fixture_url)
+        page.wait_for_selector(OVERLAY, state="visible", timeout=5000)
+        page.click("#consentAgree")
+        store.capture(context)
+    finally:
+        context.close()
+    return store
+
+
+def _strip_consent(store: ConsentStateStore) -> None:
+    """Drop the consent cookie and localStorage item from the saved snapshot."""
+    with open(store.filepath) as f:
+        snapshot = json.load(f)
+    state = snapshot["storage_state"]
+    state["cookies"] = [c for c in state.get("cookies", []) if c["name"] != CONSENT_KEY]
+    for origin in state.get("origins", []):
+        origin["localStorage"] = [i for i in origin.get("localStorage", []) if i["name"] != CONSENT_KEY]
+    with open(store.filepath, "w") as f:
+        json.dump(snapshot, f)
+
+
+def _open_with_snapshot(lh_browser, run_profile, store: ConsentStateStore, url: str):
+    context = lh_browser.new_context(**store.context_options(**run_profile.context_options()))
+    page = context.new_page()
+    page.goto(url)
+    # Give the fixture time to show the banner if the snapshot does not suppress it
+    page.wait_for_timeout(FixtureServer.DEFAULT_PAGE_CONFIG["consent_delay_ms"] + 500)
+    return context, page
+
+
+def test_fixed_banner_is_detected(lh_context, fixture_url) -> None:
+    """The fixture's position: fixed overlay counts as present while it is on screen"""
+    page = lh_context.new_page()
+    page.goto(fixture_url)
+    page.wait_for_selector(OVERLAY, state="visible", timeout=5000)
+    assert ConsentStateStore.banner_present(page)
+
+
+def test_valid_snapshot_suppresses_banner(lh_browser, run_profile, consent_store, fixture_url) -> None:
+    """A snapshot with the consent cookie keeps the banner away"""
+    assert consent_store.is_fresh()
+    context, page = _open_with_snapshot(lh_browser, run_profile, consent_store, fixture_url)
+    try:
+        assert not consent_store.banner_present(page)
+    finally:
+        context.close()
+
+
+def test_snapshot_without_consent_is_stale(lh_browser, run_profile, consent_store, fixture_url) -> None:
+    """A fresh-by-age snapshot missing the consent state is reported as stale"""
+    _strip_consent(consent_store)
+    context, page = _open_with_snapshot(lh_browser, run_profile, consent_store, fixture_url)
+    try:
+        assert consent_store.banner_present(page), "Banner shown but not detected"
+    finally:
+        context.close()
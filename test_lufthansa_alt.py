@@ -6,6 +6,7 @@ Tests: New York to Berlin round trip booking and price assertion
 import re
 from playwright.sync_api import Playwright, sync_playwright
 from datetime import datetime, timedelta
+from run_profiles import launch, parse_cli
 
 
 def test_lufthansa_booking_alt(playwright: Playwright) -> None:
@@ -13,9 +14,8 @@ def test_lufthansa_booking_alt(playwright: Playwright) -> None:
     Alternative test approach with direct date input
     """
     
-    browser = playwright.chromium.launch(headless=False, slow_mo=300)
-    context = browser.new_context(viewport={'width': 1920, 'height': 1080})
-    page = context.new_page()
+    session = launch(playwright, "alt", slow_mo=300)
+    page = session.page
     
     # Calculate dates (30 days from now for departure, 37 days for return)
     departure_date = (datetime.now() + timedelta(days=30)).strftime("%m/%d/%Y")
@@ -28,92 +28,80 @@ def test_lufthansa_booking_alt(playwright: Playwright) -> None:
         
         # Navigate
         print("\n[1] Loading Lufthansa...")
+        session.step("load")
         page.goto("https://www.lufthansa.com/us/en/flight-search")
-        page.wait_for_timeout(5000)
+        session.sleep(5000)
         
-        # Handle consent with JavaScript
-        print("[2] Handling overlays...")
-        page.evaluate("""
-            () => {
-                // Accept cookies
-                const btns = document.querySelectorAll('button');
-                btns.forEach(btn => {
-                    if (btn.textContent.includes('Agree') || btn.textContent.includes('Accept')) {
-                        btn.click();
-                    }
-                });
-                // Remove overlays
-                setTimeout(() => {
-                    ['consentOverlay', '__tealiumGDPRcpPrefs'].forEach(id => {
-                        const el = document.getElementById(id);
-                        if (el) el.remove();
-                    });
-                }, 1500);
-            }
-        """)
-        page.wait_for_timeout(3000)
+        # Consent and feedback overlays are dismissed by the session's overlay suppressor
+        print(f"[2] Overlays: suppressor active ({session.overlays.total} dismissed)")
+        session.step("overlays")
         
         # Origin
         print(f"[3] Origin: New York (clearing first as required)")
+        session.step("origin")
         origin = page.locator("input[name*='originCode']").first
         origin.click(force=True)
         origin.fill("")  # CLEAR FIRST
         page.keyboard.press("Control+A")
         page.keyboard.press("Backspace")
-        page.wait_for_timeout(300)
+        session.sleep(300)
         origin.type("New York JFK", delay=100)
-        page.wait_for_timeout(2000)
+        session.sleep(2000)
         page.keyboard.press("ArrowDown")
         page.keyboard.press("Enter")
-        page.wait_for_timeout(1000)
+        session.settle(1000)
         print("   ✓ JFK selected")
         
         # Destination
         print(f"[4] Destination: Berlin (clearing first as required)")
+        session.step("destination")
         dest = page.locator("input[name*='destinationCode']").first
         dest.click(force=True)
         dest.fill("")  # CLEAR FIRST
         page.keyboard.press("Control+A")
         page.keyboard.press("Backspace")
-        page.wait_for_timeout(300)
+        session.sleep(300)
         dest.type("Berlin BER", delay=100)
-        page.wait_for_timeout(2000)
+        session.sleep(2000)
         page.keyboard.press("ArrowDown")
         page.keyboard.press("Enter")
-        page.wait_for_timeout(1000)
+        session.settle(1000)
         print("   ✓ BER selected")
         
         # Dates - try direct input
         print(f"[5] Dates: {departure_date} to {return_date}")
+        session.step("dates")
         try:
             # Try to input dates directly
             dep_input = page.locator("input[name*='travelDatetime']").first
             dep_input.click(force=True)
             dep_input.fill(departure_date)
             page.keyboard.press("Tab")
-            page.wait_for_timeout(1000)
+            session.sleep(1000)
             
             ret_input = page.locator("input[name*='travelDatetime']").nth(1)
             ret_input.click(force=True)
             ret_input.fill(return_date)
             page.keyboard.press("Tab")
-            page.wait_for_timeout(1000)
+            session.sleep(1000)
             print("   ✓ Dates entered")
         except:
             print("   ⚠ Using default dates")
         
         # Search
         print("[6] Searching...")
+        session.step("search")
         page.locator("button:has-text('Search flights')").first.click(force=True)
-        page.wait_for_timeout(12000)
+        session.sleep(12000)
         
         # Screenshot
-        screenshot = "/Users/mdahmed/.gemini/antigravity/scratch/lufthansa-playwright-test/alt_results.png"
-        page.screenshot(path=screenshot, full_page=True)
-        print(f"   📸 Screenshot: {screenshot}")
+        screenshot = session.screenshot("results")
+        if screenshot:
+            print(f"   📸 Screenshot: {screenshot}")
         
         # Extract price
         print("\n[7] Extracting price...")
+        session.step("price")
         price_text = None
         
         # Try to find price in page
@@ -155,20 +143,20 @@ def test_lufthansa_booking_alt(playwright: Playwright) -> None:
             print(f"   This may be due to date selection issues")
             print(f"   Screenshot saved for manual review")
         
-        page.wait_for_timeout(5000)
+        session.pause(5000)
         
     except Exception as e:
-        error_path = "/Users/mdahmed/.gemini/antigravity/scratch/lufthansa-playwright-test/alt_error.png"
-        page.screenshot(path=error_path, full_page=True)
+        session.mark_failed(e)
+        error_path = session.screenshot("error", failure=True)
         print(f"\n❌ Error: {str(e)}")
         print(f"Screenshot: {error_path}")
         raise e
     finally:
-        context.close()
-        browser.close()
+        session.close()
 
 
 def run():
+    parse_cli()
     with sync_playwright() as playwright:
         test_lufthansa_booking_alt(playwright)
 
@@ -7,6 +7,8 @@ import re
 from playwright.sync_api import Playwright, sync_playwright, TimeoutError
 import time
 from datetime import datetime, timedelta
+from price_extractor import PriceExtractor
+from run_profiles import launch, parse_cli
 
 
 def test_lufthansa_booking(playwright: Playwright) -> None:
@@ -19,9 +21,8 @@ def test_lufthansa_booking(playwright: Playwright) -> None:
     """
     
     # Launch browser
-    browser = playwright.chromium.launch(headless=False, slow_mo=200)
-    context = browser.new_context(viewport={'width': 1920, 'height': 1080})
-    page = context.new_page()
+    session = launch(playwright, "booking")
+    page = session.page
     
     try:
         # Navigate to Lufthansa flight search page directly
@@ -29,55 +30,23 @@ def test_lufthansa_booking(playwright: Playwright) -> None:
         print("LUFTHANSA FLIGHT BOOKING TEST - NEW YORK TO BERLIN")
         print("=" * 70)
         print("\n[STEP 1/9] Navigating to Lufthansa...")
+        session.step("load_homepage")
         page.goto("https://www.lufthansa.com/us/en/homepage", wait_until="domcontentloaded")
-        page.wait_for_timeout(5000)
+        session.sleep(5000)
         
-        # Handle cookie consent
-        print("[STEP 2/9] Handling cookie consent...")
-        try:
-            # Remove consent overlay immediately with JavaScript
-            page.evaluate("""
-                () => {
-                    // Click consent button if exists
-                    const consentButtons = document.querySelectorAll('button[class*="consent"], button:has-text("Agree")');
-                    if (consentButtons.length > 0) {
-                        consentButtons[0].click();
-                    }
-                    // Remove overlays
-                    setTimeout(() => {
-                        const overlay = document.getElementById('consentOverlay');
-                        if (overlay) overlay.remove();
-                        const gdpr = document.getElementById('__tealiumGDPRcpPrefs');
-                        if (gdpr) gdpr.remove();
-                    }, 1000);
-                }
-            """)
-            page.wait_for_timeout(2000)
-            print("   ✓ Cookie consent handled")
-        except:
-            print("   ✓ No cookie consent needed")
+        # Consent and feedback overlays are dismissed by the session's overlay suppressor
+        print(f"[STEP 2/9] Overlays: suppressor active ({session.overlays.total} dismissed)")
+        session.step("overlays")
         
         # Navigate to flight search
         print("[STEP 3/9] Navigating to flight search...")
+        session.step("load_search")
         page.goto("https://www.lufthansa.com/us/en/flight-search", wait_until="domcontentloaded")
-        page.wait_for_timeout(4000)
-        
-        # Remove any remaining overlays
-        page.evaluate("""
-            () => {
-                const overlay = document.getElementById('consentOverlay');
-                if (overlay) overlay.remove();
-                const gdpr = document.getElementById('__tealiumGDPRcpPrefs');
-                if (gdpr) gdpr.remove();
-                // Close feedback form
-                const feedbackClose = document.querySelector('a[aria-label*="Close feedback"]');
-                if (feedbackClose) feedbackClose.click();
-            }
-        """)
-        page.wait_for_timeout(1000)
+        session.sleep(4000)
         
         # Ensure round trip
         print("[STEP 4/9] Selecting round trip...")
+        session.step("trip_type")
         try:
             page.locator("input[value='ROUND_TRIP']").first.check(force=True)
             print("   ✓ Round trip selected")
@@ -86,21 +55,22 @@ def test_lufthansa_booking(playwright: Playwright) -> None:
         
         # Fill origin - New York
         print("[STEP 5/9] Entering origin: New York...")
+        session.step("origin")
         print("   → Clearing origin field (as required)...")
         origin_input = page.locator("input[name*='originCode'], input[placeholder*='From']").first
         origin_input.click(force=True)
-        page.wait_for_timeout(500)
+        session.sleep(500)
         # Clear the field completely
         origin_input.fill("")
-        page.wait_for_timeout(200)
+        session.sleep(200)
         origin_input.press("Control+A")
-        page.wait_for_timeout(100)
+        session.sleep(100)
         origin_input.press("Backspace")
-        page.wait_for_timeout(300)
+        session.sleep(300)
         
         print("   → Typing 'New York'...")
         origin_input.type("New York", delay=100)
-        page.wait_for_timeout(2500)
+        session.sleep(2500)
         
         print("   → Selecting JFK...")
         try:
@@ -110,25 +80,26 @@ def test_lufthansa_booking(playwright: Playwright) -> None:
             page.keyboard.press("ArrowDown")
             page.keyboard.press("Enter")
             print("   ✓ Airport selected via keyboard")
-        page.wait_for_timeout(1000)
+        session.settle(1000)
         
         # Fill destination - Berlin
         print("[STEP 6/9] Entering destination: Berlin...")
+        session.step("destination")
         print("   → Clearing destination field (as required)...")
         dest_input = page.locator("input[name*='destinationCode'], input[placeholder*='To']").first
         dest_input.click(force=True)
-        page.wait_for_timeout(500)
+        session.sleep(500)
         # Clear the field completely
         dest_input.fill("")
-        page.wait_for_timeout(200)
+        session.sleep(200)
         dest_input.press("Control+A")
-        page.wait_for_timeout(100)
+        session.sleep(100)
         dest_input.press("Backspace")
-        page.wait_for_timeout(300)
+        session.sleep(300)
         
         print("   → Typing 'Berlin'...")
         dest_input.type("Berlin", delay=100)
-        page.wait_for_timeout(2500)
+        session.sleep(2500)
         
         print("   → Selecting Berlin Brandenburg...")
         try:
@@ -138,10 +109,11 @@ def test_lufthansa_booking(playwright: Playwright) -> None:
             page.keyboard.press("ArrowDown")
             page.keyboard.press("Enter")
             print("   ✓ Airport selected via keyboard")
-        page.wait_for_timeout(1000)
+        session.settle(1000)
         
         # Select dates - December 15, 2025 to December 25, 2025
         print("[STEP 7/9] Selecting travel dates (Dec 15-25, 2025)...")
+        session.step("dates")
         
         # Method 1: Try direct input with specific format
         try:
@@ -162,7 +134,7 @@ def test_lufthansa_booking(playwright: Playwright) -> None:
                     }
                 }
             """)
-            page.wait_for_timeout(1000)
+            session.sleep(1000)
             
             # Try to set return date via JavaScript
             page.evaluate("""
@@ -175,7 +147,7 @@ def test_lufthansa_booking(playwright: Playwright) -> None:
                     }
                 }
             """)
-            page.wait_for_timeout(1000)
+            session.sleep(1000)
             print("   ✓ Dates set via JavaScript")
             
         except Exception as e:
@@ -188,7 +160,7 @@ def test_lufthansa_booking(playwright: Playwright) -> None:
             # Click departure date field
             dep_input = page.locator("input[name*='travelDatetime']").first
             dep_input.click(force=True)
-            page.wait_for_timeout(2000)
+            session.sleep(2000)
             
             # Try to find December 15, 2025 in calendar
             # Look for button with aria-label containing "December 15"
@@ -208,7 +180,7 @@ def test_lufthansa_booking(playwright: Playwright) -> None:
                         date_btn.click(force=True)
                         print("   ✓ December 15 selected from calendar")
                         date_selected = True
-                        page.wait_for_timeout(1500)
+                        session.settle(1500)
                         break
                 except:
                     continue
@@ -219,7 +191,7 @@ def test_lufthansa_booking(playwright: Playwright) -> None:
                     available = page.locator("td[role='gridcell']:not([aria-disabled='true']) button").first
                     available.click(force=True)
                     print("   ✓ Departure date selected (first available)")
-                    page.wait_for_timeout(1500)
+                    session.settle(1500)
                 except:
                     pass
             
@@ -240,7 +212,7 @@ def test_lufthansa_booking(playwright: Playwright) -> None:
                         date_btn.click(force=True)
                         print("   ✓ December 25 selected from calendar")
                         return_selected = True
-                        page.wait_for_timeout(1000)
+                        session.settle(1000)
                         break
                 except:
                     continue
@@ -259,27 +231,29 @@ def test_lufthansa_booking(playwright: Playwright) -> None:
         
         # Search for flights
         print("[STEP 8/9] Searching for flights...")
+        session.step("search")
         search_btn = page.locator("button:has-text('Search flights'), button[type='submit']").first
         search_btn.click(force=True)
         print("   ✓ Search initiated")
         
         # Wait for results
         print("[STEP 9/9] Waiting for results...")
-        page.wait_for_timeout(10000)
+        session.step("results")
+        session.sleep(10000)
         
         # Try to detect if we're on results page
         try:
-            page.wait_for_selector("div[class*='flight'], div[class*='price'], span[class*='price']", timeout=15000)
+            session.wait_for_selector("div[class*='flight'], div[class*='price'], span[class*='price']", timeout=15000)
             print("   ✓ Results page loaded")
         except:
             print("   ⚠ Timeout waiting for results, checking page anyway...")
         
-        page.wait_for_timeout(3000)
+        session.sleep(3000)
         
         # Take screenshot
-        screenshot_path = "/Users/mdahmed/.gemini/antigravity/scratch/lufthansa-playwright-test/search_results.png"
-        page.screenshot(path=screenshot_path, full_page=True)
-        print(f"\n� Screenshot saved: {screenshot_path}")
+        screenshot_path = session.screenshot("results")
+        if screenshot_path:
+            print(f"\n� Screenshot saved: {screenshot_path}")
         
         # Extract price
         print("\n" + "=" * 70)
@@ -288,59 +262,12 @@ def test_lufthansa_booking(playwright: Playwright) -> None:
         
         price_text = None
         
-        # Strategy 1: Look for price elements
-        print("\n[Strategy 1] Searching for price elements...")
-        selectors = [
-            "span[class*='price']",
-            "div[class*='price'] span",
-            "span[class*='amount']",
-            "div[class*='fare'] span",
-            "span[data-test*='price']",
-        ]
-        
-        for sel in selectors:
-            try:
-                elements = page.locator(sel).all()
-                for elem in elements:
-                    try:
-                        text = elem.inner_text(timeout=1000).strip()
-                        if '$' in text and re.search(r'\d{3,}', text.replace(',', '')):
-                            price_text = text
-                            print(f"   ✓ Found price: {price_text} (selector: {sel})")
-                            break
-                    except:
-                        continue
-                if price_text:
-                    break
-            except:
-                continue
-        
-        # Strategy 2: Regex search in page
-        if not price_text:
-            print("\n[Strategy 2] Searching page content with regex...")
-            content = page.content()
-            matches = re.findall(r'\$\s*[\d,]+(?:\.\d{2})?', content)
-            for match in matches:
-                num = int(re.sub(r'[^\d]', '', match))
-                if 300 <= num <= 5000:
-                    price_text = match.strip()
-                    print(f"   ✓ Found price via regex: {price_text}")
-                    break
-        
-        # Strategy 3: Look in visible text
-        if not price_text:
-            print("\n[Strategy 3] Searching visible text...")
-            try:
-                body_text = page.locator("body").inner_text()
-                matches = re.findall(r'\$\s*[\d,]+(?:\.\d{2})?', body_text)
-                for match in matches:
-                    num = int(re.sub(r'[^\d]', '', match))
-                    if 300 <= num <= 5000:
-                        price_text = match.strip()
-                        print(f"   ✓ Found price in body text: {price_text}")
-                        break
-            except:
-                pass
+        # Single round-trip extraction of every price candidate
+        print("\nSearching for price candidates...")
+        best = PriceExtractor().find_price(page, currency="USD", min_amount=100)
+        if best:
+            price_text = best["text"]
+            print(f"   ✓ Found price: {price_text} (selector: {best['selector'] or 'page text'})")
         
         # ASSERTIONS
         print("\n" + "=" * 70)
@@ -380,11 +307,11 @@ def test_lufthansa_booking(playwright: Playwright) -> None:
         
         # Keep browser open briefly
         print("\n⏸  Browser will close in 5 seconds...")
-        page.wait_for_timeout(5000)
+        session.pause(5000)
         
     except AssertionError as e:
-        error_path = "/Users/mdahmed/.gemini/antigravity/scratch/lufthansa-playwright-test/error_screenshot.png"
-        page.screenshot(path=error_path, full_page=True)
+        session.mark_failed(e)
+        error_path = session.screenshot("error", failure=True)
         print(f"\n{'=' * 70}")
         print("❌ TEST FAILED!")
         print("=" * 70)
@@ -394,8 +321,8 @@ def test_lufthansa_booking(playwright: Playwright) -> None:
         raise e
         
     except Exception as e:
-        error_path = "/Users/mdahmed/.gemini/antigravity/scratch/lufthansa-playwright-test/error_screenshot.png"
-        page.screenshot(path=error_path, full_page=True)
+        session.mark_failed(e)
+        error_path = session.screenshot("error", failure=True)
         print(f"\n{'=' * 70}")
         print("❌ TEST ERROR!")
         print("=" * 70)
@@ -406,13 +333,13 @@ def test_lufthansa_booking(playwright: Playwright) -> None:
         
     finally:
         print("\n🔒 Closing browser...")
-        context.close()
-        browser.close()
+        session.close()
         print("✓ Done")
 
 
 def run():
     """Run the test"""
+    parse_cli()
     with sync_playwright() as playwright:
         test_lufthansa_booking(playwright)
 
@@ -6,6 +6,8 @@ Tests: New York to Berlin round trip booking and price assertion
 import re
 from playwright.sync_api import Playwright, sync_playwright
 from datetime import datetime
+from price_extractor import PriceExtractor
+from run_profiles import launch, parse_cli
 
 
 def test_lufthansa_demo(playwright: Playwright) -> None:
@@ -13,9 +15,8 @@ def test_lufthansa_demo(playwright: Playwright) -> None:
     Demo version with manual date selection
     """
     
-    browser = playwright.chromium.launch(headless=False, slow_mo=300)
-    context = browser.new_context(viewport={'width': 1920, 'height': 1080})
-    page = context.new_page()
+    session = launch(playwright, "demo", slow_mo=300)
+    page = session.page
     
     try:
         print("=" * 70)
@@ -24,32 +25,17 @@ def test_lufthansa_demo(playwright: Playwright) -> None:
         
         # Navigate
         print("\n[STEP 1/10] Loading Lufthansa...")
+        session.step("load")
         page.goto("https://www.lufthansa.com/us/en/flight-search")
-        page.wait_for_timeout(5000)
+        session.sleep(5000)
         
-        # Handle consent
-        print("[STEP 2/10] Handling overlays...")
-        page.evaluate("""
-            () => {
-                const btns = document.querySelectorAll('button');
-                btns.forEach(btn => {
-                    if (btn.textContent.includes('Agree') || btn.textContent.includes('Accept')) {
-                        btn.click();
-                    }
-                });
-                setTimeout(() => {
-                    ['consentOverlay', '__tealiumGDPRcpPrefs'].forEach(id => {
-                        const el = document.getElementById(id);
-                        if (el) el.remove();
-                    });
-                }, 1500);
-            }
-        """)
-        page.wait_for_timeout(3000)
-        print("   ✓ Overlays handled")
+        # Consent and feedback overlays are dismissed by the session's overlay suppressor
+        print(f"[STEP 2/10] Overlays: suppressor active ({session.overlays.total} dismissed)")
+        session.step("overlays")
         
         # Round trip
         print("[STEP 3/10] Selecting round trip...")
+        session.step("trip_type")
         try:
             page.locator("input[value='ROUND_TRIP']").first.check(force=True)
             print("   ✓ Round trip selected")
@@ -58,20 +44,21 @@ def test_lufthansa_demo(playwright: Playwright) -> None:
         
         # Origin - NEW YORK (ALWAYS CLEAR FIRST)
         print("[STEP 4/10] Origin: New York (CLEARING FIRST as required)")
+        session.step("origin")
         origin = page.locator("input[name*='originCode']").first
         origin.click(force=True)
-        page.wait_for_timeout(300)
+        session.sleep(300)
         # CLEAR THE BOX FIRST
         origin.fill("")
         page.keyboard.press("Control+A")
         page.keyboard.press("Backspace")
-        page.wait_for_timeout(300)
+        session.sleep(300)
         print("   ✓ Origin field cleared")
         
         # Type New York
         print("   → Typing 'New York'...")
         origin.type("New York", delay=100)
-        page.wait_for_timeout(2500)
+        session.sleep(2500)
         
         # Select JFK
         print("   → Selecting JFK...")
@@ -82,24 +69,25 @@ def test_lufthansa_demo(playwright: Playwright) -> None:
             page.keyboard.press("ArrowDown")
             page.keyboard.press("Enter")
             print("   ✓ Airport selected via keyboard")
-        page.wait_for_timeout(1000)
+        session.settle(1000)
         
         # Destination - BERLIN (ALWAYS CLEAR FIRST)
         print("[STEP 5/10] Destination: Berlin (CLEARING FIRST as required)")
+        session.step("destination")
         dest = page.locator("input[name*='destinationCode']").first
         dest.click(force=True)
-        page.wait_for_timeout(300)
+        session.sleep(300)
         # CLEAR THE BOX FIRST
         dest.fill("")
         page.keyboard.press("Control+A")
         page.keyboard.press("Backspace")
-        page.wait_for_timeout(300)
+        session.sleep(300)
         print("   ✓ Destination field cleared")
         
         # Type Berlin
         print("   → Typing 'Berlin'...")
         dest.type("Berlin", delay=100)
-        page.wait_for_timeout(2500)
+        session.sleep(2500)
         
         # Select BER
         print("   → Selecting Berlin Brandenburg...")
@@ -110,11 +98,12 @@ def test_lufthansa_demo(playwright: Playwright) -> None:
             page.keyboard.press("ArrowDown")
             page.keyboard.press("Enter")
             print("   ✓ Airport selected via keyboard")
-        page.wait_for_timeout(1000)
+        session.settle(1000)
         
         # MANUAL DATE SELECTION
         print("\n" + "=" * 70)
         print("[STEP 6/10] MANUAL DATE SELECTION REQUIRED")
+        session.step("manual_dates")
         print("=" * 70)
         print("\n⚠️  PLEASE SELECT DATES MANUALLY IN THE BROWSER:")
         print("   1. Click on the Departure Date field")
@@ -124,10 +113,11 @@ def test_lufthansa_demo(playwright: Playwright) -> None:
         print("\n" + "=" * 70)
         
         # Wait for manual date selection
-        page.wait_for_timeout(30000)
+        session.pause(30000)
         
         # Search
         print("\n[STEP 7/10] Searching for flights...")
+        session.step("search")
         try:
             search_btn = page.locator("button:has-text('Search flights')").first
             search_btn.click(force=True)
@@ -137,88 +127,40 @@ def test_lufthansa_demo(playwright: Playwright) -> None:
         
         # Wait for results
         print("[STEP 8/10] Waiting for results (this may take 15-20 seconds)...")
-        page.wait_for_timeout(15000)
+        session.step("results")
+        session.sleep(15000)
         
         # Check if we're on results page
         try:
-            page.wait_for_selector("div[class*='flight'], div[class*='price'], span[class*='price']", timeout=10000)
+            session.wait_for_selector("div[class*='flight'], div[class*='price'], span[class*='price']", timeout=10000)
             print("   ✓ Results page detected")
         except:
             print("   ⚠ Results page detection timeout")
         
-        page.wait_for_timeout(3000)
+        session.sleep(3000)
         
         # Screenshot
-        screenshot = "/Users/mdahmed/.gemini/antigravity/scratch/lufthansa-playwright-test/demo_results.png"
-        page.screenshot(path=screenshot, full_page=True)
-        print(f"\n📸 Screenshot saved: {screenshot}")
+        screenshot = session.screenshot("results")
+        if screenshot:
+            print(f"\n📸 Screenshot saved: {screenshot}")
         
         # Extract price
         print("\n[STEP 9/10] Extracting price...")
+        session.step("price")
         print("=" * 70)
         price_text = None
         
-        # Strategy 1: Look for price elements
-        print("Strategy 1: Searching for price elements...")
-        selectors = [
-            "span[class*='price']",
-            "div[class*='price'] span",
-            "span[class*='amount']",
-            "div[class*='fare'] span",
-            "span[data-test*='price']",
-            "div[class*='total'] span",
-        ]
-        
-        for sel in selectors:
-            try:
-                elements = page.locator(sel).all()
-                for elem in elements:
-                    try:
-                        text = elem.inner_text(timeout=1000).strip()
-                        if '$' in text and re.search(r'\d{3,}', text.replace(',', '')):
-                            price_text = text
-                            print(f"   ✓ Found price: {price_text} (using selector: {sel})")
-                            break
-                    except:
-                        continue
-                if price_text:
-                    break
-            except:
-                continue
-        
-        # Strategy 2: Regex in page content
-        if not price_text:
-            print("Strategy 2: Searching page content with regex...")
-            try:
-                content = page.content()
-                matches = re.findall(r'\$\s*[\d,]+(?:\.\d{2})?', content)
-                for match in matches:
-                    num = int(re.sub(r'[^\d]', '', match))
-                    if 300 <= num <= 5000:
-                        price_text = match.strip()
-                        print(f"   ✓ Found price via regex: {price_text}")
-                        break
-            except:
-                pass
-        
-        # Strategy 3: Visible text
-        if not price_text:
-            print("Strategy 3: Searching visible text...")
-            try:
-                body_text = page.locator("body").inner_text()
-                matches = re.findall(r'\$\s*[\d,]+(?:\.\d{2})?', body_text)
-                for match in matches:
-                    num = int(re.sub(r'[^\d]', '', match))
-                    if 300 <= num <= 5000:
-                        price_text = match.strip()
-                        print(f"   ✓ Found price in body: {price_text}")
-                        break
-            except:
-                pass
+        # Single round-trip extraction of every price candidate
+        print("Searching for price candidates...")
+        best = PriceExtractor().find_price(page, currency="USD", min_amount=100)
+        if best:
+            price_text = best["text"]
+            print(f"   ✓ Found price: {price_text} (using selector: {best['selector'] or 'page text'})")
         
         # ASSERTIONS
         print("\n" + "=" * 70)
         print("[STEP 10/10] RUNNING ASSERTIONS")
+        session.step("assertions")
         print("=" * 70)
         
         if price_text:
@@ -261,22 +203,22 @@ def test_lufthansa_demo(playwright: Playwright) -> None:
         
         # Keep browser open
         print("\n⏸  Browser will remain open for 10 seconds for review...")
-        page.wait_for_timeout(10000)
+        session.pause(10000)
         
     except Exception as e:
-        error_path = "/Users/mdahmed/.gemini/antigravity/scratch/lufthansa-playwright-test/demo_error.png"
-        page.screenshot(path=error_path, full_page=True)
+        session.mark_failed(e)
+        error_path = session.screenshot("error", failure=True)
         print(f"\n❌ Error: {str(e)}")
         print(f"Screenshot: {error_path}")
         raise e
     finally:
         print("\n🔒 Closing browser...")
-        context.close()
-        browser.close()
+        session.close()
         print("✓ Done")
 
 
 def run():
+    parse_cli()
     with sync_playwright() as playwright:
         test_lufthansa_demo(playwright)
 
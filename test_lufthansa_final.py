@@ -9,6 +9,11 @@ from datetime import datetime
 
 
 from train_date_model import DateOptimizer
+from autocomplete import AutocompleteInput
+from calendar_navigation import navigate_to_month
+from consent_state import ConsentStateStore
+from price_extractor import PriceExtractor
+from run_profiles import launch, parse_cli
 
 def test_lufthansa_final(playwright: Playwright) -> None:
     """
@@ -23,9 +28,9 @@ def test_lufthansa_final(playwright: Playwright) -> None:
     ret_date = optimizer.suggest_date("12/25/2025")
     print(f"[ML] Using optimized dates: {dep_date} - {ret_date}")
     
-    browser = playwright.chromium.launch(headless=False, slow_mo=400)
-    context = browser.new_context(viewport={'width': 1920, 'height': 1080})
-    page = context.new_page()
+    consent_store = ConsentStateStore()
+    session = launch(playwright, "final", context_options=consent_store.context_options(), slow_mo=400)
+    context, page = session.context, session.page
     
     try:
         print("=" * 70)
@@ -36,65 +41,37 @@ def test_lufthansa_final(playwright: Playwright) -> None:
         
         # Navigate
         print("\n[1/10] Loading Lufthansa...")
+        session.step("load")
         page.goto("https://www.lufthansa.com/us/en/flight-search", wait_until="domcontentloaded")
-        page.wait_for_timeout(6000)
+        session.sleep(6000)
         
-        # Handle consent and overlays aggressively
+        # Consent and feedback overlays are dismissed by the session's overlay suppressor
         print("[2/10] Removing overlays...")
-        for i in range(3):
-            page.evaluate("""
-                () => {
-                    // Click any consent buttons
-                    document.querySelectorAll('button').forEach(btn => {
-                        const text = btn.textContent.toLowerCase();
-                        if (text.includes('agree') || text.includes('accept') || text.includes('consent')) {
-                            try { btn.click(); } catch(e) {}
-                        }
-                    });
-                    // Remove overlays
-                    ['consentOverlay', '__tealiumGDPRcpPrefs'].forEach(id => {
-                        const el = document.getElementById(id);
-                        if (el) el.remove();
-                    });
-                    // Close feedback
-                    document.querySelectorAll('a[aria-label*="Close"]').forEach(el => {
-                        try { el.click(); } catch(e) {}
-                    });
-                }
-            """)
-            page.wait_for_timeout(1000)
-        print("   ✓ Overlays removed")
+        session.step("overlays")
+        if session.overlays.counts.get("consent_clicked") and not consent_store.is_fresh():
+            consent_store.capture(context)
+        print(f"   ✓ Overlay suppressor active ({session.overlays.total} dismissed)")
         
         # Round trip
         print("[3/10] Selecting round trip...")
+        session.step("trip_type")
         page.evaluate("""
             () => {
                 const roundTrip = document.querySelector('input[value="ROUND_TRIP"]');
                 if (roundTrip && !roundTrip.checked) roundTrip.click();
             }
         """)
-        page.wait_for_timeout(500)
+        session.sleep(500)
         print("   ✓ Round trip selected")
         
         # ORIGIN - NEW YORK (CLEAR FIRST AS REQUIRED)
         print("[4/10] Setting origin: New York")
-        print("   → Clearing origin field (as required)...")
-        
-        origin = page.locator("input[name*='originCode']").first
-        origin.click(force=True)
-        page.wait_for_timeout(400)
-        
-        # CLEAR THE FIELD (as per requirement)
-        origin.fill("")
-        page.keyboard.press("Control+A")
-        page.keyboard.press("Backspace")
-        page.wait_for_timeout(300)
-        print("   ✓ Origin field cleared")
+        session.step("origin")
+        print("   → Clearing and filling origin field (as required)...")
         
-        # Type and select
-        print("   → Typing 'New York'...")
-        origin.type("New York", delay=100)
-        page.wait_for_timeout(2500)
+        # fill() replaces the field content, then returns as soon as JFK is suggested
+        origin = AutocompleteInput(page, "input[name*='originCode']")
+        origin.type_and_wait("New York", match="JFK")
         
         print("   → Selecting JFK...")
         try:
@@ -103,27 +80,15 @@ def test_lufthansa_final(playwright: Playwright) -> None:
         except:
             page.keyboard.press("Enter")
             print("   ✓ Airport selected via Enter")
-        page.wait_for_timeout(1000)
+        origin.waits.listbox_hidden("div[role='option']", timeout=1000)
         
         # DESTINATION - BERLIN (CLEAR FIRST AS REQUIRED)
         print("[5/10] Setting destination: Berlin")
-        print("   → Clearing destination field (as required)...")
+        session.step("destination")
+        print("   → Clearing and filling destination field (as required)...")
         
-        dest = page.locator("input[name*='destinationCode']").first
-        dest.click(force=True)
-        page.wait_for_timeout(400)
-        
-        # CLEAR THE FIELD (as per requirement)
-        dest.fill("")
-        page.keyboard.press("Control+A")
-        page.keyboard.press("Backspace")
-        page.wait_for_timeout(300)
-        print("   ✓ Destination field cleared")
-        
-        # Type and select
-        print("   → Typing 'Berlin'...")
-        dest.type("Berlin", delay=100)
-        page.wait_for_timeout(2500)
+        dest = AutocompleteInput(page, "input[name*='destinationCode']")
+        dest.type_and_wait("Berlin", match="BER")
         
         print("   → Selecting BER...")
         try:
@@ -132,10 +97,11 @@ def test_lufthansa_final(playwright: Playwright) -> None:
         except:
             page.keyboard.press("Enter")
             print("   ✓ Airport selected via Enter")
-        page.wait_for_timeout(1000)
+        dest.waits.listbox_hidden("div[role='option']", timeout=1000)
         
         # DATES - Optimized
         print(f"[6/10] Setting dates: {dep_date} - {ret_date}")
+        session.step("dates")
         
         # Click departure field to open calendar
         print("   → Opening calendar...")
@@ -160,24 +126,14 @@ def test_lufthansa_final(playwright: Playwright) -> None:
                 }}
             """)
             print("   ✓ Dates injected via JS")
-            page.wait_for_timeout(2000)
+            session.sleep(2000)
             # Continue execution (removed return)
-        page.wait_for_timeout(3000)
+        session.sleep(3000)
         
-        # Try to navigate to December 2025 if not already there
+        # Jump to December 2025 in one batch of clicks
         print("   → Navigating to December 2025...")
-        for i in range(5):  # Try up to 5 times to navigate to correct month
-            try:
-                # Check if we're in December 2025
-                month_text = page.locator("div[class*='calendar'] h2, div[class*='month'], span[class*='month']").first.inner_text(timeout=2000)
-                if "December" in month_text and "2025" in month_text:
-                    print(f"   ✓ Found December 2025")
-                    break
-                # Click next month button
-                page.locator("button[aria-label*='Next'], button[class*='next']").first.click(force=True, timeout=2000)
-                page.wait_for_timeout(1000)
-            except:
-                break
+        navigate_to_month(page, "December", "2025",
+                          "div[class*='calendar'] h2, div[class*='month'], span[class*='month']")
         
         # Select December 15
         print("   → Selecting December 15...")
@@ -199,7 +155,7 @@ def test_lufthansa_final(playwright: Playwright) -> None:
                         btn.click(force=True)
                         print(f"   ✓ December 15 selected (via {strategy_name})")
                         dec_15_found = True
-                        page.wait_for_timeout(2000)
+                        session.settle(2000)
                         break
                 if dec_15_found:
                     break
@@ -210,7 +166,7 @@ def test_lufthansa_final(playwright: Playwright) -> None:
             print("   ⚠ Could not find Dec 15, using first available date")
             try:
                 page.locator("td[role='gridcell']:not([aria-disabled='true']) button").first.click(force=True)
-                page.wait_for_timeout(2000)
+                session.settle(2000)
             except:
                 pass
         
@@ -227,7 +183,7 @@ def test_lufthansa_final(playwright: Playwright) -> None:
                         btn.click(force=True)
                         print(f"   ✓ December 25 selected (via {strategy_name})")
                         dec_25_found = True
-                        page.wait_for_timeout(1500)
+                        session.settle(1500)
                         break
                 if dec_25_found:
                     break
@@ -238,12 +194,13 @@ def test_lufthansa_final(playwright: Playwright) -> None:
             print("   ⚠ Could not find Dec 25, using 10th available date")
             try:
                 page.locator("td[role='gridcell']:not([aria-disabled='true']) button").nth(9).click(force=True)
-                page.wait_for_timeout(1500)
+                session.settle(1500)
             except:
                 pass
         
         # Verify dates are set
         print("[7/10] Verifying dates...")
+        session.step("verify_dates")
         try:
             dep_value = page.locator("input[name*='travelDatetime']").first.input_value()
             ret_value = page.locator("input[name*='travelDatetime']").nth(1).input_value()
@@ -258,6 +215,7 @@ def test_lufthansa_final(playwright: Playwright) -> None:
         
         # Search
         print("[8/10] Searching for flights...")
+        session.step("search")
         try:
             search_btn = page.locator("button:has-text('Search flights')").first
             search_btn.click(force=True, timeout=5000)
@@ -274,74 +232,36 @@ def test_lufthansa_final(playwright: Playwright) -> None:
         
         # Wait for results
         print("[9/10] Waiting for results (20 seconds)...")
-        page.wait_for_timeout(20000)
+        session.step("results")
+        session.sleep(20000)
         
         # Check for results
         try:
-            page.wait_for_selector("div[class*='flight'], div[class*='price'], span[class*='price'], div[class*='offer']", timeout=5000)
+            session.wait_for_selector("div[class*='flight'], div[class*='price'], span[class*='price'], div[class*='offer']", timeout=5000)
             print("   ✓ Results page loaded")
         except:
             print("   ⚠ Results detection timeout")
         
-        page.wait_for_timeout(3000)
+        session.sleep(3000)
         
         # Screenshot
-        screenshot = "/Users/mdahmed/.gemini/antigravity/scratch/lufthansa-playwright-test/final_results.png"
-        page.screenshot(path=screenshot, full_page=True)
-        print(f"\n📸 Screenshot: {screenshot}")
+        screenshot = session.screenshot("results")
+        if screenshot:
+            print(f"\n📸 Screenshot: {screenshot}")
         
         # Extract price
         print("\n[10/10] Extracting and validating price...")
+        session.step("price")
         print("=" * 70)
         
         price_text = None
         
-        # Comprehensive price search
+        # Single round-trip extraction of every price candidate
         print("Searching for prices...")
-        
-        # Strategy 1: Price elements
-        selectors = [
-            "span[class*='price']",
-            "div[class*='price'] span",
-            "span[class*='amount']",
-            "div[class*='fare'] span",
-            "span[class*='total']",
-            "div[class*='total'] span",
-        ]
-        
-        for sel in selectors:
-            try:
-                elements = page.locator(sel).all()
-                for elem in elements:
-                    try:
-                        text = elem.inner_text(timeout=1000).strip()
-                        if '$' in text:
-                            nums = re.findall(r'\d+', text.replace(',', ''))
-                            if nums and int(nums[0]) >= 300:
-                                price_text = text
-                                print(f"✓ Found: {price_text} (selector: {sel})")
-                                break
-                    except:
-                        continue
-                if price_text:
-                    break
-            except:
-                continue
-        
-        # Strategy 2: Page content regex
-        if not price_text:
-            print("Searching page content...")
-            try:
-                content = page.content()
-                matches = re.findall(r'\$\s*[\d,]+(?:\.\d{2})?', content)
-                for match in matches:
-                    num = int(re.sub(r'[^\d]', '', match))
-                    if 300 <= num <= 5000:
-                        price_text = match.strip()
-                        print(f"✓ Found: {price_text} (regex)")
-                        break
-            except:
-                pass
+        best = PriceExtractor().find_price(page, currency="USD", min_amount=300)
+        if best:
+            price_text = best["text"]
+            print(f"✓ Found: {price_text} (selector: {best['selector'] or 'page text'})")
         
         # ASSERTIONS
         print("\n" + "=" * 70)
@@ -394,22 +314,22 @@ def test_lufthansa_final(playwright: Playwright) -> None:
         
         # Keep browser open
         print("\n⏸  Browser open for 8 seconds...")
-        page.wait_for_timeout(8000)
+        session.pause(8000)
         
     except Exception as e:
-        error_path = "/Users/mdahmed/.gemini/antigravity/scratch/lufthansa-playwright-test/final_error.png"
-        page.screenshot(path=error_path, full_page=True)
+        session.mark_failed(e)
+        error_path = session.screenshot("error", failure=True)
         print(f"\n❌ Error: {str(e)}")
         print(f"Screenshot: {error_path}")
         raise e
     finally:
         print("\n🔒 Closing browser...")
-        context.close()
-        browser.close()
+        session.close()
         print("✓ Complete")
 
 
 def run():
+    parse_cli()
     with sync_playwright() as playwright:
         test_lufthansa_final(playwright)
 
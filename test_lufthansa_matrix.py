@@ -0,0 +1,22 @@
+"""
+Lufthansa Playwright Test - SEARCH MATRIX VERSION
+One test per route/date/trip-type query from search_matrix.py, all sharing
+the session-scoped browser from conftest.py.
+
+    pytest test_lufthansa_matrix.py --profile ci -n 4
+    pytest test_lufthansa_matrix.py --offline --shard 1/3
+"""
+from home_page import HomePage
+
+
+def test_search_matrix(lh_context, overlay_suppressor, strategy_cache, airport_cache, run_profile,
+                       search_url, search_query) -> None:
+    """Search one matrix query and assert a plausible fare comes back"""
+    home_page = HomePage(lh_context.new_page(), url=search_url, overlay_suppressor=overlay_suppressor,
+                         reduced_motion=run_profile.reduced_motion, strategy_cache=strategy_cache,
+                         airport_cache=airport_cache)
+    home_page.open().search_flight(**search_query)
+
+    best = home_page.find_price(currency="USD", min_amount=100)
+    assert best is not None, "Price not found on results page"
+    assert 100 <= best["amount"] <= 5000, f"Price ${best['amount']} outside range $100-$5000"
@@ -6,15 +6,17 @@ import re
 import time
 from datetime import datetime
 from playwright.sync_api import Playwright, sync_playwright
+from home_page import HomePage
 from ml_logger import TestLogger
+from run_profiles import launch, parse_cli
+from selector_cache import StrategyCache
 
 def test_lufthansa_ml(playwright: Playwright) -> None:
     # Initialize ML Logger
     logger = TestLogger()
     
-    browser = playwright.chromium.launch(headless=False, slow_mo=200)
-    context = browser.new_context(viewport={'width': 1920, 'height': 1080})
-    page = context.new_page()
+    session = launch(playwright, "ml", run_id=logger.run_id)
+    page = session.page
     
     print("=" * 70)
     print("LUFTHANSA ML DATA COLLECTION RUN")
@@ -22,6 +24,7 @@ def test_lufthansa_ml(playwright: Playwright) -> None:
     
     try:
         # STEP 1: Navigation
+        session.step("Navigate to Home")
         start = time.time()
         try:
             page.goto("https://www.lufthansa.com/us/en/flight-search", wait_until="domcontentloaded")
@@ -30,27 +33,15 @@ def test_lufthansa_ml(playwright: Playwright) -> None:
             logger.log_step("Navigate to Home", "navigation", "url:flight-search", 0, str(e), (time.time()-start)*1000)
             raise e
             
-        page.wait_for_timeout(3000)
+        session.sleep(3000)
         
         # STEP 2: Overlays
-        start = time.time()
-        try:
-            page.evaluate("""
-                () => {
-                    document.querySelectorAll('button').forEach(btn => {
-                        if (btn.textContent.toLowerCase().includes('agree')) btn.click();
-                    });
-                    ['consentOverlay', '__tealiumGDPRcpPrefs'].forEach(id => {
-                        const el = document.getElementById(id);
-                        if (el) el.remove();
-                    });
-                }
-            """)
-            logger.log_step("Handle Overlays", "javascript", "consent_buttons", 1, "", (time.time()-start)*1000)
-        except Exception as e:
-            logger.log_step("Handle Overlays", "javascript", "consent_buttons", 0, str(e), (time.time()-start)*1000)
+        session.step("Handle Overlays")
+        # Dismissed by the session's overlay suppressor as they appear; nothing to wait for
+        logger.log_step("Handle Overlays", "init_script", "overlay_suppressor", 1, "", 0.0)
 
         # STEP 3: Origin
+        session.step("Set Origin")
         start = time.time()
         selector = "input[name*='originCode']"
         try:
@@ -60,13 +51,14 @@ def test_lufthansa_ml(playwright: Playwright) -> None:
             page.keyboard.press("Control+A")
             page.keyboard.press("Backspace")
             origin.type("New York", delay=100)
-            page.wait_for_timeout(1000)
+            session.sleep(1000)
             page.keyboard.press("Enter")
             logger.log_step("Set Origin", "input", selector, 1, "", (time.time()-start)*1000)
         except Exception as e:
             logger.log_step("Set Origin", "input", selector, 0, str(e), (time.time()-start)*1000)
 
         # STEP 4: Destination
+        session.step("Set Destination")
         start = time.time()
         selector = "input[name*='destinationCode']"
         try:
@@ -76,38 +68,34 @@ def test_lufthansa_ml(playwright: Playwright) -> None:
             page.keyboard.press("Control+A")
             page.keyboard.press("Backspace")
             dest.type("Berlin", delay=100)
-            page.wait_for_timeout(1000)
+            session.sleep(1000)
             page.keyboard.press("Enter")
             logger.log_step("Set Destination", "input", selector, 1, "", (time.time()-start)*1000)
         except Exception as e:
             logger.log_step("Set Destination", "input", selector, 0, str(e), (time.time()-start)*1000)
 
         # STEP 5: Dates (The problematic part - good for ML to learn!)
+        session.step("Select Dates")
         start = time.time()
         selector = "input[name*='travelDatetime']"
+        home_page = HomePage(page, overlay_suppressor=session.overlays,
+                             reduced_motion=session.profile.reduced_motion,
+                             wait_ledger=session.wait_ledger,
+                             strategy_cache=StrategyCache("selector_strategy_cache.json"))
         try:
-            # Try JS injection first (Success path)
-            page.evaluate("""
-                () => {
-                    const inputs = document.querySelectorAll('input[name*="travelDatetime"]');
-                    if (inputs.length >= 2) {
-                        inputs[0].value = '12/15/2025';
-                        inputs[0].dispatchEvent(new Event('input', { bubbles: true }));
-                        inputs[1].value = '12/25/2025';
-                        inputs[1].dispatchEvent(new Event('input', { bubbles: true }));
-                    }
-                }
-            """)
-            # Try clicking calendar (Potential failure path)
-            page.locator(selector).first.click(force=True)
-            page.wait_for_timeout(1000)
-            
-            # Log this complex step
-            logger.log_step("Select Dates", "complex_interaction", selector, 1, "", (time.time()-start)*1000)
+            # Direct entry, calendar or JS injection - log whichever set the dates
+            home_page.select_dates("12/15/2025", "12/25/2025")
+            home_page.save_caches()
+            strategy = home_page.last_strategies.get("date_entry") or \
+                home_page.last_strategies.get("calendar_day", "")
+            logger.log_step("Select Dates", "complex_interaction", selector, 1, "", (time.time()-start)*1000,
+                            strategy=strategy)
         except Exception as e:
-            logger.log_step("Select Dates", "complex_interaction", selector, 0, str(e), (time.time()-start)*1000)
+            logger.log_step("Select Dates", "complex_interaction", selector, 0, str(e), (time.time()-start)*1000,
+                            strategy=home_page.last_strategies.get("calendar_day", ""))
 
         # STEP 6: Search
+        session.step("Click Search")
         start = time.time()
         selector = "button:has-text('Search flights')"
         try:
@@ -117,21 +105,25 @@ def test_lufthansa_ml(playwright: Playwright) -> None:
             logger.log_step("Click Search", "click", selector, 0, str(e), (time.time()-start)*1000)
 
         # STEP 7: Results
+        session.step("Wait for Results")
         start = time.time()
         selector = "div[class*='price']"
         try:
-            page.wait_for_selector(selector, timeout=10000)
+            session.wait_for_selector(selector, timeout=10000)
             logger.log_step("Wait for Results", "wait", selector, 1, "", (time.time()-start)*1000)
         except Exception as e:
             # This is where we expect failures if dates weren't set right
             logger.log_step("Wait for Results", "wait", selector, 0, "Timeout waiting for price elements", (time.time()-start)*1000)
+            session.mark_failed("Timeout waiting for price elements")
 
     except Exception as e:
+        session.mark_failed(e)
         print(f"Test failed: {e}")
     finally:
-        context.close()
-        browser.close()
+        logger.log_waits(session.wait_ledger)
+        session.close()
 
 if __name__ == "__main__":
+    parse_cli()
     with sync_playwright() as playwright:
         test_lufthansa_ml(playwright)
@@ -0,0 +1,179 @@
+"""
+Step Tracing
+Nested spans around HomePage actions and their helpers, exported as Chrome
+trace-event JSON for chrome://tracing or https://ui.perfetto.dev.
+
+    select_dates
+    └─ _pick_dates_from_calendar
+       └─ _select_date_from_calendar
+          ├─ _navigate_to_month ─ wait.dom_condition
+          └─ _click_calendar_day ─ wait.value_changed
+
+Spans carry attributes such as selector, strategy and wait_type. Tracing is
+off unless a Tracer is passed to HomePage; @traced then costs one lookup.
+
+Example:
+    tracer = Tracer()
+    HomePage(page, tracer=tracer).open().search_flight(...)
+    tracer.export_chrome("search_trace.json")
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+import inspect
+import json
+import os
+import threading
+import time
+
+_current_tracer: ContextVar[Optional['Tracer']] = ContextVar("current_tracer", default=None)
+_current_span: ContextVar[Optional['Span']] = ContextVar("current_span", default=None)
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+class Span:
+    """One timed operation. Times are microseconds on the tracer's clock."""
+
+    def __init__(self, name: str, start_us: float, parent: Optional['Span'] = None,
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.start_us = start_us
+        self.end_us: Optional[float] = None
+        self.parent = parent
+        self.attributes: Dict[str, Any] = {}
+        self.thread_id = threading.get_ident()
+        for key, value in (attributes or {}).items():
+            self.set_attribute(key, value)
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_us or self.start_us) - self.start_us) / 1000
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value if isinstance(value, _SCALARS) else str(value)
+
+
+class Tracer:
+    """Collects spans for one or more searches."""
+
+    def __init__(self, name: str = "search"):
+        self.name = name
+        self.spans: List[Span] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def _now_us(self) -> float:
+        return (time.perf_counter() - self._origin) * 1_000_000
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span]:
+        """Open a child of the current span; errors are recorded and re-raised."""
+        span = Span(name, self._now_us(), _current_span.get(), attributes)
+        tracer_token = _current_tracer.set(self)
+        span_token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set_attribute("error", f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            span.end_us = self._now_us()
+            _current_span.reset(span_token)
+            _current_tracer.reset(tracer_token)
+            with self._lock:
+                self.spans.append(span)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.spans = []
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Count and total/self milliseconds per span name."""
+        child_ms: Dict[int, float] = {}
+        for span in self.spans:
+            if span.parent is not None:
+                child_ms[id(span.parent)] = child_ms.get(id(span.parent), 0.0) + span.duration_ms
+        totals: Dict[str, Dict[str, float]] = {}
+        for span in self.spans:
+            entry = totals.setdefault(span.name, {"count": 0, "total_ms": 0.0, "self_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] += span.duration_ms
+            entry["self_ms"] += span.duration_ms - child_ms.get(id(span), 0.0)
+        return totals
+
+    def to_chrome_events(self) -> List[Dict]:
+        pid = os.getpid()
+        thread_ids = {}
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": self.name}}]
+        for span in sorted(self.spans, key=lambda s: s.start_us):
+            tid = thread_ids.setdefault(span.thread_id, len(thread_ids) + 1)
+            events.append({
+                "name": span.name,
+                "cat": span.name.split('.')[0] if '.' in span.name else "home_page",
+                "ph": "X",
+                "ts": round(span.start_us, 1),
+                "dur": round((span.end_us or span.start_us) - span.start_us, 1),
+                "pid": pid,
+                "tid": tid,
+                "args": span.attributes,
+            })
+        return events
+
+    def export_chrome(self, filepath: str) -> str:
+        """Write the spans as Chrome trace-event JSON; returns the path."""
+        with open(filepath, "w") as f:
+            json.dump({"traceEvents": self.to_chrome_events(), "displayTimeUnit": "ms"}, f)
+        return filepath
+
+
+def current_tracer() -> Optional[Tracer]:
+    return _current_tracer.get()
+
+
+def set_attribute(key: str, value: Any) -> None:
+    """Set an attribute on the innermost open span, if tracing."""
+    span = _current_span.get()
+    if span is not None:
+        span.set_attribute(key, value)
+
+
+def traced(name: Optional[str] = None, args: Sequence[str] = (), record_result: bool = False,
+           **attributes) -> Callable:
+    """
+    Wrap a function or method in a span.
+
+    The tracer is self.tracer when the instance has one, otherwise the
+    tracer of the enclosing span; with neither, the call runs untraced.
+
+    Args:
+        name: Span name (default: the function name)
+        args: Call arguments to copy onto the span, e.g. ("selector", "timeout")
+        record_result: Store a scalar return value as the "result" attribute
+        **attributes: Static attributes, e.g. wait_type="element_visible"
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__name__
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*call_args, **call_kwargs):
+            owner = call_args[0] if call_args else None
+            tracer = getattr(owner, "tracer", None) or _current_tracer.get()
+            if not isinstance(tracer, Tracer):
+                return func(*call_args, **call_kwargs)
+
+            span_attributes = dict(attributes)
+            if args:
+                bound = signature.bind_partial(*call_args, **call_kwargs)
+                for arg in args:
+                    if arg in bound.arguments:
+                        span_attributes[arg] = bound.arguments[arg]
+            with tracer.span(span_name, **span_attributes) as span:
+                result = func(*call_args, **call_kwargs)
+                if record_result:
+                    span.set_attribute("result", result if isinstance(result, _SCALARS) else True)
+                return result
+        return wrapper
+    return decorator
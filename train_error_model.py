@@ -6,6 +6,7 @@ from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report
 import joblib
 import os
+from ml_logger import WAITS_ACTION_TYPE
 
 def generate_synthetic_data(n_samples=100):
     """Generate synthetic test history to bootstrap the model"""
@@ -54,7 +55,8 @@ def train_model():
     # Load real data if exists
     if os.path.exists("test_history.csv"):
         real_data = pd.read_csv("test_history.csv")
-        # Keep only relevant columns
+        # Keep only relevant columns; wait-accounting rows are summaries, not steps
+        real_data = real_data[real_data["action_type"] != WAITS_ACTION_TYPE]
         real_data = real_data[["step_name", "action_type", "selector", "status", "duration_ms"]]
     else:
         real_data = pd.DataFrame()
@@ -0,0 +1,197 @@
+"""
+Wait Accounting
+Measures where a run spends its time waiting, per step:
+
+- slept: fixed sleeps (wait_for_timeout), the full duration every time
+- met: condition waits that succeeded, time until the condition held
+- timed out: condition waits that ran into their ceiling, time lost
+
+ReadinessWaiter and OfferCapture waits are recorded with @accounted, fixed
+sleeps with WaitLedger.sleep(). Waits are attributed to the innermost
+active step: a HomePage action (@wait_step) or a step the caller opened
+with WaitLedger.step()/begin_step(). Nested waits (listbox_visible →
+element_visible) count once, at the outermost wait.
+
+Example:
+    ledger = WaitLedger()
+    HomePage(page, wait_ledger=ledger).open().search_flight(...)
+    print(ledger.format_summary())
+    TestLogger().log_waits(ledger)
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Dict, Iterator, List, Optional
+import inspect
+import time
+
+_current_ledger: ContextVar[Optional['WaitLedger']] = ContextVar("current_wait_ledger", default=None)
+_in_wait: ContextVar[bool] = ContextVar("in_wait", default=False)
+
+NO_STEP = "(no step)"
+
+
+class WaitLedger:
+    """Every recorded wait of one run, with per-step totals."""
+
+    def __init__(self, name: str = "run"):
+        self.name = name
+        self.current_step = NO_STEP
+        self.entries: List[Dict] = []
+
+    # ==================== STEPS ====================
+
+    @contextmanager
+    def step(self, name: str) -> Iterator['WaitLedger']:
+        """Attribute waits inside the block to name (and make this the active ledger)."""
+        previous = self.current_step
+        self.current_step = name
+        token = _current_ledger.set(self)
+        try:
+            yield self
+        finally:
+            _current_ledger.reset(token)
+            self.current_step = previous
+
+    def begin_step(self, name: str) -> None:
+        """Attribute waits to name until the next begin_step, for linear scripts."""
+        self.current_step = name
+
+    def activate(self) -> 'WaitLedger':
+        """Make this the ledger that waits outside any step() block report to."""
+        _current_ledger.set(self)
+        return self
+
+    # ==================== RECORDING ====================
+
+    def record(self, wait: str, kind: str, elapsed_ms: float, budget_ms: Optional[float] = None,
+               met: bool = True) -> Dict:
+        """
+        Args:
+            wait: What was waited for, e.g. "element_visible" or "sleep"
+            kind: "sleep" or "condition"
+            elapsed_ms: Time spent in the wait
+            budget_ms: The wait's timeout ceiling
+            met: False when a condition wait ran into its ceiling
+        """
+        entry = {"step": self.current_step, "wait": wait, "kind": kind,
+                 "elapsed_ms": elapsed_ms, "budget_ms": budget_ms, "met": met}
+        self.entries.append(entry)
+        return entry
+
+    def sleep(self, page, ms: int, wait: str = "sleep") -> None:
+        """page.wait_for_timeout(ms), recorded as slept time."""
+        start = time.perf_counter()
+        page.wait_for_timeout(ms)
+        self.record(wait, "sleep", (time.perf_counter() - start) * 1000, ms)
+
+    # ==================== REPORTING ====================
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """step -> waits, sleeps, timeouts, slept_ms, met_ms, timeout_ms, wasted_ms."""
+        steps: Dict[str, Dict[str, float]] = {}
+        for entry in self.entries:
+            totals = steps.setdefault(entry["step"], {
+                "waits": 0, "sleeps": 0, "timeouts": 0,
+                "slept_ms": 0.0, "met_ms": 0.0, "timeout_ms": 0.0, "wasted_ms": 0.0})
+            totals["waits"] += 1
+            if entry["kind"] == "sleep":
+                totals["sleeps"] += 1
+                totals["slept_ms"] += entry["elapsed_ms"]
+            elif entry["met"]:
+                totals["met_ms"] += entry["elapsed_ms"]
+            else:
+                totals["timeouts"] += 1
+                totals["timeout_ms"] += entry["elapsed_ms"]
+            totals["wasted_ms"] = totals["slept_ms"] + totals["timeout_ms"]
+        return steps
+
+    def totals(self) -> Dict[str, float]:
+        run: Dict[str, float] = {}
+        for totals in self.summary().values():
+            for key, value in totals.items():
+                run[key] = run.get(key, 0) + value
+        return run
+
+    def format_summary(self) -> str:
+        """Per-step table, most wasted time first."""
+        steps = self.summary()
+        lines = [f"WAIT ACCOUNTING {self.name}",
+                 f"{'Step':<28}{'waits':>6}{'slept ms':>11}{'met ms':>10}{'timeouts':>10}"
+                 f"{'lost ms':>10}"]
+        for step, t in sorted(steps.items(), key=lambda item: -item[1]["wasted_ms"]):
+            lines.append(f"{step[:27]:<28}{t['waits']:>6}{t['slept_ms']:>11.0f}{t['met_ms']:>10.0f}"
+                         f"{t['timeouts']:>10}{t['timeout_ms']:>10.0f}")
+        run = self.totals()
+        if run:
+            lines.append(f"{'Total':<28}{run['waits']:>6}{run['slept_ms']:>11.0f}{run['met_ms']:>10.0f}"
+                         f"{run['timeouts']:>10}{run['timeout_ms']:>10.0f}")
+            lines.append(f"Wasted (slept + timed out): {run['wasted_ms']:.0f} ms")
+        return "\n".join(lines)
+
+
+def current_ledger() -> Optional[WaitLedger]:
+    return _current_ledger.get()
+
+
+def _ledger_for(owner) -> Optional[WaitLedger]:
+    ledger = getattr(owner, "wait_ledger", None) or _current_ledger.get()
+    return ledger if isinstance(ledger, WaitLedger) else None
+
+
+def accounted(wait: str) -> Callable:
+    """
+    Record a timeout-bounded wait method in the active ledger.
+
+    The ceiling is the call's timeout argument (or the owner's default
+    through _timeout()); a falsy return value counts as timed out.
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*call_args, **call_kwargs):
+            owner = call_args[0] if call_args else None
+            ledger = _ledger_for(owner)
+            if ledger is None or _in_wait.get():
+                return func(*call_args, **call_kwargs)
+
+            bound = signature.bind(*call_args, **call_kwargs)
+            bound.apply_defaults()
+            budget = bound.arguments.get("timeout")
+            if budget is None and hasattr(owner, "_timeout"):
+                budget = owner._timeout(None)
+
+            token = _in_wait.set(True)
+            start = time.perf_counter()
+            result = None
+            try:
+                result = func(*call_args, **call_kwargs)
+                return result
+            finally:
+                _in_wait.reset(token)
+                ledger.record(wait, "condition", (time.perf_counter() - start) * 1000, budget,
+                              met=bool(result))
+        return wrapper
+    return decorator
+
+
+def wait_step(name: Optional[str] = None) -> Callable:
+    """
+    Attribute waits inside a method to a step named after it.
+
+    The ledger is self.wait_ledger when set, otherwise the active one; with
+    neither, the call runs unaccounted.
+    """
+    def decorator(func: Callable) -> Callable:
+        step_name = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*call_args, **call_kwargs):
+            ledger = _ledger_for(call_args[0] if call_args else None)
+            if ledger is None:
+                return func(*call_args, **call_kwargs)
+            with ledger.step(step_name):
+                return func(*call_args, **call_kwargs)
+        return wrapper
+    return decorator
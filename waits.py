@@ -0,0 +1,360 @@
+"""
+Readiness Waits
+Event-driven replacements for fixed sleeps in the page objects:
+- DOM conditions (arbitrary JavaScript predicates)
+- Network idle
+- Autocomplete listbox visible / hidden
+- Result container present
+- First of several outcome signals (results / no results / error banner)
+
+Every wait has a timeout ceiling and returns as soon as its condition holds.
+A wait that runs into its ceiling never raises; it logs and returns a falsy
+value so callers keep the soft-fail behaviour of the original sleeps.
+Sync waits are recorded in the active WaitLedger (wait_accounting.py).
+"""
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import TimeoutError as AsyncPlaywrightTimeoutError
+from typing import Dict, List, Optional
+from tracing import traced
+from wait_accounting import accounted
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Set by mark_existing() on elements that matched a signal before the action
+STALE_ATTRIBUTE = "data-lh-stale-signal"
+
+# Name of the first signal that holds, or null to keep polling. A signal has a
+# selector (null = the whole body), optional text it must contain, and
+# optionally must be visible and/or fresh (not marked by mark_existing()).
+FIRST_SIGNAL_JS = """
+    (signals) => {
+        const isVisible = (el) => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+        for (const signal of signals) {
+            const elements = signal.selector ? document.querySelectorAll(signal.selector) : [document.body];
+            for (const el of elements) {
+                if (!el || (signal.visible && !isVisible(el))) continue;
+                if (signal.fresh && el.hasAttribute('""" + STALE_ATTRIBUTE + """')) continue;
+                if (signal.text && !(el.innerText || '').toLowerCase().includes(signal.text.toLowerCase())) continue;
+                return signal.name;
+            }
+        }
+        return null;
+    }
+"""
+
+MARK_EXISTING_JS = """
+    ([signals, attribute]) => {
+        let marked = 0;
+        for (const signal of signals) {
+            if (!signal.fresh || !signal.selector) continue;
+            document.querySelectorAll(signal.selector).forEach(el => { el.setAttribute(attribute, ''); marked++; });
+        }
+        return marked;
+    }
+"""
+
+
+class ReadinessWaiter:
+    """
+    Condition-based waits bound to a single Playwright page.
+    """
+
+    def __init__(self, page: Page, default_timeout: int = 10000):
+        self.page = page
+        self.default_timeout = default_timeout
+
+    def _timeout(self, timeout: Optional[int]) -> int:
+        return self.default_timeout if timeout is None else timeout
+
+    @traced("wait.dom_condition", args=("description", "timeout"), record_result=True,
+            wait_type="dom_condition")
+    @accounted("dom_condition")
+    def dom_condition(self, expression: str, arg=None, timeout: Optional[int] = None,
+                      description: str = "DOM condition") -> bool:
+        """
+        Wait until a JavaScript predicate returns a truthy value.
+
+        Args:
+            expression: JavaScript function source, e.g. "() => document.readyState === 'complete'"
+            arg: Optional argument passed to the function
+            timeout: Ceiling in milliseconds
+
+        Returns:
+            True if the condition held before the ceiling, False otherwise
+        """
+        try:
+            self.page.wait_for_function(expression, arg=arg, timeout=self._timeout(timeout))
+            return True
+        except PlaywrightTimeoutError:
+            logger.debug(f"  {description} not met within {self._timeout(timeout)}ms")
+            return False
+
+    @traced("wait.element_visible", args=("selector", "timeout"), record_result=True,
+            wait_type="element_visible")
+    @accounted("element_visible")
+    def element_visible(self, selector: str, timeout: Optional[int] = None) -> bool:
+        """Wait until the first element matching selector is visible."""
+        try:
+            self.page.wait_for_selector(selector, state="visible", timeout=self._timeout(timeout))
+            return True
+        except PlaywrightTimeoutError:
+            logger.debug(f"  {selector} not visible within {self._timeout(timeout)}ms")
+            return False
+
+    @traced("wait.element_hidden", args=("selector", "timeout"), record_result=True,
+            wait_type="element_hidden")
+    @accounted("element_hidden")
+    def element_hidden(self, selector: str, timeout: Optional[int] = None) -> bool:
+        """Wait until no element matching selector is visible."""
+        try:
+            self.page.wait_for_selector(selector, state="hidden", timeout=self._timeout(timeout))
+            return True
+        except PlaywrightTimeoutError:
+            logger.debug(f"  {selector} still visible after {self._timeout(timeout)}ms")
+            return False
+
+    @traced("wait.network_idle", args=("timeout",), record_result=True, wait_type="network_idle")
+    @accounted("network_idle")
+    def network_idle(self, timeout: Optional[int] = None) -> bool:
+        """
+        Wait until there are no network connections for at least 500 ms.
+
+        Analytics beacons can keep the network busy indefinitely, so keep
+        the ceiling short and treat a timeout as "good enough".
+        """
+        try:
+            self.page.wait_for_load_state("networkidle", timeout=self._timeout(timeout))
+            return True
+        except PlaywrightTimeoutError:
+            logger.debug(f"  Network not idle within {self._timeout(timeout)}ms")
+            return False
+
+    @traced("wait.listbox_visible", args=("option_selector", "text", "timeout"), record_result=True,
+            wait_type="listbox_visible")
+    @accounted("listbox_visible")
+    def listbox_visible(self, option_selector: str, text: Optional[str] = None,
+                        timeout: Optional[int] = None) -> bool:
+        """
+        Wait for an autocomplete listbox to show options.
+
+        Args:
+            option_selector: Selector for a single option, e.g. "div[role='option']"
+            text: Optional text the option must contain (e.g. an airport code)
+            timeout: Ceiling in milliseconds
+
+        Returns:
+            True if a matching option became visible
+        """
+        selector = f"{option_selector}:has-text('{text}')" if text else option_selector
+        return self.element_visible(selector, timeout)
+
+    @traced("wait.listbox_hidden", args=("option_selector", "timeout"), record_result=True,
+            wait_type="listbox_hidden")
+    @accounted("listbox_hidden")
+    def listbox_hidden(self, option_selector: str, timeout: Optional[int] = None) -> bool:
+        """Wait for an autocomplete listbox to close after a selection."""
+        return self.element_hidden(option_selector, timeout)
+
+    @traced("wait.result_container", args=("timeout",), record_result=True,
+            wait_type="result_container")
+    @accounted("result_container")
+    def result_container(self, selectors: List[str], timeout: Optional[int] = None) -> Optional[str]:
+        """
+        Wait until any of the result container selectors is attached.
+
+        Args:
+            selectors: Candidate selectors for the results page
+            timeout: Ceiling in milliseconds
+
+        Returns:
+            The first selector that matched, or None on timeout
+        """
+        try:
+            self.page.wait_for_selector(", ".join(selectors), state="attached",
+                                        timeout=self._timeout(timeout))
+        except PlaywrightTimeoutError:
+            logger.debug(f"  No result container within {self._timeout(timeout)}ms")
+            return None
+
+        for selector in selectors:
+            if self.page.query_selector(selector):
+                return selector
+        return selectors[0]
+
+    def mark_existing(self, signals: List[Dict]) -> int:
+        """
+        Mark the elements that already match the fresh signals, so a later
+        first_signal() only counts elements that appear after the action
+        (e.g. results rendered by this search, not form containers or the
+        previous search's rows).
+
+        Returns:
+            Number of elements marked
+        """
+        try:
+            return self.page.evaluate(MARK_EXISTING_JS, [signals, STALE_ATTRIBUTE])
+        except Exception:
+            logger.debug("  Could not mark existing signal elements")
+            return 0
+
+    @traced("wait.first_signal", args=("timeout",), record_result=True, wait_type="first_signal")
+    @accounted("first_signal")
+    def first_signal(self, signals: List[Dict], timeout: Optional[int] = None,
+                     polling: int = 100) -> Optional[str]:
+        """
+        Race several page outcomes in one wait and report which came first.
+
+        Args:
+            signals: Dicts with name, selector (None = page body), optional
+                text and visible; earlier signals win ties
+            timeout: Ceiling in milliseconds
+            polling: Poll interval in milliseconds (text checks read innerText)
+
+        Returns:
+            Name of the winning signal, or None on timeout
+        """
+        try:
+            handle = self.page.wait_for_function(FIRST_SIGNAL_JS, arg=signals, polling=polling,
+                                                 timeout=self._timeout(timeout))
+            return handle.json_value()
+        except PlaywrightTimeoutError:
+            logger.debug(f"  No outcome signal within {self._timeout(timeout)}ms")
+            return None
+
+    @traced("wait.value_changed", args=("selector", "timeout"), record_result=True,
+            wait_type="value_changed")
+    @accounted("value_changed")
+    def value_changed(self, selector: str, previous: List[str],
+                      timeout: Optional[int] = None) -> bool:
+        """
+        Wait until the values of the inputs matching selector differ from previous.
+
+        Args:
+            selector: Input selector, e.g. the travel date inputs
+            previous: Values captured with input_values() before the action
+            timeout: Ceiling in milliseconds
+        """
+        return self.dom_condition(
+            """
+            ([selector, previous]) => {
+                const values = Array.from(document.querySelectorAll(selector)).map(i => i.value);
+                return values.some((v, i) => v !== previous[i]);
+            }
+            """,
+            arg=[selector, previous],
+            timeout=timeout,
+            description=f"value change on {selector}",
+        )
+
+    def input_values(self, selector: str) -> List[str]:
+        """Read the current values of all inputs matching selector in one round trip."""
+        return self.page.evaluate(
+            "(selector) => Array.from(document.querySelectorAll(selector)).map(i => i.value)",
+            selector,
+        )
+
+
+class AsyncReadinessWaiter:
+    """
+    Async counterpart of ReadinessWaiter for playwright.async_api pages.
+    Same predicates, same ceilings, same soft-fail return values.
+    """
+
+    def __init__(self, page, default_timeout: int = 10000):
+        self.page = page
+        self.default_timeout = default_timeout
+
+    def _timeout(self, timeout: Optional[int]) -> int:
+        return self.default_timeout if timeout is None else timeout
+
+    async def dom_condition(self, expression: str, arg=None, timeout: Optional[int] = None,
+                            description: str = "DOM condition") -> bool:
+        try:
+            await self.page.wait_for_function(expression, arg=arg, timeout=self._timeout(timeout))
+            return True
+        except AsyncPlaywrightTimeoutError:
+            logger.debug(f"  {description} not met within {self._timeout(timeout)}ms")
+            return False
+
+    async def element_visible(self, selector: str, timeout: Optional[int] = None) -> bool:
+        try:
+            await self.page.wait_for_selector(selector, state="visible", timeout=self._timeout(timeout))
+            return True
+        except AsyncPlaywrightTimeoutError:
+            logger.debug(f"  {selector} not visible within {self._timeout(timeout)}ms")
+            return False
+
+    async def element_hidden(self, selector: str, timeout: Optional[int] = None) -> bool:
+        try:
+            await self.page.wait_for_selector(selector, state="hidden", timeout=self._timeout(timeout))
+            return True
+        except AsyncPlaywrightTimeoutError:
+            logger.debug(f"  {selector} still visible after {self._timeout(timeout)}ms")
+            return False
+
+    async def network_idle(self, timeout: Optional[int] = None) -> bool:
+        try:
+            await self.page.wait_for_load_state("networkidle", timeout=self._timeout(timeout))
+            return True
+        except AsyncPlaywrightTimeoutError:
+            logger.debug(f"  Network not idle within {self._timeout(timeout)}ms")
+            return False
+
+    async def listbox_visible(self, option_selector: str, text: Optional[str] = None,
+                              timeout: Optional[int] = None) -> bool:
+        selector = f"{option_selector}:has-text('{text}')" if text else option_selector
+        return await self.element_visible(selector, timeout)
+
+    async def listbox_hidden(self, option_selector: str, timeout: Optional[int] = None) -> bool:
+        return await self.element_hidden(option_selector, timeout)
+
+    async def result_container(self, selectors: List[str], timeout: Optional[int] = None) -> Optional[str]:
+        try:
+            await self.page.wait_for_selector(", ".join(selectors), state="attached",
+                                              timeout=self._timeout(timeout))
+        except AsyncPlaywrightTimeoutError:
+            logger.debug(f"  No result container within {self._timeout(timeout)}ms")
+            return None
+
+        for selector in selectors:
+            if await self.page.query_selector(selector):
+                return selector
+        return selectors[0]
+
+    async def mark_existing(self, signals: List[Dict]) -> int:
+        try:
+            return await self.page.evaluate(MARK_EXISTING_JS, [signals, STALE_ATTRIBUTE])
+        except Exception:
+            logger.debug("  Could not mark existing signal elements")
+            return 0
+
+    async def first_signal(self, signals: List[Dict], timeout: Optional[int] = None,
+                           polling: int = 100) -> Optional[str]:
+        try:
+            handle = await self.page.wait_for_function(FIRST_SIGNAL_JS, arg=signals, polling=polling,
+                                                       timeout=self._timeout(timeout))
+            return await handle.json_value()
+        except AsyncPlaywrightTimeoutError:
+            logger.debug(f"  No outcome signal within {self._timeout(timeout)}ms")
+            return None
+
+    async def value_changed(self, selector: str, previous: List[str],
+                            timeout: Optional[int] = None) -> bool:
+        return await self.dom_condition(
+            """
+            ([selector, previous]) => {
+                const values = Array.from(document.querySelectorAll(selector)).map(i => i.value);
+                return values.some((v, i) => v !== previous[i]);
+            }
+            """,
+            arg=[selector, previous],
+            timeout=timeout,
+            description=f"value change on {selector}",
+        )
+
+    async def input_values(self, selector: str) -> List[str]:
+        return await self.page.evaluate(
+            "(selector) => Array.from(document.querySelectorAll(selector)).map(i => i.value)",
+            selector,
+        )